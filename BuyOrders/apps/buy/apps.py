@@ -15,4 +15,5 @@ class BuyConfig(AppConfig):
 
         if getattr(settings, 'ELASTICSEARCH_STATUS', False):
             create_index_production_order_document()
-            # from apps.buy.elasticsearch.signals import *
+            # Register the indexed documents with the Elasticsearch outbox
+            import apps.buy.elasticsearch.signals  # noqa: F401
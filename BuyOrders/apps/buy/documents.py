@@ -42,4 +42,10 @@ class ProductionOrder(mongo.Document):
 
     price = mongo.EmbeddedDocumentField(Price)
 
-    meta = {'collection': 'production_order'}
+    meta = {
+        'collection': 'production_order',
+        'indexes': [
+            {'fields': ['status', '-create.date', '-id'], 'name': 'status_create_date_desc'},
+            {'fields': ['-create.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
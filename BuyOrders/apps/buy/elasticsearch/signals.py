@@ -1,19 +1,17 @@
 # apps/production_order/signals.py
 
-from mongoengine import signals
 from apps.buy.documents import ProductionOrder
-from apps.buy.elasticsearch.utils import index_product_order, delete_product_order
+from apps.buy.elasticsearch.utils import (
+    build_product_order_document,
+)
 from apps.buy.serializer import ProductionOrderSerializer
+from utils.elasticsearch_outbox import register_indexers
 
 
-@signals.post_save.connect
-def index_production_order_on_save(sender, document, **kwargs):
-    if isinstance(document, ProductionOrder):
-        data = ProductionOrderSerializer(document).data
-        index_product_order(data)
+# Serializer, index name and document builder of every indexed document.
+# Writes of these documents are queued in the Elasticsearch outbox and indexed in bulk by its drainer.
+INDEXERS = {
+    ProductionOrder: (ProductionOrderSerializer, 'production_order', build_product_order_document),
+}
 
-
-@signals.post_delete.connect
-def delete_production_order_on_delete(sender, document, **kwargs):
-    if isinstance(document, ProductionOrder):
-        delete_product_order(str(document.id))
+register_indexers(INDEXERS)
@@ -18,15 +18,13 @@ def create_index_production_order_document():
     )
 
 
-def index_product_order(validated_data: dict):
+def build_product_order_document(validated_data: dict) -> dict:
     """
-    index data to elasticsearch_api
+    build elasticsearch_api document from serializer data
 
     Args:
         validated_data: product orders object serializer data
     """
-    es = settings.ELASTICSEARCH_CONNECTION
-
     try:
         car_postfix_number = validated_data['car']['car']['postfix_number']
         car_prefix_number = validated_data['car']['car']['prefix_number']
@@ -57,18 +55,27 @@ def index_product_order(validated_data: dict):
     except:
         product_owner = 'unknown'
 
-    es.index(
+    return {
+        'car': car,
+        'driver': driver,
+        'agriculture': agriculture,
+        'product': product,
+        'product_owner': product_owner,
+    }
 
+
+def index_product_order(validated_data: dict):
+    """
+    index data to elasticsearch_api
+
+    Args:
+        validated_data: product orders object serializer data
+    """
+    es = settings.ELASTICSEARCH_CONNECTION
+    es.index(
         index='production_order',
         id=str(validated_data['id']),
-        document={
-            'car': car,
-            'driver': driver,
-            'agriculture': agriculture,
-            'product': product,
-            'product_owner': product_owner,
-        }
-
+        document=build_product_order_document(validated_data)
     )
 
 
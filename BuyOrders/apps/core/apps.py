@@ -10,3 +10,12 @@ class CoreConfig(AppConfig):
     def ready(self):
         mongo_settings = settings.MONGODB_SETTINGS
         connect(**mongo_settings)
+
+        # Compile the filter schema of every document once, before the first request
+        from utils.CustomAPIView.filter_schema import compile_filter_schemas
+        compile_filter_schemas()
+
+        # Create the indexes declared in each document's meta (idempotent)
+        if getattr(settings, 'MONGO_ENSURE_INDEXES', True):
+            from utils.mongo_indexes import ensure_mongo_indexes
+            ensure_mongo_indexes(timeout=getattr(settings, 'MONGO_ENSURE_INDEXES_TIMEOUT', 5.0))
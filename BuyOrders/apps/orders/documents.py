@@ -27,6 +27,12 @@ class BankAccount(mongo.Document):
     owner_name = mongo.StringField(default='')
     account_number = mongo.StringField(default='')
 
+    meta = {
+        'indexes': [
+            {'fields': ['account_number', 'id'], 'name': 'account_number'},
+        ],
+    }
+
 
 # Document for Seller
 class Seller(mongo.Document):
@@ -74,7 +80,13 @@ class PurchaseOrder(mongo.Document):
 
     have_factor = mongo.BooleanField(default=False)
 
-    meta = {'collection': 'purchase_order'}
+    meta = {
+        'collection': 'purchase_order',
+        'indexes': [
+            {'fields': ['status', '-created_at.date', '-id'], 'name': 'status_create_date_desc'},
+            {'fields': ['-created_at.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
 
 
 # Document for Invoice
@@ -91,7 +103,13 @@ class Invoice(mongo.Document):
 
     product_list = mongo.ListField(mongo.ReferenceField(PurchaseOrder, required=False))
 
-    meta = {'collection': 'invoice'}
+    meta = {
+        'collection': 'invoice',
+        'indexes': [
+            {'fields': ['-created_at.date', '-id'], 'name': 'create_date_desc'},
+            {'fields': ['seller'], 'name': 'seller'},
+        ],
+    }
 
 
 # Document for Payment
@@ -108,6 +126,12 @@ class Payment(mongo.Document):
 
     invoice = mongo.ReferenceField(Invoice, required=False)
 
-    meta = {'collection': 'payment'}
+    meta = {
+        'collection': 'payment',
+        'indexes': [
+            {'fields': ['created_at.date', 'id'], 'name': 'create_date_asc'},
+            {'fields': ['invoice'], 'name': 'invoice'},
+        ],
+    }
 
 
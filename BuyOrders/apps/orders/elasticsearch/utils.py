@@ -17,9 +17,7 @@ def create_index_production_order_document():
     )
 
 
-def index_production_order(validated_data: dict):
-    es = settings.ELASTICSEARCH_CONNECTION
-
+def build_production_order_document(validated_data: dict) -> dict:
     try:
         car = f"{validated_data['car']['car']['prefix_number']}{validated_data['car']['car']['alphabet']}{validated_data['car']['car']['postfix_number']}-{validated_data['car']['car']['city_code']}"
     except Exception:
@@ -45,16 +43,21 @@ def index_production_order(validated_data: dict):
     except:
         product_owner = 'unknown'
 
+    return {
+        'car': car,
+        'driver': driver,
+        'agriculture': agriculture,
+        'product': product,
+        'product_owner': product_owner,
+    }
+
+
+def index_production_order(validated_data: dict):
+    es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='production_order',
         id=str(validated_data['id']),
-        document={
-            'car': car,
-            'driver': driver,
-            'agriculture': agriculture,
-            'product': product,
-            'product_owner': product_owner,
-        }
+        document=build_production_order_document(validated_data)
     )
 
 
@@ -89,15 +92,19 @@ def create_index_bank_account():
     )
 
 
+def build_bank_account_document(data: dict) -> dict:
+    return {
+        'owner_name': data.get('owner_name', ''),
+        'account_number': data.get('account_number', ''),
+    }
+
+
 def index_bank_account(data: dict):
     es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='bank_account',
         id=data['id'],
-        document={
-            'owner_name': data.get('owner_name', ''),
-            'account_number': data.get('account_number', ''),
-        }
+        document=build_bank_account_document(data)
     )
 
 
@@ -119,15 +126,19 @@ def create_index_seller():
     )
 
 
+def build_seller_document(data: dict) -> dict:
+    return {
+        'name': data.get('name', ''),
+        'bank_account': data.get('bank_account', ''),
+    }
+
+
 def index_seller(data: dict):
     es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='seller',
         id=data['id'],
-        document={
-            'name': data.get('name', ''),
-            'bank_account': data.get('bank_account', ''),
-        }
+        document=build_seller_document(data)
     )
 
 
@@ -150,16 +161,20 @@ def create_index_product_information():
     )
 
 
+def build_product_information_document(data: dict) -> dict:
+    return {
+        'product_name': data.get('product_name', ''),
+        'quantity': data.get('quantity', 0),
+        'unit': data.get('unit', ''),
+    }
+
+
 def index_product_information(data: dict):
     es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='product_information',
         id=data['id'],
-        document={
-            'product_name': data.get('product_name', ''),
-            'quantity': data.get('quantity', 0),
-            'unit': data.get('unit', ''),
-        }
+        document=build_product_information_document(data)
     )
 
 
@@ -183,19 +198,23 @@ def create_index_purchase_order():
     )
 
 
-def index_purchase_order(data: dict):
-    es = settings.ELASTICSEARCH_CONNECTION
+def build_purchase_order_document(data: dict) -> dict:
     product_name = data.get('product', {}).get('product_name', 'unknown')
 
+    return {
+        'status': data.get('status', ''),
+        'product_name': product_name,
+        'estimated_price': data.get('estimated_price', 0),
+        'final_price': data.get('final_price', 0),
+    }
+
+
+def index_purchase_order(data: dict):
+    es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='purchase_order',
         id=data['id'],
-        document={
-            'status': data.get('status', ''),
-            'product_name': product_name,
-            'estimated_price': data.get('estimated_price', 0),
-            'final_price': data.get('final_price', 0),
-        }
+        document=build_purchase_order_document(data)
     )
 
 
@@ -219,17 +238,21 @@ def create_index_invoice():
     )
 
 
+def build_invoice_document(data: dict) -> dict:
+    return {
+        'invoice_number': data.get('invoice_number', ''),
+        'title': data.get('title', ''),
+        'description': data.get('description', ''),
+        'seller': data.get('seller', {}).get('name', 'unknown'),
+    }
+
+
 def index_invoice(data: dict):
     es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='invoice',
         id=data['id'],
-        document={
-            'invoice_number': data.get('invoice_number', ''),
-            'title': data.get('title', ''),
-            'description': data.get('description', ''),
-            'seller': data.get('seller', {}).get('name', 'unknown'),
-        }
+        document=build_invoice_document(data)
     )
 
 
@@ -253,17 +276,21 @@ def create_index_payment():
     )
 
 
+def build_payment_document(data: dict) -> dict:
+    return {
+        'amount': data.get('amount', 0),
+        'payment_type': data.get('payment_type', ''),
+        'from_account': data.get('from_account', {}).get('account_number', 'unknown'),
+        'to_account': data.get('to_account', {}).get('account_number', 'unknown'),
+    }
+
+
 def index_payment(data: dict):
     es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='payment',
         id=data['id'],
-        document={
-            'amount': data.get('amount', 0),
-            'payment_type': data.get('payment_type', ''),
-            'from_account': data.get('from_account', {}).get('account_number', 'unknown'),
-            'to_account': data.get('to_account', {}).get('account_number', 'unknown'),
-        }
+        document=build_payment_document(data)
     )
 
 
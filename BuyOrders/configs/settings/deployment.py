@@ -61,7 +61,9 @@ CELERY_ACCEPT_CONTENT = ["json"]
 
 LOG_SERVER_ENDPOINT = os.getenv("LOG_SERVER_ENDPOINT", LOG_SERVER.get("endpoint_url"))
 if LOG_SERVER_ENDPOINT:
-    LOG_SERVER = {"endpoint_url": LOG_SERVER_ENDPOINT}
+    LOG_SERVER = {**LOG_SERVER, "endpoint_url": LOG_SERVER_ENDPOINT}
+LOG_SERVER["bulk_endpoint_url"] = os.getenv("LOG_SERVER_BULK_ENDPOINT", LOG_SERVER.get("bulk_endpoint_url"))
+LOG_SERVER["query_endpoint_url"] = os.getenv("LOG_SERVER_QUERY_ENDPOINT", LOG_SERVER.get("query_endpoint_url"))
 STORE_LOGS = env_bool("STORE_LOGS", STORE_LOGS)
 
 HEALTHCHECK_URL = os.getenv("HEALTHCHECK_URL", "/health/")
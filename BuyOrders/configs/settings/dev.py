@@ -70,6 +70,8 @@ JWT_PUBLIC_KEY = env("JWT_PUBLIC_KEY")
 if not JWT_PUBLIC_KEY and JWT_PUBLIC_KEY_PATH and Path(JWT_PUBLIC_KEY_PATH).exists():
     with open(JWT_PUBLIC_KEY_PATH, "rb") as f:
         JWT_PUBLIC_KEY = f.read()
+JWT_KEY_RELOAD_INTERVAL = float(env("JWT_KEY_RELOAD_INTERVAL", "5"))
+JWT_VERIFIED_TOKEN_CACHE_SIZE = int(env("JWT_VERIFIED_TOKEN_CACHE_SIZE", "10000"))
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=int(env("JWT_ACCESS_HOURS", "1"))),
@@ -82,6 +84,15 @@ SIMPLE_JWT = {
 
 MONGODB_URI = env("MONGODB_URI", "mongodb://localhost:27017/SlaughterERP_BuyOrders")
 MONGODB_SETTINGS = {"db": env("MONGODB_DB", "SlaughterERP_BuyOrders"), "host": MONGODB_URI}
+ID_BLOCK_SIZE = int(env("ID_BLOCK_SIZE", "50"))
+BULK_INSERT_CHUNK_SIZE = int(env("BULK_INSERT_CHUNK_SIZE", "500"))
+PAGINATION_MAX_LIMIT = int(env("PAGINATION_MAX_LIMIT", "1000"))
+PAGINATION_COUNT_LIMIT = int(env("PAGINATION_COUNT_LIMIT", "10000"))
+STREAM_BATCH_SIZE = int(env("STREAM_BATCH_SIZE", "500"))
+RESULT_CACHE_ENABLED = env("RESULT_CACHE_ENABLED", "True").lower() in ("1", "true", "yes")
+RESULT_CACHE_TIMEOUT = int(env("RESULT_CACHE_TIMEOUT", "300"))
+MONGO_ENSURE_INDEXES = env("MONGO_ENSURE_INDEXES", "True").lower() in ("1", "true", "yes")  # create meta indexes at startup
+MONGO_ENSURE_INDEXES_TIMEOUT = float(env("MONGO_ENSURE_INDEXES_TIMEOUT", "5"))  # seconds per collection
 
 raw_micro = env("MICROSERVICE_URLS", "")
 MICROSERVICE_URL = {}
@@ -114,6 +125,20 @@ if raw_microcfg:
                     creds[kk.strip()] = vv.strip()
             MICROSERVICE_CONFIGS[k.strip()] = creds
 MICROSERVICE_CONFIGS.setdefault("SlaughterERP", {"username": env("MS_SLaughterERP_USERNAME", "service_buy_orders"), "password": env("MS_SLaughterERP_PASSWORD", "12345")})
+MICROSERVICE_FETCH_WORKERS = int(env("MICROSERVICE_FETCH_WORKERS", "8"))
+MICROSERVICE_HTTP = {
+    "POOL_SIZE": int(env("MICROSERVICE_HTTP_POOL_SIZE", "20")),
+    "CONNECT_TIMEOUT": float(env("MICROSERVICE_HTTP_CONNECT_TIMEOUT", "3")),
+    "READ_TIMEOUT": float(env("MICROSERVICE_HTTP_READ_TIMEOUT", "10")),
+    "MAX_RETRIES": int(env("MICROSERVICE_HTTP_MAX_RETRIES", "2")),
+    "BACKOFF_FACTOR": float(env("MICROSERVICE_HTTP_BACKOFF_FACTOR", "0.2")),
+    "CIRCUIT_FAILURE_THRESHOLD": int(env("MICROSERVICE_HTTP_CIRCUIT_FAILURE_THRESHOLD", "5")),
+    "CIRCUIT_RESET_TIMEOUT": float(env("MICROSERVICE_HTTP_CIRCUIT_RESET_TIMEOUT", "30")),
+}
+SERVICE_TOKEN = {
+    "REFRESH_MARGIN": float(env("SERVICE_TOKEN_REFRESH_MARGIN", "60")),
+    "LOCK_TIMEOUT": float(env("SERVICE_TOKEN_LOCK_TIMEOUT", "10")),
+}
 
 REDIS_URL = env("REDIS_URL", "redis://127.0.0.1:6379/1")
 CACHES = {"default": {"BACKEND": env("DJANGO_CACHE_BACKEND", "django_redis.cache.RedisCache"), "LOCATION": REDIS_URL, "OPTIONS": {"CLIENT_CLASS": env("DJANGO_REDIS_CLIENT_CLASS", "django_redis.client.DefaultClient")}}}
@@ -123,20 +148,44 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_USE = env("CELERY_USE", "False").lower() in ("1", "true", "yes")
 
-LOG_SERVER = {"endpoint_url": env("LOG_SERVER_ENDPOINT", "http://127.0.0.1:8010/api/v1/logs/c/")}
+LOG_SERVER = {
+    "endpoint_url": env("LOG_SERVER_ENDPOINT", "http://127.0.0.1:8010/api/v1/logs/c/"),
+    "bulk_endpoint_url": env("LOG_SERVER_BULK_ENDPOINT", "http://127.0.0.1:8010/api/v1/logs/ingest/"),
+    "query_endpoint_url": env("LOG_SERVER_QUERY_ENDPOINT", "http://127.0.0.1:8010/api/v1/logs/"),
+}
+LOG_SHIPPER = {
+    "CAPACITY": int(env("LOG_SHIPPER_CAPACITY", "10000")),
+    "BATCH_SIZE": int(env("LOG_SHIPPER_BATCH_SIZE", "200")),
+    "FLUSH_INTERVAL": float(env("LOG_SHIPPER_FLUSH_INTERVAL", "2")),
+    "HIGH_WATERMARK": float(env("LOG_SHIPPER_HIGH_WATERMARK", "0.8")),
+    "SAMPLE_RATE": float(env("LOG_SHIPPER_SAMPLE_RATE", "0.1")),
+}
 STORE_LOGS = env("STORE_LOGS", "False").lower() in ("1", "true", "yes")
+REQUEST_TIMING = {
+    "ENABLED": env("REQUEST_TIMING_ENABLED", "True").lower() in ("1", "true", "yes"),
+    "SERVER_TIMING": env("REQUEST_TIMING_SERVER_TIMING", "admin"),  # always, admin (DEBUG or admin role) or off
+}
+SERVICE_NAME = env("SERVICE_NAME", "buy_orders")  # service label of shipped request logs
 
 warnings.filterwarnings("ignore", category=InsecureRequestWarning)
 es_hosts = [h.strip() for h in env("ELASTICSEARCH_HOSTS", "https://localhost:9200").split(",") if h.strip()]
 es_user = env("ELASTICSEARCH_USER", "elastic")
 es_password = env("ELASTICSEARCH_PASSWORD", "")
 es_verify = env("ELASTICSEARCH_VERIFY_CERTS", "False").lower() in ("1", "true", "yes")
+ELASTICSEARCH_PIT_KEEP_ALIVE = env("ELASTICSEARCH_PIT_KEEP_ALIVE", "1m")
+ELASTICSEARCH_SEARCH_LIMIT = int(env("ELASTICSEARCH_SEARCH_LIMIT", "100"))
 
 ELASTICSEARCH_STATUS = env('ELASTICSEARCH_STATUS', 'False') == 'True'
 if ELASTICSEARCH_STATUS:
     from elasticsearch import Elasticsearch
     ELASTICSEARCH_CONNECTION = Elasticsearch(es_hosts, basic_auth=(es_user, es_password) if es_user and es_password else None, verify_certs=es_verify)
 
+ELASTICSEARCH_OUTBOX = {
+    "DRAINER": env("ELASTICSEARCH_OUTBOX_DRAINER", "thread"),
+    "BATCH_SIZE": int(env("ELASTICSEARCH_OUTBOX_BATCH_SIZE", "500")),
+    "POLL_INTERVAL": float(env("ELASTICSEARCH_OUTBOX_POLL_INTERVAL", "1")),
+}
+
 GRAPHENE = {"SCHEMA": env("GRAPHENE_SCHEMA", "GraphQL.schema.schema")}
 
 SECRET_KEY = env("DJANGO_SECRET_KEY", None)
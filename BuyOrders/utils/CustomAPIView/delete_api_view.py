@@ -1,8 +1,9 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from django.http import JsonResponse
 from rest_framework import status
 
 from utils.CustomAPIView.base_api_view import BaseMongoAPIView
+from utils.signals import post_bulk_delete
 
 
 class DeleteMongoAPIView(BaseMongoAPIView):
@@ -37,6 +38,16 @@ class DeleteMongoAPIView(BaseMongoAPIView):
             )
             return JsonResponse(data=response_data, status=status.HTTP_404_NOT_FOUND)
 
+        if self.delete_protected_query and self.model._get_collection().count_documents(
+                {'_id': obj.pk, **self.delete_protected_query}, limit=1):
+            response_data = {'message': f'Object with {self.lookup_field}: {slug_field} cannot be deleted'}
+            self.store_logs(
+                request=request,
+                response=response_data,
+                response_status_code=status.HTTP_409_CONFLICT
+            )
+            return JsonResponse(data=response_data, status=status.HTTP_409_CONFLICT)
+
         obj.delete()
         self.update_cache()
 
@@ -52,6 +63,9 @@ class DeleteMongoAPIView(BaseMongoAPIView):
         """
         Delete multiple MongoDB documents based on a list of IDs.
 
+        The documents are removed with a single `delete_many`; the response reports the
+        deleted and the missing ids, and the `refused` ones matching `delete_protected_query`.
+
         Args:
             request: The incoming HTTP request containing a list of IDs in 'data'.
 
@@ -69,7 +83,8 @@ class DeleteMongoAPIView(BaseMongoAPIView):
             return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
 
         response = {}
-        for idx, id_ in enumerate(data):
+        lookup_values = {}
+        for id_ in data:
             if not isinstance(id_, (str, int)):
                 response[str(id_)] = {
                     'message': 'Invalid ID format',
@@ -81,27 +96,80 @@ class DeleteMongoAPIView(BaseMongoAPIView):
             if id_ in ['test_id', 'test_str']:
                 query_list = self.get_queryset()
                 obj = query_list[0] if query_list else None
+                lookup_values[str(id_)] = getattr(obj, self.lookup_field) if obj else None
             else:
-                obj = self.get_query({self.lookup_field: id_})
+                lookup_values[str(id_)] = id_
 
-            if not obj or isinstance(obj, JsonResponse):
-                response[str(id_)] = {
-                    'message': f'No object found with {self.lookup_field}: {id_}',
-                    'status': status.HTTP_404_NOT_FOUND
-                }
-            else:
-                obj.delete()
-                response[str(id_)] = {
+        deleted, refused = self.delete_many([value for value in lookup_values.values() if value is not None])
+        for key, value in lookup_values.items():
+            if value is not None and str(value) in deleted:
+                response[key] = {
                     'message': 'Object deleted successfully',
                     'status': status.HTTP_200_OK
                 }
+            elif value is not None and str(value) in refused:
+                response[key] = {
+                    'message': f'Object with {self.lookup_field}: {key} cannot be deleted',
+                    'status': status.HTTP_409_CONFLICT
+                }
+            else:
+                response[key] = {
+                    'message': f'No object found with {self.lookup_field}: {key}',
+                    'status': status.HTTP_404_NOT_FOUND
+                }
 
-        self.update_cache()
-
-        response_data = {'data': response}
+        response_data = {
+            'data': response,
+            'deleted': [key for key, value in response.items() if value['status'] == status.HTTP_200_OK],
+            'missing': [key for key, value in response.items() if value['status'] == status.HTTP_404_NOT_FOUND],
+        }
+        if refused:
+            response_data['refused'] = [key for key, value in response.items()
+                                        if value['status'] == status.HTTP_409_CONFLICT]
         self.store_logs(
             request=request,
             response=response_data,
             response_status_code=status.HTTP_200_OK
         )
-        return JsonResponse(data=response_data, status=status.HTTP_200_OK)
\ No newline at end of file
+        return JsonResponse(data=response_data, status=status.HTTP_200_OK)
+
+    def delete_many(self, values: List[Any]) -> Tuple[Set[str], Set[str]]:
+        """
+        Delete every document whose lookup field matches one of the values with a single `delete_many`.
+
+        The matching documents are found with one query on the lookup field, then removed by
+        `_id`; those matching `delete_protected_query` are kept. Instead of a `post_delete`
+        per document, one `post_bulk_delete` signal is sent, which removes them from
+        Elasticsearch with a single `_bulk` request and invalidates the model's cached
+        responses once.
+
+        Args:
+            values: Lookup field values of the documents to delete.
+
+        Returns:
+            Tuple[Set[str], Set[str]]: The lookup values, as strings, of the deleted and of the
+            protected documents.
+        """
+        if not values:
+            return set(), set()
+
+        field = self.model._fields[self.lookup_field]
+        db_field = field.db_field
+        query = {db_field: {'$in': [field.prepare_query_value(None, value) for value in values]}}
+
+        collection = self.model._get_collection()
+        found = list(collection.find(query, {'_id': 1, db_field: 1}))
+        protected_ids = set()
+        if found and self.delete_protected_query:
+            protected_ids = {document['_id'] for document in collection.find(
+                {'$and': [query, self.delete_protected_query]}, {'_id': 1}
+            )}
+        refused = {str(document.get(db_field)) for document in found if document['_id'] in protected_ids}
+        found = [document for document in found if document['_id'] not in protected_ids]
+        if not found:
+            return set(), refused
+
+        document_ids = [document['_id'] for document in found]
+        collection.delete_many({'_id': {'$in': document_ids}})
+        post_bulk_delete.send(self.model, document_ids=[str(document_id) for document_id in document_ids])
+        return {str(document.get(db_field)) for document in found}, refused
@@ -0,0 +1,148 @@
+import base64
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the query."""
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """
+    Encode a cursor payload into an opaque, URL-safe token.
+
+    Args:
+        payload: Cursor state (BSON types such as datetimes are preserved).
+
+    Returns:
+        str: The cursor token.
+    """
+    raw = json_util.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """
+    Decode a cursor token created by `encode_cursor`.
+
+    Args:
+        token: The cursor token from the query string.
+
+    Returns:
+        Dict[str, Any]: The cursor payload.
+
+    Raises:
+        InvalidCursor: If the token is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        payload = json_util.loads(raw)
+    except Exception:
+        raise InvalidCursor('Invalid cursor')
+    if not isinstance(payload, dict):
+        raise InvalidCursor('Invalid cursor')
+    return payload
+
+
+def resolve_sort_key(model: Any, ordering_field: str) -> Tuple[List[Any], str, bool]:
+    """
+    Resolve an `ordering_fields` value to its model fields and database path.
+
+    Args:
+        model: The MongoEngine document class.
+        ordering_field: Ordering such as 'name' or '-created_at__date'.
+
+    Returns:
+        Tuple[List[Any], str, bool]: The fields along the path, the dotted database path
+        and whether the order is descending.
+
+    Raises:
+        InvalidCursor: If the ordering field does not exist on the model.
+    """
+    descending = ordering_field.startswith('-')
+    name = ordering_field.lstrip('-+')
+    try:
+        fields = model._lookup_field(name.split('__'))
+    except Exception:
+        raise InvalidCursor(f'Ordering field <{name}> does not support cursor pagination')
+    return fields, '.'.join(field.db_field for field in fields), descending
+
+
+def get_sort_value(document: Any, fields: List[Any]) -> Any:
+    """
+    Read the sort key of a document along a resolved field path.
+
+    Args:
+        document: The MongoEngine document.
+        fields: The fields along the sort key path.
+
+    Returns:
+        Any: The sort key in its database representation, or None if it is not set.
+    """
+    value = document
+    for field in fields:
+        value = getattr(value, field.name, None)
+        if value is None:
+            return None
+    return fields[-1].to_mongo(value)
+
+
+def build_seek_query(db_path: str, descending: bool, value: Any, document_id: Any) -> Dict[str, Any]:
+    """
+    Build the raw query selecting the rows after a (sort key, id) position.
+
+    Rows are ordered by the sort key and then by `_id` in the same direction; MongoDB
+    sorts missing sort keys first, so they are handled separately.
+
+    Args:
+        db_path: Dotted database path of the sort key.
+        descending: Whether the order is descending.
+        value: Sort key of the last returned row.
+        document_id: Id of the last returned row.
+
+    Returns:
+        Dict[str, Any]: A query for `__raw__`.
+    """
+    operator = '$lt' if descending else '$gt'
+    if db_path == '_id':
+        return {'_id': {operator: document_id}}
+
+    if value is None:
+        if descending:
+            return {db_path: None, '_id': {operator: document_id}}
+        return {'$or': [
+            {db_path: {'$ne': None}},
+            {db_path: None, '_id': {operator: document_id}},
+        ]}
+
+    seek = [
+        {db_path: {operator: value}},
+        {db_path: value, '_id': {operator: document_id}},
+    ]
+    if descending:
+        seek.append({db_path: None})
+    return {'$or': seek}
+
+
+def parse_limit(value: Optional[str], max_limit: int) -> int:
+    """
+    Parse the `limit` query parameter.
+
+    Args:
+        value: Raw parameter value.
+        max_limit: Largest accepted page size.
+
+    Returns:
+        int: The page size.
+
+    Raises:
+        InvalidCursor: If the value is not a positive integer up to `max_limit`.
+    """
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise InvalidCursor('limit must be an integer')
+    if limit < 1 or limit > max_limit:
+        raise InvalidCursor(f'limit must be between 1 and {max_limit}')
+    return limit
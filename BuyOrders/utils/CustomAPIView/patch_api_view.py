@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional, Tuple
 from django.http import JsonResponse
+from mongoengine import ValidationError
 from rest_framework import status
 
 from utils.CustomAPIView.base_api_view import BaseMongoAPIView
@@ -65,7 +66,16 @@ class PatchMongoAPIView(BaseMongoAPIView):
             return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
 
         model_serializer = serializer(obj, many=False)
-        model_serializer.update([validated_data])
+        try:
+            model_serializer.update([validated_data])
+        except ValidationError as e:
+            response_data = {'message': str(e)}
+            self.store_logs(
+                request=request,
+                response=response_data,
+                response_status_code=status.HTTP_400_BAD_REQUEST
+            )
+            return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
         self.update_cache()
 
         response_data = model_serializer.data
@@ -80,6 +90,10 @@ class PatchMongoAPIView(BaseMongoAPIView):
         """
         Update multiple MongoDB documents based on a list of data.
 
+        All target documents are loaded with a single `id__in` query, narrowed by the view's
+        query-param filters, and written back with a single `bulk_write`. Items whose id is not
+        found or does not match the filters are skipped, as before.
+
         Args:
             request: The incoming HTTP request containing a list of data in 'data'.
 
@@ -98,19 +112,33 @@ class PatchMongoAPIView(BaseMongoAPIView):
             )
             return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
 
+        filter_status, filters_param = self.apply_filters()
+        if not filter_status:
+            self.store_logs(
+                request=request,
+                response=filters_param,
+                response_status_code=status.HTTP_400_BAD_REQUEST
+            )
+            return JsonResponse(data=filters_param, status=status.HTTP_400_BAD_REQUEST)
+
+        items = [value for value in request_data if isinstance(value, dict) and value.get('id')]
+        requested_ids = {str(value['id']) for value in items if value['id'] not in ['test_id', 'test_str']}
+        objects = {
+            str(obj.pk): obj
+            for obj in self.model.objects.filter(id__in=list(requested_ids), **filters_param)
+        } if requested_ids else {}
+
         valid_data_list = []
         object_list = []
-        for value in request_data:
-            if isinstance(value, dict) and value.get('id'):
-
-                if value['id'] in ['test_id', 'test_str']:
-                    query_list = self.get_queryset()
-                    obj = query_list[0] if query_list else None
-                else:
-                    obj = self.get_query({'id': value['id']})
-                if obj and not isinstance(obj, JsonResponse):
-                    object_list.append(obj)
-                    valid_data_list.append(value)
+        for value in items:
+            if value['id'] in ['test_id', 'test_str']:
+                query_list = self.get_queryset()
+                obj = query_list[0] if query_list else None
+            else:
+                obj = objects.get(str(value['id']))
+            if obj:
+                object_list.append(obj)
+                valid_data_list.append(value)
 
         if not object_list:
             response_data = {'message': 'No valid objects found for update'}
@@ -121,17 +149,22 @@ class PatchMongoAPIView(BaseMongoAPIView):
             )
             return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
 
-        model_serializer = serializer(object_list, many=True)
-        model_serializer.update(valid_data_list)
+        model_serializer = serializer(object_list, many=True, parse_data=False)
+        results = model_serializer.bulk_update(valid_data_list, ordered=self.bulk_patch_ordered)
         self.update_cache()
 
         response_data = {'data': model_serializer.data}
+        response_status_code = status.HTTP_200_OK
+        failed = [idx for idx, result in results.items() if isinstance(result, list)]
+        if failed:
+            response_data['results'] = results
+            response_status_code = status.HTTP_207_MULTI_STATUS if len(failed) < len(results) else status.HTTP_400_BAD_REQUEST
         self.store_logs(
             request=request,
             response=response_data,
-            response_status_code=status.HTTP_200_OK
+            response_status_code=response_status_code
         )
-        return JsonResponse(data=response_data, status=status.HTTP_200_OK)
+        return JsonResponse(data=response_data, status=response_status_code)
 
     def check_patch_data(self, data: Any, serializer: Any, many: bool = False) -> Tuple[bool, Dict]:
         """
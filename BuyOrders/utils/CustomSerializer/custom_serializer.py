@@ -1,11 +1,20 @@
-from typing import Any, Dict, List, Optional, Union, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, Type
 import requests
 from django.conf import settings
-from mongoengine import Document
+from mongoengine import Document, ValidationError, signals
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from rest_framework import status
 from utils.CustomSerializer.data_serializer import DataSerializer
+from utils.CustomSerializer.field_selection import FieldSelection
 from utils.CustomSerializer.field_value_parser import FieldValueProcessor
 from utils.CustomSerializer.meta_config import MetaConfig
-from utils.microservice.auth import load_slaughter_erp_token
+from utils.id_generator import expect_ids
+from utils.microservice.auth import load_slaughter_erp_token, invalidate_slaughter_erp_token
+from utils.microservice.http_client import get_http_client
+from utils.request_timing import timed_stage
+from utils.signals import post_bulk_update
 
 
 class CustomSerializer:
@@ -17,7 +26,8 @@ class CustomSerializer:
         model: Optional[Type[Document]] = None
         fields: Union[str, List[str]] = '__all__'
 
-    def __init__(self, object_: Any = None, many: bool = False, parse_data: bool = True) -> None:
+    def __init__(self, object_: Any = None, many: bool = False, parse_data: bool = True,
+                 fields: Optional[FieldSelection] = None) -> None:
         """
         Initialize the serializer with object(s) to process.
 
@@ -25,12 +35,14 @@ class CustomSerializer:
             object_: Single object or queryset to serialize.
             many: Whether the input is a collection of objects.
             parse_data: Whether to parse objects into serialized data on initialization.
+            fields: Sparse fieldset to serialize; unselected fields, including external
+                references, are skipped entirely.
         """
         self.queryset = object_ if many else [object_] if object_ else []
         self.many = many
         self.data: Union[List[Dict[str, Any]], Dict[str, Any]] = []
         self.meta = self._get_meta()
-        self.serializer = DataSerializer(self.meta)
+        self.serializer = DataSerializer(self.meta, fields)
         if parse_data and self.queryset:
             self.parse_objects()
 
@@ -43,6 +55,32 @@ class CustomSerializer:
         """
         return getattr(self.__class__, 'Meta', MetaConfig())
 
+    def _build_create_data(self, validated_data: Dict[str, Any], request: Any) -> Dict[str, Any]:
+        """
+        Build the constructor arguments of a new model instance from validated data.
+
+        Args:
+            validated_data: The validated data of one item.
+            request: The incoming HTTP request, used for default values.
+
+        Returns:
+            Dict[str, Any]: Field values for the model constructor.
+        """
+        model = self.meta.model
+        fields = self.meta.fields
+        data = {}
+        for name, field in model._fields.items():
+            if name == 'id':
+                continue
+            if fields == '__all__' or name in fields:
+                value = validated_data.get(name)
+                if field.__class__.__name__ in ['EmbeddedDocumentField', 'ReferenceField']:
+                    value = FieldValueProcessor.process_related_field(field, value, field.document_type)
+                data[name] = value if value is not None else FieldValueProcessor.get_default_value(field, request)
+            else:
+                data[name] = FieldValueProcessor.get_default_value(field, request)
+        return data
+
     def create(self, request: Any) -> None:
         """
         Create and save new model instances from validated data.
@@ -54,23 +92,9 @@ class CustomSerializer:
         if not model:
             return
 
-        fields = self.meta.fields
         model_list = []
-
         for validated_data in self.queryset:
-            data = {}
-            for name, field in model._fields.items():
-                if name == 'id':
-                    continue
-                if fields == '__all__' or name in fields:
-                    value = validated_data.get(name)
-                    if field.__class__.__name__ in ['EmbeddedDocumentField', 'ReferenceField']:
-                        value = FieldValueProcessor.process_related_field(field, value, field.document_type)
-                    data[name] = value if value is not None else FieldValueProcessor.get_default_value(field, request)
-                else:
-                    data[name] = FieldValueProcessor.get_default_value(field, request)
-
-            instance = model(**data)
+            instance = model(**self._build_create_data(validated_data, request))
             instance.save()
             model_list.append(instance)
 
@@ -78,6 +102,73 @@ class CustomSerializer:
         self.data = []
         self.parse_objects()
 
+    def bulk_create(self, request: Any, chunk_size: int = 500) -> Dict[int, Any]:
+        """
+        Create model instances from validated data with one `insert_many` per chunk.
+
+        All instances are built and validated in memory first, with their ids reserved
+        in a single step. Each chunk is written unordered, so one failing item does not
+        stop the others, and a single `post_bulk_insert` signal is sent per chunk instead
+        of a `post_save` per document.
+
+        Args:
+            request: The incoming HTTP request containing data for creation.
+            chunk_size: Maximum number of documents per `insert_many` call.
+
+        Returns:
+            Dict[int, Any]: Result per input index, in the `check_post_data` format.
+        """
+        model = self.meta.model
+        if not model:
+            return {}
+
+        results: Dict[int, Any] = {}
+        pending: List[Tuple[int, Document]] = []
+
+        with expect_ids(len(self.queryset)):
+            for idx, validated_data in enumerate(self.queryset):
+                try:
+                    instance = model(**self._build_create_data(validated_data, request))
+                    instance.validate()
+                except ValidationError as e:
+                    results[idx] = [{'message': str(e), 'status': status.HTTP_400_BAD_REQUEST}]
+                    continue
+                pending.append((idx, instance))
+
+        collection = model._get_collection()
+        chunk_size = max(1, chunk_size)
+        model_list = []
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            documents = [instance for _, instance in chunk]
+            signals.pre_bulk_insert.send(model, documents=documents)
+
+            failed = {}
+            try:
+                collection.insert_many([instance.to_mongo() for instance in documents], ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details.get('writeErrors', []):
+                    failed[write_error['index']] = write_error.get('errmsg', 'Failed to write document')
+
+            created = []
+            for position, (idx, instance) in enumerate(chunk):
+                if position in failed:
+                    results[idx] = [{'message': failed[position], 'status': status.HTTP_400_BAD_REQUEST}]
+                    continue
+                instance._created = False
+                instance._clear_changed_fields()
+                created.append(instance)
+                results[idx] = {'message': 'Valid data', 'status': status.HTTP_200_OK}
+
+            if created:
+                signals.post_bulk_insert.send(model, documents=created, loaded=True)
+            model_list.extend(created)
+
+        self.queryset = model_list
+        self.data = []
+        self.parse_objects()
+        return dict(sorted(results.items()))
+
     def update(self, validated_data: List[Dict[str, Any]]) -> None:
         """
         Update existing model instances with validated data.
@@ -85,28 +176,127 @@ class CustomSerializer:
         Args:
             validated_data: List of dictionaries containing update data.
         """
-        fields = self.meta.fields
         for instance, validated in zip(self.queryset, validated_data):
-            fields_dict = {name: field for name, field in instance._fields.items()}
-            for key, value in validated.items():
-                if (fields == '__all__' or key in fields) and key in fields_dict:
-                    field = fields_dict[key]
-                    if field.__class__.__name__ in ['EmbeddedDocumentField', 'ReferenceField']:
-                        value = FieldValueProcessor.process_related_field(field, value, field.document_type)
-                    setattr(instance, key, value)
+            self._apply_changes(instance, validated)
             instance.save()
 
         self.data = []
         self.parse_objects()
 
+    def _apply_changes(self, instance: Document, validated_data: Dict[str, Any]) -> None:
+        """
+        Set the serializer fields present in validated data on a model instance.
+
+        Args:
+            instance: The model instance to change.
+            validated_data: The update data of one item.
+        """
+        fields = self.meta.fields
+        fields_dict = instance._fields
+        for key, value in validated_data.items():
+            if (fields == '__all__' or key in fields) and key in fields_dict:
+                field = fields_dict[key]
+                if field.__class__.__name__ in ['EmbeddedDocumentField', 'ReferenceField']:
+                    value = FieldValueProcessor.process_related_field(field, value, field.document_type)
+                setattr(instance, key, value)
+
+    def bulk_update(self, validated_data: List[Dict[str, Any]], ordered: bool = False) -> Dict[int, Any]:
+        """
+        Update the loaded instances with a single `bulk_write` of `$set`/`$unset` operations.
+
+        Changes are applied and validated in memory, then every changed document is written
+        with one `UpdateOne` in a single round trip, and one `post_bulk_update` signal is sent
+        with all written documents instead of a `post_save` per document. Items that target
+        the same document are merged into one operation.
+
+        Args:
+            validated_data: Update data, aligned with the loaded instances.
+            ordered: Whether to stop at the first failed write.
+
+        Returns:
+            Dict[int, Any]: Result per input index, in the `check_patch_data` format.
+        """
+        model = self.meta.model
+        if not model:
+            return {}
+
+        results: Dict[int, Any] = {}
+        targets: Dict[Any, Tuple[Document, List[int]]] = {}
+        for idx, (instance, validated) in enumerate(zip(self.queryset, validated_data)):
+            self._apply_changes(instance, validated)
+            targets.setdefault(instance.pk, (instance, []))[1].append(idx)
+
+        id_field = model._fields[model._meta['id_field']]
+        operations, pending = [], []
+        for instance, indexes in targets.values():
+            try:
+                instance.validate()
+            except ValidationError as e:
+                for idx in indexes:
+                    results[idx] = [{'message': str(e), 'status': status.HTTP_400_BAD_REQUEST}]
+                continue
+
+            set_data, unset_data = instance._delta()
+            update = {}
+            if set_data:
+                update['$set'] = set_data
+            if unset_data:
+                update['$unset'] = unset_data
+            if update:
+                operations.append(UpdateOne({'_id': id_field.to_mongo(instance.pk)}, update))
+            pending.append((instance, indexes, bool(update)))
+
+        failed = {}
+        if operations:
+            try:
+                model._get_collection().bulk_write(operations, ordered=ordered)
+            except BulkWriteError as e:
+                for write_error in e.details.get('writeErrors', []):
+                    failed[write_error['index']] = write_error.get('errmsg', 'Failed to write document')
+                if ordered and failed:
+                    # An ordered bulk write stops at the first error
+                    first_error = min(failed)
+                    for position in range(first_error + 1, len(operations)):
+                        failed[position] = 'Not applied after an earlier failed write'
+
+        updated, written, position = [], [], 0
+        for instance, indexes, changed in pending:
+            if changed:
+                error = failed.get(position)
+                position += 1
+                if error:
+                    for idx in indexes:
+                        results[idx] = [{'message': error, 'status': status.HTTP_400_BAD_REQUEST}]
+                    continue
+                instance._clear_changed_fields()
+                written.append(instance)
+            updated.append(instance)
+            for idx in indexes:
+                results[idx] = {'message': 'Valid data', 'status': status.HTTP_200_OK}
+
+        if written:
+            post_bulk_update.send(model, documents=written)
+
+        self.queryset = updated
+        self.data = []
+        self.parse_objects()
+        return dict(sorted(results.items()))
+
     def parse_objects(self) -> None:
         """
         Parse queryset into serialized data representation.
+
+        External references are resolved for the whole queryset at once, so each
+        unique referenced object is fetched a single time.
         """
-        self.data = [
-            self.to_represent(self.serializer.correct_dict(self.serializer.to_dict(obj)))
-            for obj in self.queryset
-        ]
+        with timed_stage('query'):
+            documents = self.queryset if isinstance(self.queryset, list) else list(self.queryset)
+        with timed_stage('serialize'):
+            rows = [
+                self.serializer.correct_dict(self.serializer.to_dict(obj))
+                for obj in documents
+            ]
+        self.data = self.to_represent_many(rows)
         if not self.many and self.data:
             self.data = self.data[0]
 
@@ -120,61 +310,142 @@ class CustomSerializer:
         Returns:
             Dict[str, Any]: The transformed data.
         """
-        return self._fetch_external_data(validated_data)
+        return self.to_represent_many([validated_data])[0]
 
-    def _fetch_external_data(self, validated_data: Dict[str, Any]) -> Dict[str, Any]:
+    def to_represent_many(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Recursively process validated data to fetch external service data for specific fields.
+        Transform a list of validated rows, resolving external references in batch.
+
+        Args:
+            rows: The validated rows to transform.
+
+        Returns:
+            List[Dict[str, Any]]: The transformed rows.
+        """
+        return self._fetch_external_data(rows)
+
+    def _fetch_external_data(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Resolve external service fields for a list of rows in two phases.
+
+        The first phase collects every referenced URL across all rows, the second
+        fetches each unique URL once on a bounded thread pool and stitches the
+        responses back into the rows.
+
+        Args:
+            rows: The data rows to process.
+
+        Returns:
+            List[Dict[str, Any]]: The processed rows with external service responses.
+        """
+        microservice_url = getattr(settings, 'MICROSERVICE_URL', {})
+        if not microservice_url:
+            return rows
+
+        urls = set()
+        for row in rows:
+            self._collect_external_urls(row, microservice_url, urls)
+        if not urls:
+            return rows
+
+        with timed_stage('references'):
+            responses = self._fetch_external_urls(urls)
+        for row in rows:
+            self._stitch_external_data(row, microservice_url, responses)
+        return rows
+
+    def _collect_external_urls(self, validated_data: Dict[str, Any], microservice_url: Dict[str, str],
+                               urls: Set[str]) -> None:
+        """
+        Recursively collect the external URLs referenced by a row.
+
+        Args:
+            validated_data: The data to scan.
+            microservice_url: Mapping of field names to microservice base URLs.
+            urls: Set the referenced URLs are added to.
+        """
+        for key, item in validated_data.items():
+            if isinstance(item, dict):
+                self._collect_external_urls(item, microservice_url, urls)
+            elif key in microservice_url:
+                urls.add(self._build_external_url(microservice_url, key, item))
+
+    def _stitch_external_data(self, validated_data: Dict[str, Any], microservice_url: Dict[str, str],
+                              responses: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Recursively replace referenced values with the fetched external data.
 
         Args:
             validated_data: The data to process.
+            microservice_url: Mapping of field names to microservice base URLs.
+            responses: Fetched responses keyed by URL.
 
         Returns:
-            Dict[str, Any]: The processed data with external service responses.
+            Dict[str, Any]: The processed data.
         """
         for key, item in validated_data.items():
             if isinstance(item, dict):
-                validated_data[key] = self._fetch_external_data(item)
-            else:
-                validated_data[key] = self._fetch_single_external_data(key, item)
+                validated_data[key] = self._stitch_external_data(item, microservice_url, responses)
+            elif key in microservice_url:
+                url = self._build_external_url(microservice_url, key, item)
+                response = responses.get(url)
+                validated_data[key] = response if response else {'message': f"Failed to fetch data from {url}"}
         return validated_data
 
-    def _fetch_single_external_data(self, key: str, value: Any) -> Any:
+    @staticmethod
+    def _build_external_url(microservice_url: Dict[str, str], key: str, value: Any) -> str:
         """
-        Fetch data for a single field from an external microservice if applicable.
+        Build the microservice URL for a referenced value.
 
         Args:
+            microservice_url: Mapping of field names to microservice base URLs.
             key: The field name.
             value: The field value.
 
         Returns:
-            Any: The fetched data or original value if no external fetch is needed.
+            str: The URL of the referenced object.
         """
-        microservice_url = getattr(settings, 'MICROSERVICE_URL', {})
-        if key not in microservice_url:
-            return value
+        return f'{microservice_url[key]}{value}/'
+
+    def _fetch_external_urls(self, urls: Set[str]) -> Dict[str, Any]:
+        """
+        Fetch every unique URL concurrently on a bounded thread pool.
+
+        Args:
+            urls: The unique URLs to fetch.
 
-        url = f'{microservice_url[key]}{value}/'
-        response = self._make_external_request(url)
-        return response if response else {'message': f"Failed to fetch data from {url}"}
+        Returns:
+            Dict[str, Any]: Responses keyed by URL (None for failed requests).
+        """
+        token = load_slaughter_erp_token()
+        if not token:
+            return {url: {'message': f'Invalid token for fetching data from {url}'} for url in urls}
+
+        max_workers = max(1, min(len(urls), getattr(settings, 'MICROSERVICE_FETCH_WORKERS', 8)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda url: self._make_external_request(url, token), urls)
+            return dict(zip(urls, results))
 
     @staticmethod
-    def _make_external_request(url: str) -> Optional[Dict[str, Any]]:
+    def _make_external_request(url: str, token: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Make an HTTP GET request to an external microservice with JWT authentication.
 
         Args:
             url: The URL to fetch data from.
+            token: Service token to use; loaded on demand when not given.
 
         Returns:
             Optional[Dict[str, Any]]: The JSON response or None if the request fails.
         """
-        token = load_slaughter_erp_token()
+        token = token or load_slaughter_erp_token()
         if not token:
             return {'message': f'Invalid token for fetching data from {url}'}
 
         try:
-            response = requests.get(url, headers={'Authorization': f'Bearer {token}'})
+            response = get_http_client().get(url, headers={'Authorization': f'Bearer {token}'})
+            if response.status_code == 401:
+                invalidate_slaughter_erp_token(token)
             return response.json() if 199 <= response.status_code <= 299 else None
         except requests.RequestException:
-            return None
\ No newline at end of file
+            return None
@@ -1,5 +1,6 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from bson import ObjectId
+from utils.CustomSerializer.field_selection import FieldSelection
 from utils.CustomSerializer.field_value_parser import FieldValueProcessor
 from utils.CustomSerializer.meta_config import MetaConfig
 
@@ -9,14 +10,16 @@ class DataSerializer:
     Handles conversion of MongoEngine objects to dictionary representation.
     """
 
-    def __init__(self, meta: MetaConfig) -> None:
+    def __init__(self, meta: MetaConfig, selection: Optional[FieldSelection] = None) -> None:
         """
         Initialize the serializer with Meta configuration.
 
         Args:
             meta: MetaConfig object containing model and field information.
+            selection: Sparse fieldset requested by the client, if any.
         """
         self.meta = meta
+        self.selection = selection
 
     def to_dict(self, obj: Any) -> Dict[str, Any]:
         """
@@ -33,6 +36,14 @@ class DataSerializer:
         if not model:
             return {}
 
+        if self.selection:
+            tree = self.selection.tree
+            return {
+                name: FieldSelection.prune(FieldValueProcessor.get_field_value(obj, name, field), tree[name])
+                for name, field in model._fields.items()
+                if name in tree and (fields == '__all__' or name in fields or name == 'id')
+            }
+
         return {
             name: FieldValueProcessor.get_field_value(obj, name, field)
             for name, field in model._fields.items()
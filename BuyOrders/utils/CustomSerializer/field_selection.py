@@ -0,0 +1,123 @@
+from typing import Any, Dict, List, Optional, Type, Union
+from mongoengine import Document
+
+
+class FieldSelectionError(ValueError):
+    """Raised when a `fields` query parameter names a field the model does not have."""
+
+
+class FieldSelection:
+    """
+    Parsed sparse fieldset from a `?fields=a,b,c.d` query parameter.
+
+    `tree` describes the selected fields for the serializer: top-level keys are field
+    names, nested keys are database field names as they appear in embedded documents,
+    and a value of None selects the whole field. `projection` holds the paths passed
+    to `QuerySet.only()`.
+    """
+
+    def __init__(self, tree: Dict[str, Any], projection: List[str]) -> None:
+        """
+        Initialize the selection.
+
+        Args:
+            tree: Selected fields, nested for embedded documents.
+            projection: Field paths for `QuerySet.only()`.
+        """
+        self.tree = tree
+        self.projection = projection
+
+    @classmethod
+    def parse(cls, value: str, model: Type[Document],
+              allowed_fields: Union[str, List[str]] = '__all__') -> 'FieldSelection':
+        """
+        Parse and validate a comma separated list of dotted field paths against a model.
+
+        Args:
+            value: Raw `fields` parameter, e.g. 'id,status,car.driver'.
+            model: The MongoEngine document class.
+            allowed_fields: The serializer's Meta.fields.
+
+        Returns:
+            FieldSelection: The parsed selection.
+
+        Raises:
+            FieldSelectionError: If a path is empty, unknown or not exposed by the serializer.
+        """
+        tree: Dict[str, Any] = {'id': None}
+        projection = {'id'}
+
+        for path in (part.strip() for part in value.split(',')):
+            if not path:
+                continue
+            names = path.split('.')
+            if names[0] != 'id' and allowed_fields != '__all__' and names[0] not in allowed_fields:
+                raise FieldSelectionError(f'Field <{path}> is not available')
+
+            document: Optional[Type[Any]] = model
+            node: Optional[Dict[str, Any]] = tree
+            projection_path = []
+            for depth, name in enumerate(names):
+                field = document._fields.get(name) if document else None
+                if field is None:
+                    raise FieldSelectionError(f'Unknown field <{path}>')
+
+                if projection_path is not None:
+                    projection_path.append(name)
+                    # A reference is stored as an id, so it cannot be projected any deeper
+                    if field.__class__.__name__ == 'ReferenceField':
+                        projection.add('.'.join(projection_path))
+                        projection_path = None
+
+                key = name if depth == 0 else field.db_field
+                if depth == len(names) - 1:
+                    if node is not None:
+                        node[key] = None
+                    break
+
+                document = cls._document_type(field)
+                if document is None:
+                    raise FieldSelectionError(f'Field <{".".join(names[:depth + 1])}> has no subfields')
+                if node is not None:
+                    # A parent that is already fully selected stays fully selected
+                    node = node.setdefault(key, {}) if key not in node or node[key] is not None else None
+
+            if projection_path:
+                projection.add('.'.join(projection_path))
+
+        return cls(tree, sorted(projection))
+
+    @staticmethod
+    def _document_type(field: Any) -> Optional[Type[Any]]:
+        """
+        Return the document class behind an embedded, reference or list field.
+
+        Args:
+            field: The MongoEngine field.
+
+        Returns:
+            Optional[Type[Any]]: The nested document class, or None for scalar fields.
+        """
+        while field.__class__.__name__ == 'ListField' and getattr(field, 'field', None) is not None:
+            field = field.field
+        return getattr(field, 'document_type', None) if hasattr(field, 'document_type_obj') else None
+
+    @classmethod
+    def prune(cls, value: Any, tree: Optional[Dict[str, Any]]) -> Any:
+        """
+        Keep only the selected keys of a serialized value.
+
+        Args:
+            value: A serialized field value (dict, list or scalar).
+            tree: The selected subfields, or None to keep everything.
+
+        Returns:
+            Any: The pruned value.
+        """
+        if tree is None:
+            return value
+        if isinstance(value, list):
+            return [cls.prune(item, tree) for item in value]
+        if isinstance(value, dict):
+            return {key: cls.prune(item, tree[key]) for key, item in value.items() if key in tree}
+        return value
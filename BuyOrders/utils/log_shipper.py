@@ -0,0 +1,190 @@
+import json
+import logging
+import os
+import random
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import requests
+from django.conf import settings
+from prometheus_client import Counter, Gauge
+
+from utils.microservice.auth import load_slaughter_erp_token
+from utils.microservice.http_client import get_http_client
+
+
+logger = logging.getLogger(__name__)
+
+LOG_QUEUE_DEPTH = Gauge(
+    'request_log_queue_depth',
+    'Request log records waiting in the in-process ring buffer.',
+)
+LOG_RECORDS = Counter(
+    'request_log_records_total',
+    'Request log records by outcome: queued, sampled_out, dropped, sent or failed.',
+    ['result'],
+)
+
+
+class LogShipper:
+    """
+    Ships request logs to the Logs service in batches, off the request thread.
+
+    `submit` only appends the raw record to a bounded in-process ring buffer. A background
+    flusher serializes the records and posts them to the Logs service bulk endpoint once
+    `batch_size` records are waiting or `flush_interval` seconds have passed. Under
+    backpressure the request never waits: above the high watermark successful requests
+    are sampled, and when the buffer is full the oldest records are dropped.
+    """
+
+    def __init__(self, capacity: int = 10000, batch_size: int = 200, flush_interval: float = 2.0,
+                 high_watermark: float = 0.8, sample_rate: float = 0.1) -> None:
+        """
+        Initialize an empty shipper.
+
+        Args:
+            capacity: Maximum number of records held in memory.
+            batch_size: Records per bulk request.
+            flush_interval: Seconds after which waiting records are sent even if the batch is not full.
+            high_watermark: Fill ratio of the buffer above which successful requests are sampled.
+            sample_rate: Share of successful requests kept above the high watermark.
+        """
+        self.capacity = max(1, capacity)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.high_watermark = max(1, int(self.capacity * high_watermark))
+        self.sample_rate = sample_rate
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+
+    def submit(self, record: Dict[str, Any]) -> bool:
+        """
+        Queue a log record without blocking.
+
+        Args:
+            record: The raw log record; values are serialized by the flusher.
+
+        Returns:
+            bool: Whether the record was kept.
+        """
+        self._ensure_flusher()
+        with self._lock:
+            depth = len(self._buffer)
+            if depth >= self.high_watermark and record.get('status_code', 0) < 400 \
+                    and random.random() >= self.sample_rate:
+                LOG_RECORDS.labels('sampled_out').inc()
+                return False
+            if depth >= self.capacity:
+                self._buffer.popleft()
+                LOG_RECORDS.labels('dropped').inc()
+            self._buffer.append(record)
+            depth = len(self._buffer)
+
+        LOG_RECORDS.labels('queued').inc()
+        LOG_QUEUE_DEPTH.set(depth)
+        if depth >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> int:
+        """
+        Send every waiting record in batches.
+
+        Returns:
+            int: Number of records sent.
+        """
+        sent = 0
+        while True:
+            with self._lock:
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                depth = len(self._buffer)
+            LOG_QUEUE_DEPTH.set(depth)
+            if not batch:
+                return sent
+            if self._send(batch):
+                sent += len(batch)
+
+    def _send(self, batch: List[Dict[str, Any]]) -> bool:
+        """
+        Serialize a batch and post it to the Logs service bulk endpoint.
+
+        Args:
+            batch: The raw log records.
+
+        Returns:
+            bool: Whether the Logs service accepted the batch.
+        """
+        try:
+            data = [self._serialize(record) for record in batch]
+            token = load_slaughter_erp_token()
+            response = get_http_client().post(
+                url=settings.LOG_SERVER['bulk_endpoint_url'],
+                json={'data': data},
+                headers={'Authorization': f'Bearer {token}'}
+            )
+            ok = 200 <= response.status_code < 300
+        except (requests.RequestException, KeyError):
+            ok = False
+        except Exception:
+            logger.exception('Failed to ship %d request log records', len(batch))
+            ok = False
+
+        LOG_RECORDS.labels('sent' if ok else 'failed').inc(len(batch))
+        return ok
+
+    @staticmethod
+    def _serialize(record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a raw record into the Logs document format, JSON-encoding structured values
+        and leaving out empty ones.
+
+        Args:
+            record: The raw log record.
+
+        Returns:
+            Dict[str, Any]: The record ready for the Logs service.
+        """
+        return {
+            key: value if isinstance(value, (int, float, str)) else json.dumps(value, default=str)
+            for key, value in record.items() if value is not None
+        }
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher of this process if it is not running."""
+        if os.getpid() != self._pid:
+            # Threads and buffered records do not survive a fork
+            self._thread, self._pid = None, os.getpid()
+            self._buffer = deque()
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='request-log-shipper', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Flush whenever a batch is full, and at least once per flush interval."""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Request log flusher failed')
+                LOG_RECORDS.labels('failed').inc()
+
+
+_config = getattr(settings, 'LOG_SHIPPER', {})
+log_shipper = LogShipper(
+    capacity=_config.get('CAPACITY', 10000),
+    batch_size=_config.get('BATCH_SIZE', 200),
+    flush_interval=_config.get('FLUSH_INTERVAL', 2.0),
+    high_watermark=_config.get('HIGH_WATERMARK', 0.8),
+    sample_rate=_config.get('SAMPLE_RATE', 0.1),
+)
@@ -0,0 +1,233 @@
+import threading
+import time
+import uuid
+from typing import Optional, Tuple
+
+import jwt
+import requests
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from utils.microservice.http_client import get_http_client
+
+
+class ServiceTokenManager:
+    """
+    Keeps the SlaughterERP service token in process memory.
+
+    The token's `exp` claim is decoded locally, so a valid token costs no network round trip.
+    Shortly before expiry a single worker logs in again under a Redis lock and publishes the
+    new token through Redis; the other workers pick it up from the shared key or the channel.
+    """
+
+    TOKEN_KEY = 'service_token:{username}'
+    LOCK_KEY = 'service_token:{username}:lock'
+    CHANNEL = 'service_token:{username}:channel'
+
+    # Releases the lock only if it is still held by this worker
+    RELEASE_LOCK_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, refresh_margin: float = 60.0, lock_timeout: float = 10.0) -> None:
+        """
+        Initialize an empty token manager.
+
+        Args:
+            refresh_margin: Seconds before expiry at which the token is refreshed.
+            lock_timeout: Seconds the single-flight login lock is held at most.
+        """
+        self.refresh_margin = refresh_margin
+        self.lock_timeout = lock_timeout
+        self.username = settings.MICROSERVICE_CONFIGS['SlaughterERP']['username']
+
+        self._token: Optional[str] = None
+        self._expires_at: float = 0.0
+        self._lock = threading.Lock()
+        self._subscriber: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _decode_expiry(token: str) -> float:
+        """
+        Read the `exp` claim of a token without verifying its signature.
+
+        Args:
+            token: The JWT.
+
+        Returns:
+            float: Expiry as a unix timestamp, or 0 if the token cannot be decoded.
+        """
+        try:
+            payload = jwt.decode(token, options={'verify_signature': False})
+            return float(payload.get('exp', 0))
+        except jwt.InvalidTokenError:
+            return 0.0
+
+    def _is_fresh(self, expires_at: float) -> bool:
+        """Check whether a token expiring at `expires_at` is outside the refresh window."""
+        return expires_at - time.time() > self.refresh_margin
+
+    def _set_token(self, token: str, expires_at: float) -> None:
+        """Store a token in process memory if it outlives the current one."""
+        with self._lock:
+            if expires_at > self._expires_at:
+                self._token = token
+                self._expires_at = expires_at
+
+    def get_token(self) -> Optional[str]:
+        """
+        Return a valid service token, refreshing it only when it is about to expire.
+
+        Returns:
+            Optional[str]: The token, or None if no valid token could be obtained.
+        """
+        token, expires_at = self._token, self._expires_at
+        if token and self._is_fresh(expires_at):
+            return token
+
+        self._ensure_subscriber()
+        token, expires_at = self._refresh()
+        if token:
+            return token
+
+        # Refresh failed; keep using the current token until it actually expires
+        if self._token and self._expires_at > time.time():
+            return self._token
+        return None
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Drop a token that the target service rejected so the next call logs in again.
+
+        Args:
+            token: The rejected token; ignored if a newer token is already held.
+        """
+        with self._lock:
+            if token is None or token == self._token:
+                self._token = None
+                self._expires_at = 0.0
+
+        try:
+            connection = get_redis_connection('default')
+            key = self.TOKEN_KEY.format(username=self.username)
+            if token is None or connection.get(key) == token.encode():
+                connection.delete(key)
+        except (RedisError, NotImplementedError):
+            pass
+
+    def _refresh(self) -> Tuple[Optional[str], float]:
+        """
+        Adopt a token published by another worker, or log in under the single-flight lock.
+
+        Returns:
+            Tuple[Optional[str], float]: The fresh token and its expiry, or (None, 0).
+        """
+        try:
+            connection = get_redis_connection('default')
+        except (RedisError, NotImplementedError):
+            # No shared Redis cache configured; every worker logs in on its own
+            return self._login_and_store()
+
+        token_key = self.TOKEN_KEY.format(username=self.username)
+        lock_key = self.LOCK_KEY.format(username=self.username)
+        deadline = time.monotonic() + self.lock_timeout
+
+        try:
+            while True:
+                shared = connection.get(token_key)
+                if shared:
+                    token = shared.decode()
+                    expires_at = self._decode_expiry(token)
+                    if self._is_fresh(expires_at):
+                        self._set_token(token, expires_at)
+                        return token, expires_at
+
+                lock_id = uuid.uuid4().hex
+                if connection.set(lock_key, lock_id, nx=True, px=int(self.lock_timeout * 1000)):
+                    try:
+                        token, expires_at = self._login_and_store()
+                        if token:
+                            ttl = max(1, int(expires_at - time.time()))
+                            connection.set(token_key, token, ex=ttl)
+                            connection.publish(self.CHANNEL.format(username=self.username), token)
+                        return token, expires_at
+                    finally:
+                        connection.eval(self.RELEASE_LOCK_SCRIPT, 1, lock_key, lock_id)
+
+                # Another worker is logging in; wait for it to publish the token
+                if time.monotonic() >= deadline:
+                    return None, 0.0
+                time.sleep(0.05)
+        except RedisError:
+            return self._login_and_store()
+
+    def _login_and_store(self) -> Tuple[Optional[str], float]:
+        """
+        Log in to SlaughterERP and keep the new token in process memory.
+
+        Returns:
+            Tuple[Optional[str], float]: The new token and its expiry, or (None, 0).
+        """
+        try:
+            auth_data = {
+                'username': settings.MICROSERVICE_CONFIGS['SlaughterERP']['username'],
+                'password': settings.MICROSERVICE_CONFIGS['SlaughterERP']['password']
+            }
+            response = get_http_client().post(settings.MICROSERVICE_URL['login'], json=auth_data)
+            if 199 <= response.status_code <= 299:
+                token = response.json()['access']
+                expires_at = self._decode_expiry(token)
+                self._set_token(token, expires_at)
+                return token, expires_at
+        except (requests.RequestException, KeyError, ValueError):
+            pass
+        return None, 0.0
+
+    def _ensure_subscriber(self) -> None:
+        """Start the background thread that listens for tokens published by other workers."""
+        if self._subscriber and self._subscriber.is_alive():
+            return
+        with self._lock:
+            if self._subscriber and self._subscriber.is_alive():
+                return
+            self._subscriber = threading.Thread(target=self._listen, name='service-token-subscriber', daemon=True)
+            self._subscriber.start()
+
+    def _listen(self) -> None:
+        """Adopt every token published on the Redis channel until the connection drops."""
+        try:
+            pubsub = get_redis_connection('default').pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(self.CHANNEL.format(username=self.username))
+            for message in pubsub.listen():
+                token = message['data'].decode() if isinstance(message['data'], bytes) else message['data']
+                self._set_token(token, self._decode_expiry(token))
+        except (RedisError, NotImplementedError):
+            # The next refresh restarts the subscriber
+            return
+
+
+_manager: Optional[ServiceTokenManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_token_manager() -> ServiceTokenManager:
+    """
+    Return the process-wide service token manager, built from `SERVICE_TOKEN` settings.
+
+    Returns:
+        ServiceTokenManager: The shared manager.
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                config = getattr(settings, 'SERVICE_TOKEN', {})
+                _manager = ServiceTokenManager(
+                    refresh_margin=config.get('REFRESH_MARGIN', 60.0),
+                    lock_timeout=config.get('LOCK_TIMEOUT', 10.0),
+                )
+    return _manager
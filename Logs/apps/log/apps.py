@@ -1,3 +1,4 @@
+import pymongo
 from django.apps import AppConfig
 from django.conf import settings
 from mongoengine import connect
@@ -10,3 +11,16 @@ class LogConfig(AppConfig):
     def ready(self):
         mongo_settings = settings.MONGODB_SETTINGS
         connect(**mongo_settings)
+
+        if not getattr(settings, 'MONGO_ENSURE_INDEXES', True):
+            return
+
+        from apps.log.ingest import ensure_retention_index
+        from apps.log.latency import ensure_latency_indexes
+        try:
+            # bounded, so an unreachable server does not stall every manage.py command
+            with pymongo.timeout(getattr(settings, 'MONGO_ENSURE_INDEXES_TIMEOUT', 5.0)):
+                ensure_retention_index()
+                ensure_latency_indexes()
+        except Exception as e:
+            print(f"Failed to ensure logs indexes: {str(e)}")
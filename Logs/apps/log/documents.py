@@ -1,10 +1,12 @@
-import mongoengine as mongo
+import datetime
 
-from utils.id_generator import id_generator
+import mongoengine as mongo
+from bson import ObjectId
 
 
 class Logs(mongo.Document):
-    id = mongo.StringField(primary_key=True, default=lambda: id_generator('Logs'))
+    # time-ordered ids, generated without a round trip to the SQL counter
+    id = mongo.StringField(primary_key=True, default=lambda: str(ObjectId()))
 
     status_code = mongo.IntField()
     response = mongo.StringField()
@@ -14,3 +16,30 @@ class Logs(mongo.Document):
     method = mongo.StringField()
     request_header = mongo.StringField()
     request_session = mongo.StringField()
+    duration_ms = mongo.FloatField()
+    route = mongo.StringField()
+    service = mongo.StringField()
+    created_at = mongo.DateTimeField(default=datetime.datetime.utcnow)
+
+    # the TTL index on created_at is managed by apps.log.ingest.ensure_retention_index
+    meta = {'auto_create_index': False}
+
+
+class LatencyAggregate(mongo.Document):
+    """per-minute request counts and latency sketch of one (service, route, method, status class)"""
+
+    service = mongo.StringField()
+    route = mongo.StringField()
+    method = mongo.StringField()
+    status_class = mongo.StringField()
+    minute = mongo.DateTimeField()
+
+    count = mongo.IntField(default=0)
+    error_count = mongo.IntField(default=0)
+    duration_sum = mongo.FloatField(default=0)
+    duration_max = mongo.FloatField(default=0)
+    # sketch bucket index -> number of requests, see apps.log.latency.LatencySketch
+    buckets = mongo.DictField()
+
+    # indexes are managed by apps.log.latency.ensure_latency_indexes
+    meta = {'collection': 'latency_aggregates', 'auto_create_index': False}
@@ -0,0 +1,28 @@
+from pymongo.errors import OperationFailure
+
+
+def ensure_ttl_index(collection, name, field, retention_days):
+    """
+    create the `name` TTL index on `field`, update its expiry when `retention_days` changed
+    and drop it when retention is disabled (0). returns whether the index is kept
+    """
+
+    indexes = collection.index_information()
+
+    if not retention_days:
+        if name in indexes:
+            collection.drop_index(name)
+        return False
+
+    expire_after = int(retention_days * 24 * 60 * 60)
+    current = indexes.get(name)
+    if current is None:
+        collection.create_index([(field, 1)], name=name, expireAfterSeconds=expire_after)
+    elif current.get('expireAfterSeconds') != expire_after:
+        try:
+            collection.database.command('collMod', collection.name,
+                                        index={'name': name, 'expireAfterSeconds': expire_after})
+        except OperationFailure:
+            collection.drop_index(name)
+            collection.create_index([(field, 1)], name=name, expireAfterSeconds=expire_after)
+    return True
@@ -0,0 +1,97 @@
+import datetime
+import json
+
+from bson import ObjectId
+from django.conf import settings
+from pymongo.errors import BulkWriteError
+
+from apps.log.documents import Logs
+from apps.log.indexes import ensure_ttl_index
+from apps.log.latency import record_latency
+
+
+# fields accepted from clients; id and created_at are always set by the service
+INGEST_FIELDS = ('status_code', 'response', 'token_payload', 'url', 'request_body', 'method',
+                 'request_header', 'request_session', 'duration_ms', 'route', 'service')
+
+RETENTION_INDEX_NAME = 'created_at_ttl'
+
+
+def parse_ingest_body(body, content_type):
+    """parse an NDJSON body, a JSON array or a {"data": [...]} object into a list of records"""
+
+    text = body.decode('utf-8')
+    if 'ndjson' in content_type or 'jsonlines' in content_type:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get('data')
+    if not isinstance(data, list):
+        raise ValueError('body must be NDJSON, a JSON array or an object with a data list')
+    return data
+
+
+def build_log_document(record, created_at):
+    """build the raw mongo document of one log record, json-encoding structured values"""
+
+    if not isinstance(record, dict):
+        raise ValueError('record must be an object')
+
+    document = {'_id': str(ObjectId()), 'created_at': created_at}
+    for name in INGEST_FIELDS:
+        value = record.get(name)
+        if value is None:
+            continue
+        if name == 'status_code':
+            document[name] = int(value)
+        elif name == 'duration_ms':
+            document[name] = float(value)
+        else:
+            document[name] = value if isinstance(value, str) else json.dumps(value, default=str)
+    return document
+
+
+def insert_logs(records, chunk_size=1000):
+    """
+    write log records with one unordered insert_many per chunk and fold the written ones into
+    the latency aggregates
+
+    returns the number of inserted records and the error message per record index
+    """
+
+    collection = Logs._get_collection()
+    created_at = datetime.datetime.utcnow()
+    inserted, errors = 0, {}
+
+    pending = []
+    for idx, record in enumerate(records):
+        try:
+            pending.append((idx, build_log_document(record, created_at)))
+        except (TypeError, ValueError) as e:
+            errors[idx] = str(e)
+
+    for start in range(0, len(pending), max(1, chunk_size)):
+        chunk = pending[start:start + chunk_size]
+        failed = set()
+        try:
+            result = collection.insert_many([document for _, document in chunk], ordered=False)
+            inserted += len(result.inserted_ids)
+        except BulkWriteError as e:
+            inserted += e.details.get('nInserted', 0)
+            for write_error in e.details.get('writeErrors', []):
+                failed.add(write_error['index'])
+                errors[chunk[write_error['index']][0]] = write_error.get('errmsg', 'failed to write record')
+        record_latency(document for position, (_, document) in enumerate(chunk) if position not in failed)
+
+    return inserted, dict(sorted(errors.items()))
+
+
+def ensure_retention_index():
+    """create the created_at TTL index, or update its expiry when LOGS_RETENTION_DAYS changed"""
+
+    collection = Logs._get_collection()
+    retention_days = getattr(settings, 'LOGS_RETENTION_DAYS', 30)
+    if not ensure_ttl_index(collection, RETENTION_INDEX_NAME, 'created_at', retention_days):
+        # retention disabled, keep a plain index for ordering by created_at
+        collection.create_index([('created_at', -1)], name='created_at')
@@ -0,0 +1,181 @@
+import datetime
+import math
+
+from django.conf import settings
+from pymongo import UpdateOne
+
+from apps.log.documents import LatencyAggregate
+from apps.log.indexes import ensure_ttl_index
+
+
+class LatencySketch:
+    """
+    mergeable quantile sketch with a bounded relative error (DDSketch style)
+
+    every duration is counted in the logarithmic bucket ceil(log(duration) / log(gamma)), so any
+    quantile read back is within `relative_accuracy` of the true value. sketches of different
+    minutes merge by adding bucket counts, which is what lets mongo update them with $inc.
+    """
+
+    # durations below this (in ms) share bucket 0
+    MIN_DURATION = 0.01
+
+    def __init__(self, relative_accuracy=0.01, buckets=None):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {int(key): count for key, count in (buckets or {}).items()}
+
+    def key(self, duration):
+        """bucket index of a duration in ms"""
+        if duration <= self.MIN_DURATION:
+            return 0
+        return max(1, math.ceil(math.log(duration / self.MIN_DURATION) / self.log_gamma))
+
+    def value(self, key):
+        """representative duration of a bucket"""
+        if key <= 0:
+            return self.MIN_DURATION
+        return self.MIN_DURATION * 2 * self.gamma ** key / (self.gamma + 1)
+
+    def add(self, duration, count=1):
+        key = self.key(duration)
+        self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def merge(self, buckets):
+        for key, count in buckets.items():
+            key = int(key)
+            self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def quantile(self, q):
+        """duration at quantile q (0..1), or None if the sketch is empty"""
+        total = sum(self.buckets.values())
+        if not total:
+            return None
+        rank = q * (total - 1)
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return round(self.value(key), 3)
+        return round(self.value(max(self.buckets)), 3)
+
+
+def status_class(status_code):
+    """'2xx', '4xx', ... of a status code"""
+    return f'{int(status_code) // 100}xx' if status_code else 'unknown'
+
+
+def record_latency(documents):
+    """
+    fold a batch of ingested log documents into the per-minute aggregates
+
+    the batch is grouped in memory first, so each (service, route, method, status class, minute)
+    costs one upserted $inc no matter how many records it holds.
+    """
+
+    sketch = LatencySketch(getattr(settings, 'LATENCY_SKETCH_ACCURACY', 0.01))
+    groups = {}
+    for document in documents:
+        duration = document.get('duration_ms')
+        if duration is None:
+            continue
+
+        created_at = document['created_at']
+        key = (
+            document.get('service') or 'unknown',
+            document.get('route') or 'unknown',
+            document.get('method') or 'unknown',
+            status_class(document.get('status_code')),
+            created_at.replace(second=0, microsecond=0),
+        )
+        group = groups.setdefault(key, {'count': 0, 'error_count': 0, 'duration_sum': 0.0, 'duration_max': 0.0,
+                                        'buckets': {}})
+        group['count'] += 1
+        group['error_count'] += 1 if (document.get('status_code') or 0) >= 500 else 0
+        group['duration_sum'] += duration
+        group['duration_max'] = max(group['duration_max'], duration)
+        bucket = str(sketch.key(duration))
+        group['buckets'][bucket] = group['buckets'].get(bucket, 0) + 1
+
+    if not groups:
+        return 0
+
+    operations = []
+    for (service, route, method, status_class_, minute), group in groups.items():
+        increments = {'count': group['count'], 'error_count': group['error_count'],
+                      'duration_sum': group['duration_sum']}
+        increments.update({f'buckets.{bucket}': count for bucket, count in group['buckets'].items()})
+        operations.append(UpdateOne(
+            {'service': service, 'route': route, 'method': method, 'status_class': status_class_, 'minute': minute},
+            {'$inc': increments, '$max': {'duration_max': group['duration_max']}},
+            upsert=True,
+        ))
+
+    LatencyAggregate._get_collection().bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+def query_latency(start, end, filters=None, group_by=None, quantiles=(0.5, 0.95, 0.99)):
+    """
+    latency statistics over [start, end) from the per-minute aggregates
+
+    returns one row per combination of the `group_by` fields (a single row when empty) with the
+    request count, error count, mean, max and the requested quantiles in ms.
+    """
+
+    query = {'minute': {'$gte': start, '$lt': end}}
+    query.update({name: value for name, value in (filters or {}).items() if value})
+    group_by = list(group_by or [])
+
+    rows = {}
+    accuracy = getattr(settings, 'LATENCY_SKETCH_ACCURACY', 0.01)
+    projection = {'_id': 0, 'count': 1, 'error_count': 1, 'duration_sum': 1, 'duration_max': 1, 'buckets': 1,
+                  **{name: 1 for name in group_by}}
+    for aggregate in LatencyAggregate._get_collection().find(query, projection):
+        key = tuple(aggregate.get(name) for name in group_by)
+        row = rows.get(key)
+        if row is None:
+            row = rows[key] = {'count': 0, 'error_count': 0, 'duration_sum': 0.0, 'duration_max': 0.0,
+                               'sketch': LatencySketch(accuracy)}
+        row['count'] += aggregate.get('count', 0)
+        row['error_count'] += aggregate.get('error_count', 0)
+        row['duration_sum'] += aggregate.get('duration_sum', 0.0)
+        row['duration_max'] = max(row['duration_max'], aggregate.get('duration_max', 0.0))
+        row['sketch'].merge(aggregate.get('buckets', {}))
+
+    results = []
+    for key, row in rows.items():
+        result = dict(zip(group_by, key))
+        result.update({
+            'count': row['count'],
+            'error_count': row['error_count'],
+            'mean_ms': round(row['duration_sum'] / row['count'], 3) if row['count'] else None,
+            'max_ms': round(row['duration_max'], 3),
+        })
+        for q in quantiles:
+            result[f'p{round(q * 100):g}_ms'] = row['sketch'].quantile(q)
+        results.append(result)
+
+    return sorted(results, key=lambda result: result['count'], reverse=True)
+
+
+def ensure_latency_indexes():
+    """create the lookup index of the aggregates and expire them after LATENCY_RETENTION_DAYS (0 keeps them)"""
+
+    collection = LatencyAggregate._get_collection()
+    collection.create_index(
+        [('service', 1), ('route', 1), ('method', 1), ('status_class', 1), ('minute', 1)],
+        name='aggregate_key', unique=True
+    )
+
+    ensure_ttl_index(collection, 'minute_ttl', 'minute', getattr(settings, 'LATENCY_RETENTION_DAYS', 90))
+
+
+def parse_window(value, default):
+    """parse an ISO datetime query value into naive UTC (naive values are taken as UTC), falling back to `default`"""
+    if not value:
+        return default
+    parsed = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed
@@ -1,3 +1,102 @@
-from django.test import TestCase
+import datetime
+import time
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+import jwt
+from django.test import SimpleTestCase, override_settings
+from pymongo.errors import OperationFailure
+
+from apps.log.indexes import ensure_ttl_index
+from apps.log.latency import parse_window
+from apps.log.views import LogsAPIView
+from utils.microservice.token_manager import ServiceTokenManager
+
+
+class ParseWindowTests(SimpleTestCase):
+
+    def test_offsets_are_converted_to_utc(self):
+        self.assertEqual(parse_window('2026-01-01T03:30:00+03:30', None), datetime.datetime(2026, 1, 1))
+        self.assertEqual(parse_window('2026-01-01T00:00:00Z', None), datetime.datetime(2026, 1, 1))
+
+    def test_naive_values_are_utc(self):
+        self.assertEqual(parse_window('2026-01-01T00:00:00', None), datetime.datetime(2026, 1, 1))
+
+    def test_missing_value_uses_the_default(self):
+        self.assertEqual(parse_window('', 'default'), 'default')
+
+
+class EnsureTtlIndexTests(SimpleTestCase):
+
+    def _collection(self, indexes):
+        collection = mock.Mock()
+        collection.name = 'latency'
+        collection.index_information.return_value = indexes
+        return collection
+
+    def test_index_is_created(self):
+        collection = self._collection({})
+        self.assertTrue(ensure_ttl_index(collection, 'minute_ttl', 'minute', 1))
+        collection.create_index.assert_called_once_with([('minute', 1)], name='minute_ttl', expireAfterSeconds=86400)
+
+    def test_unchanged_index_is_kept(self):
+        collection = self._collection({'minute_ttl': {'expireAfterSeconds': 86400}})
+        ensure_ttl_index(collection, 'minute_ttl', 'minute', 1)
+        collection.create_index.assert_not_called()
+        collection.database.command.assert_not_called()
+
+    def test_changed_retention_updates_the_expiry(self):
+        collection = self._collection({'minute_ttl': {'expireAfterSeconds': 86400}})
+        ensure_ttl_index(collection, 'minute_ttl', 'minute', 2)
+        collection.database.command.assert_called_once_with(
+            'collMod', 'latency', index={'name': 'minute_ttl', 'expireAfterSeconds': 172800})
+
+    def test_index_is_rebuilt_when_coll_mod_fails(self):
+        collection = self._collection({'minute_ttl': {'expireAfterSeconds': 86400}})
+        collection.database.command.side_effect = OperationFailure('collMod')
+        ensure_ttl_index(collection, 'minute_ttl', 'minute', 2)
+        collection.drop_index.assert_called_once_with('minute_ttl')
+        collection.create_index.assert_called_once_with([('minute', 1)], name='minute_ttl', expireAfterSeconds=172800)
+
+    def test_disabled_retention_drops_the_index(self):
+        collection = self._collection({'minute_ttl': {'expireAfterSeconds': 86400}})
+        self.assertFalse(ensure_ttl_index(collection, 'minute_ttl', 'minute', 0))
+        collection.drop_index.assert_called_once_with('minute_ttl')
+
+
+class LogsFilterTests(SimpleTestCase):
+    """filters sent by the mongo_index_advisor command of the other services"""
+
+    def _apply_filters(self, query_params):
+        view = LogsAPIView()
+        view.request = SimpleNamespace(query_params=query_params)
+        return view.apply_filters()
+
+    def test_advisor_filters_are_accepted(self):
+        query_params = {'service__exact': 'buy_orders', 'method__exact': 'GET', 'limit': '5'}
+        self.assertEqual(self._apply_filters(query_params),
+                         (True, {'service__exact': 'buy_orders', 'method__exact': 'GET'}))
+
+    def test_bare_field_names_are_rejected(self):
+        filter_status, _ = self._apply_filters({'service': 'buy_orders'})
+        self.assertFalse(filter_status)
+
+
+@override_settings(MICROSERVICE_URL={'login': 'http://erp/api/v1/auth/login'})
+class ServiceTokenManagerTests(SimpleTestCase):
+    """without a redis cache every worker logs in on its own and keeps the token in memory"""
+
+    def test_token_is_reused_until_it_nears_expiry(self):
+        token = jwt.encode({'exp': int(time.time()) + 3600}, 'secret', algorithm='HS256')
+        http_client = mock.Mock()
+        http_client.post.return_value = mock.Mock(status_code=200, json=lambda: {'access': token})
+        manager = ServiceTokenManager()
+
+        with mock.patch('utils.microservice.token_manager.get_http_client', return_value=http_client), \
+                mock.patch.object(manager, '_ensure_subscriber'):
+            self.assertEqual(manager.get_token(), token)
+            self.assertEqual(manager.get_token(), token)
+            manager.invalidate(token)
+            self.assertEqual(manager.get_token(), token)
+
+        self.assertEqual(http_client.post.call_count, 2)
@@ -1,6 +1,13 @@
+import datetime
+
+from django.conf import settings
+from django.http import JsonResponse
 from django.utils.decorators import method_decorator
+from rest_framework import status
 
 from apps.log.documents import Logs
+from apps.log.ingest import insert_logs, parse_ingest_body
+from apps.log.latency import parse_window, query_latency
 from apps.log.serializers import LogsSerializer, LogsSerializerPOST
 from utils.CustomAPIView.api_view import CustomAPIView
 from utils.swagger_utils.custom_swagger_generator import custom_swagger_generator
@@ -22,7 +29,7 @@ class LogsAPIView(CustomAPIView):
 
         self.model = Logs
         self.lookup_field = 'id'
-        self.ordering_fields = '-created_at__date'
+        self.ordering_fields = '-created_at'
 
         self.serializer_class = {
             'GET': LogsSerializer,
@@ -40,3 +47,51 @@ class LogsAPIView(CustomAPIView):
 
     def get_queryset(self):
         return Logs.objects()
+
+    def ingest(self, request, *args, **kwargs):
+        """bulk ingest of log records sent as NDJSON, a JSON array or a {"data": [...]} object"""
+
+        try:
+            records = parse_ingest_body(request.body, request.content_type or '')
+        except (UnicodeDecodeError, ValueError) as e:
+            return JsonResponse(data={'message': f'invalid body: {e}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not records:
+            return JsonResponse(data={'message': 'you must send at least one record'}, status=status.HTTP_400_BAD_REQUEST)
+
+        inserted, errors = insert_logs(records, chunk_size=getattr(settings, 'LOGS_INGEST_CHUNK_SIZE', 1000))
+
+        response_status = status.HTTP_200_OK
+        if errors:
+            response_status = status.HTTP_207_MULTI_STATUS if inserted else status.HTTP_400_BAD_REQUEST
+        return JsonResponse(data={'inserted': inserted, 'errors': errors}, status=response_status)
+
+
+    def latency(self, request, *args, **kwargs):
+        """
+        p50/p95/p99 latency over [start, end) read from the per-minute aggregates
+
+        query params: start, end (ISO datetimes, default the last hour), service, route, method,
+        status_class and group_by (comma separated subset of service, route, method, status_class)
+        """
+
+        dimensions = ('service', 'route', 'method', 'status_class')
+        group_by = [name for name in request.query_params.get('group_by', '').split(',') if name]
+        if set(group_by) - set(dimensions):
+            return JsonResponse(data={'message': f'group_by must be a subset of {", ".join(dimensions)}'},
+                                status=status.HTTP_400_BAD_REQUEST)
+
+        now = datetime.datetime.utcnow()
+        try:
+            end = parse_window(request.query_params.get('end'), now)
+            start = parse_window(request.query_params.get('start'), end - datetime.timedelta(hours=1))
+        except ValueError as e:
+            return JsonResponse(data={'message': f'invalid window: {e}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if start >= end:
+            return JsonResponse(data={'message': 'start must be before end'}, status=status.HTTP_400_BAD_REQUEST)
+
+        filters = {name: request.query_params.get(name) for name in dimensions}
+        data = query_latency(start, end, filters=filters, group_by=group_by)
+        return JsonResponse(data={'start': start.isoformat(), 'end': end.isoformat(), 'data': data},
+                            status=status.HTTP_200_OK)
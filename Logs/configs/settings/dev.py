@@ -50,6 +50,10 @@ CORS_ALLOWED_ORIGINS = [
 with open('configs/settings/jwt/public_key.pem', 'rb') as public_key_file:
     JWT_PUBLIC_KEY = public_key_file.read()
 
+JWT_PUBLIC_KEY_PATH = 'configs/settings/jwt/public_key.pem'
+JWT_KEY_RELOAD_INTERVAL = 5  # seconds between checks of the key file
+JWT_VERIFIED_TOKEN_CACHE_SIZE = 10000  # verified tokens kept per worker
+
 # JWT settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=1),  # Set token expiration time
@@ -93,6 +97,32 @@ MICROSERVICE_CONFIGS = {
     }
 
 }
+
+MICROSERVICE_FETCH_WORKERS = 8
+MICROSERVICE_HTTP = {
+    'POOL_SIZE': 20,
+    'CONNECT_TIMEOUT': 3.0,
+    'READ_TIMEOUT': 10.0,
+    'MAX_RETRIES': 2,
+    'BACKOFF_FACTOR': 0.2,
+    'CIRCUIT_FAILURE_THRESHOLD': 5,
+    'CIRCUIT_RESET_TIMEOUT': 30.0,
+}
+SERVICE_TOKEN = {
+    'REFRESH_MARGIN': 60.0,  # seconds before expiry at which the service token is refreshed
+    'LOCK_TIMEOUT': 10.0,
+}
+
+PAGINATION_MAX_LIMIT = 1000
+PAGINATION_COUNT_LIMIT = 10000
+STREAM_BATCH_SIZE = 500
+
+LOGS_RETENTION_DAYS = 30  # 0 keeps logs forever
+LOGS_INGEST_CHUNK_SIZE = 1000
+LATENCY_RETENTION_DAYS = 90  # per-minute latency aggregates, 0 keeps them forever
+LATENCY_SKETCH_ACCURACY = 0.01  # relative error of the latency quantiles
+MONGO_ENSURE_INDEXES = True  # create the retention and latency indexes at startup
+MONGO_ENSURE_INDEXES_TIMEOUT = 5.0  # seconds allowed for index creation
 #
 # # Redis Configs
 # CACHES = {
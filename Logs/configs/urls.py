@@ -49,4 +49,10 @@ urlpatterns = [
     path('api-docs/re-doc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
     path('api-docs/swagger.json', schema_view.without_ui(cache_timeout=0, ), name='schema-json'),
 
+    # bulk log ingestion
+    path('api/v1/logs/ingest/', LogsAPIView.as_view({'post': 'ingest'})),
+
+    # endpoint latency analytics
+    path('api/v1/logs/latency/', LogsAPIView.as_view({'get': 'latency'})),
+
   ] + router.urls
@@ -8,7 +8,12 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.request import Request
 from rest_framework.viewsets import ViewSet
 
+from django.conf import settings
+
 from utils.celery_utils import store_logs_in_background
+from utils.CustomAPIView.pagination import (
+    InvalidCursor, build_seek_query, decode_cursor, encode_cursor, get_sort_value, parse_limit, resolve_sort_key
+)
 
 
 class BaseMongoAPIView(GenericAPIView, ViewSet):
@@ -54,11 +59,15 @@ class BaseMongoAPIView(GenericAPIView, ViewSet):
         'SequenceField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
     }
 
+    # query params that shape the response and are never used as filters
+    reserved_query_params = ('limit', 'cursor', 'estimated_total', 'stream')
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.model = None  # MongoEngine document class
         self.lookup_field = 'id'  # Field to retrieve object by
         self.serializer_class = None  # Method-based serializers dictionary
+        self.next_cursor = None  # Cursor of the next page after a paginated query
 
     def get_query(self, query):
         """Retrieve a single object matching the query dictionary."""
@@ -71,21 +80,83 @@ class BaseMongoAPIView(GenericAPIView, ViewSet):
             return None
 
     def get_queryset_with_filters(self):
-        """Apply query parameters as filters and return ordered queryset."""
+        """Apply query parameters as filters and return ordered queryset, narrowed to one page when `limit` is given."""
         queryset = self.model.objects
         filter_status, filters_param = self.apply_filters()
         ordering_field = getattr(self, 'ordering_fields', 'id')
-        cache_data = cache.get(f'{self.model.__name__}:{str(filters_param)}')
+        query_data = cache.get(f'{self.model.__name__}:{str(filters_param)}')
 
-        if cache_data:
-            return True, cache_data
+        if not query_data:
+            if not filter_status:
+                return False, filters_param
 
-        elif filter_status:
             query_data = queryset.filter(**filters_param).order_by(ordering_field)
-
             cache.set(f'{self.model.__name__}:{str(filters_param)}', query_data, timeout=60*5)
-            return True, query_data
-        return False, filters_param
+
+        pagination_status, pagination = self.get_pagination_params()
+        if not pagination_status:
+            return False, pagination
+        if pagination:
+            try:
+                query_data = self.apply_keyset_pagination(query_data, ordering_field, pagination)
+            except InvalidCursor as e:
+                return False, {'message': str(e)}
+        return True, query_data
+
+    def get_pagination_params(self):
+        """Read the opt-in `limit` and `cursor` query params; returns (status, params or error)."""
+        query_params = self.request.query_params
+        if 'limit' not in query_params:
+            if 'cursor' in query_params:
+                return False, {'message': 'cursor requires the limit parameter'}
+            return True, {}
+
+        try:
+            limit = parse_limit(query_params.get('limit'), getattr(settings, 'PAGINATION_MAX_LIMIT', 1000))
+            cursor = query_params.get('cursor')
+            return True, {'limit': limit, 'cursor': decode_cursor(cursor) if cursor else None}
+        except InvalidCursor as e:
+            return False, {'message': str(e)}
+
+    def apply_keyset_pagination(self, queryset, ordering_field, pagination):
+        """Seek past the cursor on (ordering field, id) and fetch one extra row to detect a next page."""
+        fields, db_path, descending = resolve_sort_key(self.model, ordering_field)
+        id_ordering = '-id' if descending else 'id'
+        ordering = (id_ordering,) if db_path == '_id' else (ordering_field, id_ordering)
+
+        cursor = pagination.get('cursor')
+        if cursor:
+            if cursor.get('type') != 'keyset' or cursor.get('ordering') != ordering_field:
+                raise InvalidCursor('Cursor does not belong to this query')
+            queryset = queryset.filter(__raw__=build_seek_query(db_path, descending, cursor.get('value'), cursor.get('id')))
+
+        return queryset.order_by(*ordering).limit(pagination['limit'] + 1)
+
+    def fetch_page(self, queryset, pagination):
+        """Evaluate a paginated queryset, drop the extra row and set `next_cursor`."""
+        limit = pagination['limit']
+        documents = list(queryset)
+        self.next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            ordering_field = getattr(self, 'ordering_fields', 'id')
+            fields, _, _ = resolve_sort_key(self.model, ordering_field)
+            self.next_cursor = encode_cursor({
+                'type': 'keyset',
+                'ordering': ordering_field,
+                'value': get_sort_value(documents[-1], fields),
+                'id': documents[-1].pk,
+            })
+        return documents
+
+    def estimate_total(self):
+        """Cheap total: collection metadata when unfiltered, else a count capped at PAGINATION_COUNT_LIMIT."""
+        filter_status, filters_param = self.apply_filters()
+        if filter_status and not filters_param:
+            return self.model._get_collection().estimated_document_count()
+
+        count_limit = getattr(settings, 'PAGINATION_COUNT_LIMIT', 10000)
+        return self.model.objects.filter(**filters_param).limit(count_limit).count(with_limit_and_skip=True)
 
     def update_cache(self):
         """update cache after PATCH,POST,DELETE requests"""
@@ -103,13 +174,15 @@ class BaseMongoAPIView(GenericAPIView, ViewSet):
         fields = {name: {'type': field.__class__.__name__, '__class__': field}
                   for name, field in self.model._fields.items()}
         allowed_filters = self.generate_filters_param(fields)
-        for query, value in self.request.query_params.items():
+        query_params = {key: value for key, value in self.request.query_params.items()
+                        if key not in self.reserved_query_params}
+        for query, value in query_params.items():
             if query not in allowed_filters:
                 return False, {
                     'message': 'Invalid filter parameters received.',
                     'allowed_filter_parameters': allowed_filters
                 }
-        return True, {key: value for key, value in self.request.query_params.items()}
+        return True, query_params
 
     def generate_filters_param(self, fields, base_name=''):
         """Generate valid filter query parameters for MongoDB fields."""
@@ -1,4 +1,8 @@
-from django.http import JsonResponse
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
 from rest_framework import status
 
 from utils.CustomAPIView.base_api_view import BaseMongoAPIView
@@ -40,7 +44,8 @@ class GetMongoAPIView:
         return JsonResponse(data=response_data, status=status.HTTP_200_OK)
 
     def bulk_get(self, request, *args, **kwargs):
-        """Retrieve a filtered and ordered list of documents."""
+        """Retrieve a filtered and ordered list of documents; `limit`/`cursor` return one page with `next_cursor`."""
+        _, pagination = self.get_pagination_params()
         query_status, query_set = self.get_queryset_with_filters()
         if not query_status:
 
@@ -48,10 +53,82 @@ class GetMongoAPIView:
             self.store_logs(requests=request, response=response_data, response_status_code=status.HTTP_400_BAD_REQUEST)
             return JsonResponse(data=query_set, status=status.HTTP_400_BAD_REQUEST)
 
+        stream_format = self.get_stream_format()
+        if stream_format and pagination:
+            response_data = {'message': 'stream cannot be combined with limit or cursor'}
+            self.store_logs(requests=request, response=response_data, response_status_code=status.HTTP_400_BAD_REQUEST)
+            return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
+        if stream_format:
+            return self.stream_bulk_get(request, query_set, stream_format)
+
+        if pagination:
+            query_set = self.fetch_page(query_set, pagination)
+
         serializer = self.serializer_class['GET'](query_set, many=True)
 
         response_data = {'data': serializer.data}
+        if pagination:
+            response_data['next_cursor'] = self.next_cursor
+            if request.query_params.get('estimated_total', '').lower() in ('1', 'true', 'yes'):
+                response_data['estimated_total'] = self.estimate_total()
         self.store_logs(requests=request, response=response_data, response_status_code=status.HTTP_200_OK)
 
         return JsonResponse(data=response_data, status=status.HTTP_200_OK)
 
+    def get_stream_format(self):
+        """Return 'ndjson' or 'json' when `?stream=` asks for a streamed response, else None."""
+        value = self.request.query_params.get('stream', '').lower()
+        if value == 'ndjson':
+            return 'ndjson'
+        if value in ('1', 'true', 'yes', 'json'):
+            return 'json'
+        return None
+
+    def stream_bulk_get(self, request, query_set, stream_format):
+        """Stream all documents as NDJSON or a chunked JSON array, serializing one uncached batch at a time."""
+        batch_size = getattr(settings, 'STREAM_BATCH_SIZE', 500)
+        content_type = 'application/x-ndjson' if stream_format == 'ndjson' else 'application/json'
+        response = StreamingHttpResponse(
+            self._stream_rows(request, query_set.no_cache().batch_size(batch_size), stream_format, batch_size),
+            content_type=content_type,
+            status=status.HTTP_200_OK
+        )
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def _stream_rows(self, request, documents, stream_format, batch_size):
+        """Yield encoded chunks batch by batch and log a summary instead of the body when done."""
+        serializer_class = self.serializer_class['GET']
+        ndjson = stream_format == 'ndjson'
+        count = 0
+        completed = False
+        try:
+            if not ndjson:
+                yield '{"data": ['
+
+            batch = []
+            for document in documents:
+                batch.append(document)
+                if len(batch) < batch_size:
+                    continue
+                yield self._encode_batch(serializer_class(batch, many=True).data, ndjson, first=not count)
+                count += len(batch)
+                batch = []
+            if batch:
+                yield self._encode_batch(serializer_class(batch, many=True).data, ndjson, first=not count)
+                count += len(batch)
+
+            if not ndjson:
+                yield ']}'
+            completed = True
+        finally:
+            summary = {'stream': stream_format, 'count': count, 'completed': completed}
+            self.store_logs(requests=request, response=summary, response_status_code=status.HTTP_200_OK)
+
+    @staticmethod
+    def _encode_batch(rows, ndjson, first):
+        """Encode serialized rows as NDJSON lines or as array items."""
+        if ndjson:
+            return ''.join(json.dumps(row, cls=DjangoJSONEncoder) + '\n' for row in rows)
+        chunk = ', '.join(json.dumps(row, cls=DjangoJSONEncoder) for row in rows)
+        return chunk if first else ', ' + chunk
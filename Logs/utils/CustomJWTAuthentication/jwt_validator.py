@@ -1,52 +1,217 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
 import jwt
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
+from django.conf import settings
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 
 
+class PublicKeyProvider:
+    """
+    Loads the RS256 public key once and reloads it when the key file or the
+    `JWT_PUBLIC_KEY` setting changes.
+    """
+
+    def __init__(self, path: str, reload_interval: float = 5.0) -> None:
+        """
+        Initialize the provider without loading the key.
+
+        Args:
+            path: Path of the PEM public key file.
+            reload_interval: Minimum seconds between checks of the key file.
+        """
+        self.path = path
+        self.reload_interval = reload_interval
+        self.version = 0
+
+        self._key: Any = None
+        self._file_mtime: Optional[float] = None
+        self._setting_value: Any = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_key(self) -> Any:
+        """
+        Return the parsed public key, reloading it if its source changed.
+
+        Returns:
+            The RSA public key object.
+
+        Raises:
+            FileNotFoundError: If neither the key file nor the setting provides a key.
+        """
+        setting_value = getattr(settings, 'JWT_PUBLIC_KEY', None)
+        now = time.monotonic()
+        if self._key is not None and setting_value is self._setting_value and now - self._checked_at < self.reload_interval:
+            return self._key
+
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime = os.stat(self.path).st_mtime
+            except FileNotFoundError:
+                mtime = None
+
+            if self._key is not None and mtime == self._file_mtime and setting_value is self._setting_value:
+                return self._key
+
+            if mtime is not None:
+                with open(self.path, 'rb') as public_key_file:
+                    pem = public_key_file.read()
+            elif setting_value:
+                pem = setting_value.encode() if isinstance(setting_value, str) else setting_value
+            else:
+                raise FileNotFoundError(self.path)
+
+            self._key = load_pem_public_key(pem)
+            self._file_mtime = mtime
+            self._setting_value = setting_value
+            self.version += 1
+            return self._key
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of already-verified tokens, keyed by a SHA-256 hash of the token.
+
+    Entries are evicted once their `exp` claim has passed, so a hit never returns
+    the payload of an expired token.
+    """
+
+    def __init__(self, max_size: int = 10000) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of tokens kept.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Tuple[Dict[str, Any], float, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(token: str) -> str:
+        """Return the cache key for a token."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str, key_version: int) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached payload of a token verified with the current key.
+
+        Args:
+            token: The raw JWT.
+            key_version: Version of the public key currently in use.
+
+        Returns:
+            Optional[Dict[str, Any]]: A copy of the payload, or None on a miss.
+        """
+        token_hash = self._hash(token)
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is not None:
+                payload, expires_at, version = entry
+                if version == key_version and expires_at > time.time():
+                    self._entries.move_to_end(token_hash)
+                    self.hits += 1
+                    return dict(payload)
+                del self._entries[token_hash]
+            self.misses += 1
+        return None
+
+    def set(self, token: str, payload: Dict[str, Any], key_version: int) -> None:
+        """
+        Store the payload of a freshly verified token.
+
+        Args:
+            token: The raw JWT.
+            payload: The verified payload.
+            key_version: Version of the public key the token was verified with.
+        """
+        expires_at = payload.get('exp')
+        if not expires_at or self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[self._hash(token)] = (dict(payload), float(expires_at), key_version)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+public_key_provider = PublicKeyProvider(
+    path=getattr(settings, 'JWT_PUBLIC_KEY_PATH', 'configs/settings/jwt/public_key.pem'),
+    reload_interval=getattr(settings, 'JWT_KEY_RELOAD_INTERVAL', 5.0),
+)
+verified_token_cache = VerifiedTokenCache(max_size=getattr(settings, 'JWT_VERIFIED_TOKEN_CACHE_SIZE', 10000))
+
+
 class CustomJWTAuthentication(JWTAuthentication):
-    def authenticate(self, request):
+    """
+    Custom JWT authentication class that supports token retrieval from cookies or Authorization header.
+    Validates JWT using a public key and attaches the payload to the request.
+    Tokens that were already verified are served from an in-process cache until they expire.
+    """
+
+    def authenticate(self, request) -> Optional[Tuple[None, str]]:
+        """
+        Authenticate the request by extracting and validating a JWT from cookies or Authorization header.
+
+        Args:
+            request: The incoming HTTP request.
 
-        # # Try to get token from headers Authorization param
-        # auth_header = request.headers.get("Authorization")
-        #
-        # if not auth_header or not auth_header.startswith("Bearer "):
-        #     return None  # Let unauthenticated requests fall back to other auth classes (if any)
-        #
-        # token = auth_header.split(" ")[1]
+        Returns:
+            Optional[Tuple[None, str]]: A tuple of (None, token) if authentication succeeds, else None.
 
-        # Try to get token from cookie first
+        Raises:
+            AuthenticationFailed: If the token is invalid, expired, or missing required claims.
+        """
+        # Attempt to retrieve token from cookies first
         token = request.COOKIES.get('access_token')
 
         # Fallback to Authorization header if cookie is not present
         if not token:
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
+            auth_header = request.headers.get('Authorization')
+            if not auth_header or not auth_header.startswith('Bearer '):
                 return None
-            token = auth_header.split(" ")[1]
-            # return None
+            token = auth_header.split(' ')[1]
 
         try:
-            with open('configs/settings/jwt/public_key.pem', 'rb') as public_key_file:
-                JWT_PUBLIC_KEY = public_key_file.read()
+            # Load public key for JWT verification (parsed once, reloaded on change)
+            public_key = public_key_provider.get_key()
 
-            payload = jwt.decode(token, JWT_PUBLIC_KEY, algorithms=["RS256"])
+            # Reuse a previous verification of the same token when possible
+            payload = verified_token_cache.get(token, public_key_provider.version)
+            if payload is None:
+                # Decode and verify JWT
+                payload = jwt.decode(token, public_key, algorithms=['RS256'])
 
-            user_id = payload.get("user_id")
-            if not user_id:
-                raise AuthenticationFailed("Invalid token: no user_id found")
+                # Validate user_id in payload
+                if not payload.get('user_id'):
+                    raise AuthenticationFailed('Invalid token: user_id not found')
 
-            # Optionally fetch user (if needed for authentication)
-            # try:
-            #     user = User.objects.get(id=user_id)
-            # except User.DoesNotExist:
-            #     raise AuthenticationFailed("User not found")
+                verified_token_cache.set(token, payload, public_key_provider.version)
 
-            # Attach payload for future use
+            # Attach payload to request for downstream use
             request.user_payload = payload
 
             return None, token
 
         except jwt.ExpiredSignatureError:
-            raise AuthenticationFailed("Token has expired")
+            raise AuthenticationFailed('Token has expired')
         except jwt.InvalidTokenError:
-            raise AuthenticationFailed("Invalid token")
+            raise AuthenticationFailed('Invalid token')
+        except FileNotFoundError:
+            raise AuthenticationFailed('Public key file not found')
@@ -1,4 +1,5 @@
 import mongoengine
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union, Type
 
 import requests
@@ -7,7 +8,8 @@ from django.conf import settings
 from utils.CustomSerializer.data_serializer import DataSerializer
 from utils.CustomSerializer.field_value_parser import FieldValueProcessor
 from utils.CustomSerializer.meta_config import MetaConfig
-from utils.microservice.auth import load_slaughter_erp_token
+from utils.microservice.auth import invalidate_slaughter_erp_token, load_slaughter_erp_token
+from utils.microservice.http_client import get_http_client
 
 
 class CustomSerializer:
@@ -79,34 +81,60 @@ class CustomSerializer:
         self.parse_objects()
 
     def parse_objects(self) -> None:
-        """Parses queryset into serialized data."""
-        self.data = [self.to_represent(self.serializer.correct_dict(self.serializer.to_dict(obj))) for obj in self.queryset]
+        """Parses queryset into serialized data, resolving other-service fields for all rows at once."""
+        rows = [self.serializer.correct_dict(self.serializer.to_dict(obj)) for obj in self.queryset]
+        self.data = self.to_represent_many(rows)
         if not self.many and self.data:
             self.data = self.data[0]
 
     def to_represent(self, validated_data):
-        validated_data = self._get_date_from_other_service(validated_data)
-        return validated_data
+        return self.to_represent_many([validated_data])[0]
 
-    def _get_date_from_other_service(self, validated_date):
+    def to_represent_many(self, rows):
+        """Two-phase resolve: collect every referenced url, fetch each one once, stitch results back."""
+        microservice_url = getattr(settings, 'MICROSERVICE_URL', {})
+        if not microservice_url:
+            return rows
+
+        urls = set()
+        for row in rows:
+            self._collect_urls_from_other_service(row, microservice_url, urls)
+
+        if not urls:
+            return rows
+
+        responses = self._get_many_data(urls)
+        for row in rows:
+            self._get_date_from_other_service(row, microservice_url, responses)
+
+        return rows
+
+    def _collect_urls_from_other_service(self, validated_date, microservice_url, urls):
+        for key, item in validated_date.items():
+
+            if isinstance(item, dict):
+                self._collect_urls_from_other_service(item, microservice_url, urls)
+            elif key in microservice_url.keys():
+                urls.add(f'{microservice_url[key]}{item}/')
+
+    def _get_date_from_other_service(self, validated_date, microservice_url, responses):
         for key, item in validated_date.items():
 
             if isinstance(item, dict):
-                new_item = self._get_date_from_other_service(item)
+                new_item = self._get_date_from_other_service(item, microservice_url, responses)
             else:
-                new_item = self._get_single_data_from_other_service(key, item)
+                new_item = self._get_single_data_from_other_service(key, item, microservice_url, responses)
 
             validated_date[key] = new_item
 
         return validated_date
 
-    def _get_single_data_from_other_service(self, key, value):
-
-        microservice_url = settings.MICROSERVICE_URL
+    @staticmethod
+    def _get_single_data_from_other_service(key, value, microservice_url, responses):
 
         if key in microservice_url.keys():
 
-            res = self._get_data(f'{microservice_url[key]}{value}/')
+            res = responses.get(f'{microservice_url[key]}{value}/')
 
             if res:
                 return res
@@ -115,13 +143,30 @@ class CustomSerializer:
 
         return value
 
+    def _get_many_data(self, urls):
+        """Fetch each unique url once on a bounded thread pool."""
+        token = load_slaughter_erp_token()
+
+        if not token:
+            return {url: {'message': f'invalid token for get data from [{url}]'} for url in urls}
+
+        max_workers = max(1, min(len(urls), getattr(settings, 'MICROSERVICE_FETCH_WORKERS', 8)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(urls, executor.map(lambda url: self._get_data(url, token), urls)))
+
     @staticmethod
-    def _get_data(url):
+    def _get_data(url, token=None):
 
-        token = load_slaughter_erp_token()
+        token = token or load_slaughter_erp_token()
 
         if token:
-            res = requests.get(url, headers={'Authorization': f'Bearer {token}'})
+            try:
+                res = get_http_client().get(url, headers={'Authorization': f'Bearer {token}'})
+            except requests.RequestException:
+                return None
+
+            if res.status_code == 401:
+                invalidate_slaughter_erp_token(token)
 
             if res.status_code in range(199, 299):
                 return res.json()
@@ -1,35 +1,30 @@
-import requests
-from django.conf import settings
+from typing import Optional
 
+from utils.microservice.token_manager import get_token_manager
 
-def load_slaughter_erp_token():
 
-    with open('configs\\settings\\jwt\\token.txt', 'r') as fd:
-        token = fd.read()
-        fd.close()
+def load_slaughter_erp_token() -> Optional[str]:
+    """
+    Return the Slaughter ERP service token.
 
-    res = requests.get(settings.MICROSERVICE_URL['test_token'], headers={'Authorization': f'Bearer {token}'})
+    The token is served from process memory and only refreshed shortly before it expires,
+    so steady-state calls make no network round trips.
 
-    if res.status_code in range(199, 299):
-        return token
-    else:
+    Returns:
+        Optional[str]: The valid JWT token if available, else None.
+    """
+    return get_token_manager().get_token()
 
-        username = settings.MICROSERVICE_CONFIGS['SlaughterERP']['username']
-        password = settings.MICROSERVICE_CONFIGS['SlaughterERP']['password']
 
-        post_request_data = {
-            "username": username,
-            "password": password
-        }
+def invalidate_slaughter_erp_token(token: Optional[str] = None) -> None:
+    """
+    Discard a service token that Slaughter ERP rejected so the next call logs in again.
 
-        res = requests.post(settings.MICROSERVICE_URL['login'], json=post_request_data)
+    Args:
+        token: The rejected token.
+    """
+    get_token_manager().invalidate(token)
 
-        if res.status_code in range(199, 299):
-            with open('configs\\settings\\jwt\\token.txt', 'w') as fd:
-                fd.write(res.json()['access'])
-                fd.close()
 
-            return res.json()['access']
-
-        else:
-            return None
+if __name__ == '__main__':
+    load_slaughter_erp_token()
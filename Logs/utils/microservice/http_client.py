@@ -0,0 +1,231 @@
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+
+# Methods that are safe to send again after the request may have reached the server
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+# Response statuses treated as transient target failures
+RETRY_STATUS_CODES = {502, 503, 504}
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised when a request is refused because the target's circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Per-target circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests fail fast
+    for `reset_timeout` seconds, after which a single trial request is let through.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """
+        Initialize the breaker in the closed state.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds to wait before allowing a trial request.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        # Start of the trial request while half-open, None otherwise
+        self._probe_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent to the target.
+
+        Once the circuit has been open for `reset_timeout` seconds it is half-open: exactly
+        one trial request is let through, and the others keep failing fast until it
+        succeeds or fails. A trial that never reports back is replaced after another
+        `reset_timeout`.
+
+        Returns:
+            bool: False while the circuit is open or a trial request is running.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if self._probe_started_at is not None:
+                if now - self._probe_started_at < self.reset_timeout:
+                    return False
+            elif now - self._opened_at < self.reset_timeout:
+                return False
+            self._probe_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure and open the circuit once the threshold is reached or the trial request failed."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold or self._probe_started_at is not None:
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+
+
+class ServiceHTTPClient:
+    """
+    Shared HTTP client for service-to-service calls.
+
+    Wraps a pooled `requests.Session` with connect/read timeouts, bounded retries with
+    jittered exponential backoff and a per-target circuit breaker.
+    """
+
+    def __init__(self, pool_size: int = 20, connect_timeout: float = 3.0, read_timeout: float = 10.0,
+                 max_retries: int = 2, backoff_factor: float = 0.2, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0) -> None:
+        """
+        Initialize the client and its connection pool.
+
+        Args:
+            pool_size: Maximum keep-alive connections kept per target host.
+            connect_timeout: Seconds to wait for a TCP connection.
+            read_timeout: Seconds to wait for the response.
+            max_retries: Retries after the first attempt for transient failures.
+            backoff_factor: Base backoff in seconds, doubled on each retry.
+            failure_threshold: Consecutive failures that open a target's circuit.
+            reset_timeout: Seconds a circuit stays open before a trial request.
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+
+    def _get_breaker(self, service: str) -> CircuitBreaker:
+        """
+        Return the circuit breaker for a target, creating it on first use.
+
+        Args:
+            service: Target host (netloc).
+
+        Returns:
+            CircuitBreaker: The target's breaker.
+        """
+        with self._breakers_lock:
+            breaker = self._breakers.get(service)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[service] = breaker
+            return breaker
+
+    def _sleep_before_retry(self, attempt: int) -> None:
+        """
+        Sleep with full jitter before the next attempt.
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed.
+        """
+        time.sleep(random.uniform(0, self.backoff_factor * (2 ** attempt)))
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send an HTTP request through the shared session.
+
+        Args:
+            method: HTTP method.
+            url: Target URL.
+            **kwargs: Extra arguments passed to `requests.Session.request`.
+
+        Returns:
+            requests.Response: The final response.
+
+        Raises:
+            CircuitOpenError: If the target's circuit is open.
+            requests.RequestException: If the request still fails after all retries.
+        """
+        method = method.upper()
+        service = urlsplit(url).netloc
+        breaker = self._get_breaker(service)
+        kwargs.setdefault('timeout', self.timeout)
+
+        if not breaker.allow_request():
+            raise CircuitOpenError(f'Circuit open for {service}')
+
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                breaker.record_failure()
+
+                # Non-idempotent requests are only resent when they never reached the server
+                retryable = method in IDEMPOTENT_METHODS or isinstance(e, requests.ConnectTimeout)
+                if not retryable or attempt >= self.max_retries or not breaker.allow_request():
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    breaker.record_success()
+                    return response
+
+                breaker.record_failure()
+                if method not in IDEMPOTENT_METHODS or attempt >= self.max_retries or not breaker.allow_request():
+                    return response
+
+            self._sleep_before_retry(attempt)
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request. See `request`."""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request. See `request`."""
+        return self.request('POST', url, **kwargs)
+
+
+_client: Optional[ServiceHTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> ServiceHTTPClient:
+    """
+    Return the process-wide inter-service HTTP client, built from `MICROSERVICE_HTTP` settings.
+
+    Returns:
+        ServiceHTTPClient: The shared client.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                config = getattr(settings, 'MICROSERVICE_HTTP', {})
+                _client = ServiceHTTPClient(
+                    pool_size=config.get('POOL_SIZE', 20),
+                    connect_timeout=config.get('CONNECT_TIMEOUT', 3.0),
+                    read_timeout=config.get('READ_TIMEOUT', 10.0),
+                    max_retries=config.get('MAX_RETRIES', 2),
+                    backoff_factor=config.get('BACKOFF_FACTOR', 0.2),
+                    failure_threshold=config.get('CIRCUIT_FAILURE_THRESHOLD', 5),
+                    reset_timeout=config.get('CIRCUIT_RESET_TIMEOUT', 30.0),
+                )
+    return _client
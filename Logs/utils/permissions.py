@@ -1,88 +1,234 @@
-from typing import List, Dict, Any
-from django.core.exceptions import ObjectDoesNotExist
+import threading
+import time
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
 from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.views import View
 from apps.core.models import ViewsRoles
 
 
+class RoleMatrixCache:
+    """
+    Process-local copy of the ViewsRoles table.
+
+    The (view_name, method) -> roles matrix is loaded once per worker and permission
+    decisions are memoized by (user roles, view_name, method), so the permission check
+    needs no database access on the hot path. Changes to ViewsRoles invalidate the
+    cache locally through model signals and in every other worker through Redis pub/sub.
+    """
+
+    CHANNEL = 'views_roles:invalidate'
+
+    # Upper bound for memoized decisions; the memo is cleared when it is exceeded
+    MAX_DECISIONS = 10000
+
+    # Safety net for missed broadcasts: the matrix is reloaded after this many seconds
+    MATRIX_TTL = 300
+
+    # Minimum seconds between attempts to restart a dead subscriber
+    SUBSCRIBER_RETRY_INTERVAL = 30
+
+    def __init__(self) -> None:
+        """Initialize an empty cache; the matrix is loaded on first use."""
+        self._matrix: Optional[Dict[Tuple[str, str], FrozenSet[str]]] = None
+        self._decisions: Dict[Tuple[FrozenSet[str], str, str], bool] = {}
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._subscriber: Optional[threading.Thread] = None
+        self._subscriber_started_at = 0.0
+
+    def _load_matrix(self) -> Dict[Tuple[str, str], FrozenSet[str]]:
+        """
+        Load the full role matrix from the database.
+
+        Returns:
+            Dict[Tuple[str, str], FrozenSet[str]]: Allowed roles per (view_name, method).
+        """
+        self._ensure_subscriber()
+        with self._lock:
+            if self._matrix is not None:
+                return self._matrix
+            generation = self._generation
+
+        matrix = {
+            (view_roles.view_name, view_roles.method): frozenset(view_roles.roles or [])
+            for view_roles in ViewsRoles.objects.all()
+        }
+
+        with self._lock:
+            # Discard the snapshot if an invalidation arrived while it was loading
+            if generation == self._generation:
+                self._matrix = matrix
+                self._loaded_at = time.monotonic()
+        return matrix
+
+    def get_roles(self, view_name: str, method: str) -> FrozenSet[str]:
+        """
+        Return the roles allowed for a view and HTTP method.
+        Creates a default entry with 'admin' role if none exists.
+
+        Args:
+            view_name: The name of the view class.
+            method: The HTTP method (GET, POST, etc).
+
+        Returns:
+            FrozenSet[str]: Allowed roles.
+        """
+        method = method.upper()
+        self._expire_if_stale()
+        matrix = self._matrix if self._matrix is not None else self._load_matrix()
+        roles = matrix.get((view_name, method))
+        if roles is not None:
+            return roles
+
+        view_roles, _ = ViewsRoles.objects.get_or_create(
+            view_name=view_name, method=method, defaults={'roles': ['admin']}
+        )
+        roles = frozenset(view_roles.roles or [])
+        with self._lock:
+            if self._matrix is not None:
+                self._matrix = {**self._matrix, (view_name, method): roles}
+        return roles
+
+    def is_allowed(self, user_roles: FrozenSet[str], view_name: str, method: str) -> bool:
+        """
+        Check whether any of the user's roles may call a view with a method.
+
+        Args:
+            user_roles: The user's role names.
+            view_name: The name of the view class.
+            method: The HTTP method.
+
+        Returns:
+            bool: True if access is allowed.
+        """
+        self._expire_if_stale()
+        key = (user_roles, view_name, method.upper())
+        decision = self._decisions.get(key)
+        if decision is None:
+            generation = self._generation
+            decision = bool(user_roles & self.get_roles(view_name, method))
+            with self._lock:
+                if generation == self._generation:
+                    if len(self._decisions) >= self.MAX_DECISIONS:
+                        self._decisions = {}
+                    self._decisions[key] = decision
+        return decision
+
+    def _expire_if_stale(self) -> None:
+        """Drop a matrix that is older than MATRIX_TTL."""
+        if self._matrix is not None and time.monotonic() - self._loaded_at > self.MATRIX_TTL:
+            self.invalidate(broadcast=False)
+
+    def invalidate(self, broadcast: bool = True) -> None:
+        """
+        Drop the cached matrix and decisions.
+
+        Args:
+            broadcast: Whether to tell the other workers to invalidate too.
+        """
+        with self._lock:
+            self._generation += 1
+            self._matrix = None
+            self._decisions = {}
+
+        if broadcast:
+            try:
+                get_redis_connection('default').publish(self.CHANNEL, 'invalidate')
+            except (RedisError, NotImplementedError):
+                pass
+
+    def _ensure_subscriber(self) -> None:
+        """Start the background thread that listens for invalidations from other workers."""
+        if self._subscriber and self._subscriber.is_alive():
+            return
+        with self._lock:
+            if self._subscriber and self._subscriber.is_alive():
+                return
+            if time.monotonic() - self._subscriber_started_at < self.SUBSCRIBER_RETRY_INTERVAL:
+                return
+            self._subscriber_started_at = time.monotonic()
+            self._subscriber = threading.Thread(target=self._listen, name='views-roles-subscriber', daemon=True)
+            self._subscriber.start()
+
+    def _listen(self) -> None:
+        """Invalidate the local cache on every broadcast until the connection drops."""
+        try:
+            pubsub = get_redis_connection('default').pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(self.CHANNEL)
+            for _ in pubsub.listen():
+                self.invalidate(broadcast=False)
+        except (RedisError, NotImplementedError):
+            # Broadcasts are missed until the subscriber restarts; MATRIX_TTL bounds staleness
+            return
+
+
+role_matrix_cache = RoleMatrixCache()
+
+
+@receiver(post_save, sender=ViewsRoles)
+@receiver(post_delete, sender=ViewsRoles)
+def invalidate_role_matrix_cache(sender, **kwargs) -> None:
+    """Invalidate the role matrix in every worker when a ViewsRoles row changes."""
+    role_matrix_cache.invalidate()
+
+
 def get_methods_roles(view_name: str, method: str) -> List[str]:
     """
-    Retrieves the allowed roles for a specific view and HTTP method from the ViewsRoles model.
-    If no roles are defined, creates a default entry with 'admin' role and saves it.
+    Retrieves allowed roles for a specific view and HTTP method from the cached role matrix.
+    Creates a default entry with 'admin' role if none exists.
 
     Args:
-        view_name (str): Name of the view class.
-        method (str): HTTP method (e.g., GET, POST).
+        view_name (str): The name of the view class.
+        method (str): The HTTP method (GET, POST, etc).
 
     Returns:
-        List[str]: List of roles allowed for the view and method.
-
-    Raises:
-        ObjectDoesNotExist: If the ViewsRoles object does not exist (handled internally).
+        List[str]: List of allowed roles.
     """
-    method = method.upper()  # Normalize HTTP method to uppercase
-    try:
-        # Attempt to retrieve the ViewsRoles object for the given view and method
-        view_roles = ViewsRoles.objects.get(view_name=view_name, method=method)
-        return view_roles.roles
-    except ObjectDoesNotExist:
-        # If no roles are defined, create a default entry with 'admin' role
-        view_roles = ViewsRoles(
-            view_name=view_name,
-            method=method,
-            roles=['admin']  # Default role; consider making this configurable
-        )
-        view_roles.save()
-        return view_roles.roles
+    return list(role_matrix_cache.get_roles(view_name, method))
 
 
 class RoleBasedPermission(BasePermission):
     """
-    A custom permission class that checks if the user's role from the JWT payload
-    is authorized to perform the requested HTTP method on the given view, based on
-    roles defined in the ViewsRoles model.
+    Permission class that checks user roles from JWT payload against allowed roles
+    defined for the view and HTTP method in ViewsRoles.
     """
 
     def has_permission(self, request: Any, view: View) -> bool:
         """
-        Determines if the user has permission to perform the requested action.
+        Checks if the user has permission to access the view.
 
         Args:
-            request: The incoming HTTP request containing the JWT payload.
+            request: Incoming HTTP request with JWT payload.
             view: The view instance being accessed.
 
         Returns:
-            bool: True if the user is authorized, False otherwise.
+            bool: True if permission is granted.
 
         Raises:
-            PermissionDenied: If the user lacks the required role or token data is invalid.
+            PermissionDenied: If user role is not authorized or token payload is missing.
         """
-        # Extract user payload from JWT
         payload: Dict[str, Any] = getattr(request, "user_payload", None)
         if not payload:
             raise PermissionDenied("Token payload not found.")
 
-        # Extract user roles from payload
         user_roles: List[Dict[str, str]] = payload.get("roles", [])
         if not user_roles:
             raise PermissionDenied("User role not found in token.")
 
-        # Get the HTTP method (e.g., GET, POST)
-        method: str = request.method.upper()
+        method = request.method.upper()
+        view_name = view.__class__.__name__
 
-        # Retrieve allowed roles for the view and method
-        view_name: str = view.__class__.__name__
-        allowed_roles: List[str] = get_methods_roles(view_name, method)
+        user_role_names = frozenset(role['role'] for role in user_roles)
+        if role_matrix_cache.is_allowed(user_role_names, view_name, method):
+            return True
 
-        # Check if any of the user's roles are in the allowed roles
-        user_role_names: List[str] = [role['role'] for role in user_roles]
-        for role in user_role_names:
-            if role in allowed_roles:
-                return True
-
-        # Raise PermissionDenied with a clear error message
         raise PermissionDenied(
-            f"Access denied: users with roles {user_role_names} "
+            f"Access denied: users with roles {sorted(user_role_names)} "
             f"are not authorized to perform the '{method}' operation on '{view_name}'."
-        )
\ No newline at end of file
+        )
@@ -1,6 +1,17 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.core'
+
+    def ready(self):
+        # Compile the filter schema of every document once, before the first request
+        from utils.CustomAPIView.filter_schema import compile_filter_schemas
+        compile_filter_schemas()
+
+        # Create the indexes declared in each document's meta (idempotent)
+        if getattr(settings, 'MONGO_ENSURE_INDEXES', True):
+            from utils.mongo_indexes import ensure_mongo_indexes
+            ensure_mongo_indexes(timeout=getattr(settings, 'MONGO_ENSURE_INDEXES_TIMEOUT', 5.0))
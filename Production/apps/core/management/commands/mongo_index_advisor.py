@@ -0,0 +1,308 @@
+import json
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import Resolver404, resolve
+from mongoengine.connection import get_db
+from mongoengine.errors import InvalidQueryError, LookUpError
+
+from utils.CustomAPIView.base_api_view import BaseMongoAPIView
+from utils.CustomAPIView.filter_schema import get_filter_schema
+from utils.microservice.auth import load_slaughter_erp_token
+from utils.microservice.http_client import get_http_client
+from utils.mongo_indexes import iter_documents
+
+# A sampled query: collection name, raw filter and sort as (field, direction) pairs
+Sample = Tuple[str, Dict[str, Any], List[Tuple[str, int]]]
+
+EQUALITY_OPERATORS = ('$eq', '$in')
+
+
+class Command(BaseCommand):
+    """
+    Report missing and unused MongoDB indexes from real query usage.
+
+    Recent list queries are sampled either from the request logs kept by the Logs service
+    (each logged URL is resolved to its view and its query parameters compiled with the
+    view's filter schema and ordering) or from the MongoDB profiler (`system.profile`).
+    Every distinct query shape is explained against the current indexes; shapes answered
+    by a collection scan, an in-memory sort or a high scan ratio (documents examined per
+    document returned) get an index suggestion in equality, sort, range order. Indexes
+    that no operation used since the server started are listed as unused.
+    """
+
+    help = 'Explain sampled queries against the current MongoDB indexes and report missing or unused ones'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--source', choices=('logs', 'profiler'), default='logs',
+                            help='Where to sample queries from')
+        parser.add_argument('--sample-size', type=int, default=1000, help='Number of recent requests/queries to sample')
+        parser.add_argument('--page-size', type=int, default=100, help='Limit applied when explaining a query')
+        parser.add_argument('--max-scan-ratio', type=float, default=10.0,
+                            help='Documents examined per document returned above which an index is missing')
+
+    def handle(self, *args, **options) -> None:
+        sample_size = max(1, options['sample_size'])
+        samples = list(self._sample_logs(sample_size) if options['source'] == 'logs'
+                       else self._sample_profiler(sample_size))
+        if not samples:
+            raise CommandError(f'No queries sampled from {options["source"]}')
+
+        db = get_db()
+        shapes: Dict[str, Sample] = {}
+        counts = Counter()
+        for sample in samples:
+            key = self._shape_key(sample)
+            counts[key] += 1
+            shapes.setdefault(key, sample)
+
+        self.stdout.write(f'{len(samples)} queries sampled, {len(shapes)} distinct shapes\n')
+        missing = 0
+        for key, count in counts.most_common():
+            collection_name, query, sort = shapes[key]
+            report = self._explain(db[collection_name], query, sort, options['page_size'])
+            needs_index = (
+                'COLLSCAN' in report['stages'] or 'SORT' in report['stages']
+                or report['scan_ratio'] > options['max_scan_ratio']
+            )
+            style = self.style.WARNING if needs_index else self.style.SUCCESS
+            self.stdout.write(style(
+                f'[{count}x] {collection_name} {key.split(" ", 1)[1]}\n'
+                f'      plan: {" > ".join(report["stages"])}'
+                f'{" (" + ", ".join(report["indexes"]) + ")" if report["indexes"] else ""}, '
+                f'examined {report["docs_examined"]} docs / {report["keys_examined"]} keys '
+                f'for {report["returned"]} returned, scan ratio {report["scan_ratio"]:.1f}'
+            ))
+            if needs_index:
+                missing += 1
+                suggestion = self._suggest_index(query, sort)
+                if suggestion:
+                    self.stdout.write(f'      suggested index: {json.dumps(dict(suggestion))}')
+
+        self.stdout.write('')
+        declared = {document._get_collection_name() for document in iter_documents() if document._meta.get('index_specs')}
+        unused = self._unused_indexes(db, {sample[0] for sample in samples} | declared)
+        for collection_name, name, since in unused:
+            self.stdout.write(self.style.WARNING(f'unused index {collection_name}.{name} (no operations since {since})'))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{missing} shape(s) without a suitable index, {len(unused)} unused index(es)'
+        ))
+
+    def _sample_logs(self, sample_size: int) -> Iterator[Sample]:
+        """
+        Sample recent GET list requests of this service from the Logs service.
+
+        Args:
+            sample_size: Number of log records to read.
+
+        Yields:
+            Sample: The query each list request ran.
+        """
+        try:
+            response = get_http_client().get(
+                settings.LOG_SERVER['query_endpoint_url'],
+                params={
+                    'service__exact': getattr(settings, 'SERVICE_NAME', ''),
+                    'method__exact': 'GET',
+                    'limit': sample_size,
+                },
+                headers={'Authorization': f'Bearer {load_slaughter_erp_token()}'},
+            )
+            response.raise_for_status()
+            records = response.json().get('data', [])
+        except (requests.RequestException, KeyError, ValueError) as e:
+            raise CommandError(f'Failed to read request logs: {e}')
+
+        for record in records:
+            sample = self._sample_from_url(record.get('url') or '')
+            if sample:
+                yield sample
+
+    @staticmethod
+    def _sample_from_url(url: str) -> Optional[Sample]:
+        """
+        Rebuild the MongoDB query of a logged list request.
+
+        Args:
+            url: The absolute URL of the request.
+
+        Returns:
+            Optional[Sample]: The query, or None when the URL is not a list endpoint of a
+            document view or its parameters no longer compile.
+        """
+        parts = urlsplit(url)
+        try:
+            match = resolve(parts.path)
+        except Resolver404:
+            return None
+        view_class = getattr(match.func, 'cls', None)
+        if view_class is None or not issubclass(view_class, BaseMongoAPIView) or match.kwargs:
+            return None
+
+        view = view_class()
+        if view.model is None:
+            return None
+        params = dict(parse_qsl(parts.query))
+        filters, errors = get_filter_schema(view.model).parse({
+            key: value for key, value in params.items() if key not in BaseMongoAPIView.RESERVED_QUERY_PARAMS
+        })
+        if errors or 'q' in params:
+            return None
+
+        ordering = getattr(view, 'ordering_fields', 'id')
+        try:
+            queryset = view.model.objects.filter(**filters).order_by(ordering)
+            query, sort = queryset._query, list(queryset._ordering or [])
+        except (InvalidQueryError, LookUpError):
+            return None
+        if 'limit' in params and sort and sort[-1][0] != '_id':
+            # Paginated requests break ties on _id in the direction of the sort key
+            sort.append(('_id', sort[0][1]))
+        return view.model._get_collection_name(), query, sort
+
+    @staticmethod
+    def _sample_profiler(sample_size: int) -> Iterator[Sample]:
+        """
+        Sample recent find commands recorded by the MongoDB profiler.
+
+        Profiling must be enabled on the database (`db.setProfilingLevel(1)`).
+
+        Args:
+            sample_size: Number of profiler entries to read.
+
+        Yields:
+            Sample: The profiled queries.
+        """
+        db = get_db()
+        entries = db['system.profile'].find(
+            {'command.find': {'$exists': True}}, {'command': 1}
+        ).sort('ts', -1).limit(sample_size)
+        for entry in entries:
+            command = entry['command']
+            if command['find'].startswith('system.'):
+                continue
+            yield command['find'], command.get('filter', {}), list((command.get('sort') or {}).items())
+
+    @staticmethod
+    def _shape(value: Any) -> Any:
+        """
+        Replace the values of a query by placeholders, keeping fields and operators.
+
+        Args:
+            value: A query or part of it.
+
+        Returns:
+            Any: The shape of the query.
+        """
+        if isinstance(value, dict):
+            return {key: Command._shape(item) for key, item in sorted(value.items())}
+        if isinstance(value, list):
+            return [Command._shape(item) for item in value[:1]]
+        return '?'
+
+    def _shape_key(self, sample: Sample) -> str:
+        """
+        Build the key grouping the samples of one query shape.
+
+        Args:
+            sample: The sampled query.
+
+        Returns:
+            str: Collection, filter shape and sort.
+        """
+        collection_name, query, sort = sample
+        return f'{collection_name} filter={json.dumps(self._shape(query), default=str)} sort={json.dumps(sort)}'
+
+    @staticmethod
+    def _explain(collection: Any, query: Dict[str, Any], sort: List[Tuple[str, int]], page_size: int) -> Dict[str, Any]:
+        """
+        Explain a query with execution statistics.
+
+        Args:
+            collection: The pymongo collection.
+            query: The raw filter.
+            sort: The sort keys.
+            page_size: Limit of the explained query.
+
+        Returns:
+            Dict[str, Any]: Plan stages, index names, examined and returned counts and scan ratio.
+        """
+        cursor = collection.find(query).limit(page_size)
+        if sort:
+            cursor = cursor.sort(sort)
+        explain = cursor.explain()
+
+        plan = explain.get('queryPlanner', {}).get('winningPlan', {})
+        plan = plan.get('queryPlan', plan)
+        stages, indexes = [], []
+        while plan:
+            stages.append(plan.get('stage', '?'))
+            if plan.get('indexName'):
+                indexes.append(plan['indexName'])
+            plan = plan.get('inputStage') or (plan.get('inputStages') or [None])[0]
+
+        stats = explain.get('executionStats', {})
+        docs_examined = stats.get('totalDocsExamined', 0)
+        returned = stats.get('nReturned', 0)
+        return {
+            'stages': list(reversed(stages)),
+            'indexes': indexes,
+            'docs_examined': docs_examined,
+            'keys_examined': stats.get('totalKeysExamined', 0),
+            'returned': returned,
+            'scan_ratio': docs_examined / max(returned, 1),
+        }
+
+    @staticmethod
+    def _suggest_index(query: Dict[str, Any], sort: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
+        """
+        Suggest an index for a query: equality fields, then sort keys, then range fields.
+
+        Args:
+            query: The raw filter.
+            sort: The sort keys.
+
+        Returns:
+            List[Tuple[str, int]]: The suggested index keys.
+        """
+        equality, ranges = [], []
+        for field, condition in query.items():
+            if field.startswith('$'):
+                continue
+            operators = [key for key in condition if key.startswith('$')] if isinstance(condition, dict) else []
+            if not operators or all(operator in EQUALITY_OPERATORS for operator in operators):
+                equality.append(field)
+            else:
+                ranges.append(field)
+
+        keys = [(field, 1) for field in equality if field != '_id']
+        keys += [(field, direction) for field, direction in sort if field not in equality]
+        keys += [(field, 1) for field in ranges if field not in dict(keys)]
+        return keys
+
+    @staticmethod
+    def _unused_indexes(db: Any, collection_names: set) -> List[Tuple[str, str, str]]:
+        """
+        List the indexes of some collections that served no operation.
+
+        Usage counters restart with the server, so a recently restarted server reports
+        too many unused indexes.
+
+        Args:
+            db: The pymongo database.
+            collection_names: Collections to check.
+
+        Returns:
+            List[Tuple[str, str, str]]: Collection, index name and counting start.
+        """
+        unused = []
+        for collection_name in sorted(collection_names):
+            for stats in db[collection_name].aggregate([{'$indexStats': {}}]):
+                if stats['name'] != '_id_' and not stats['accesses']['ops']:
+                    unused.append((collection_name, stats['name'], str(stats['accesses']['since'])))
+        return unused
@@ -1,3 +1,263 @@
-from django.test import TestCase
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+from pymongo.errors import ServerSelectionTimeoutError
+
+from apps.core.management.commands.mongo_index_advisor import Command as MongoIndexAdvisorCommand
+from utils.CustomAPIView.base_api_view import BaseMongoAPIView
+from utils.CustomAPIView.pagination import InvalidCursor
+from utils.CustomAPIView.patch_api_view import PatchMongoAPIView
+from utils.elasticsearch_outbox import ElasticsearchOutbox
+from utils.log_shipper import LOG_RECORDS, LogShipper
+from utils.microservice.http_client import CircuitBreaker
+from utils.mongo_indexes import ensure_mongo_indexes
+
+
+class _IndexedDocument:
+    """Stand-in for an indexed document class whose document 'gone' was deleted."""
+
+    _class_name = 'IndexedDocument'
+
+    @staticmethod
+    def objects(id__in):
+        return [SimpleNamespace(pk=document_id) for document_id in id__in if document_id != 'gone']
+
+
+class _Serializer:
+    def __init__(self, documents, many=False):
+        self.data = [{'id': document.pk} for document in documents]
+
+
+@override_settings(ELASTICSEARCH_CONNECTION=object())
+@mock.patch('utils.elasticsearch_outbox.get_reindex_target', return_value=None)
+class ElasticsearchOutboxSendTests(SimpleTestCase):
+    """Failure classification of the `_bulk` items sent by the outbox."""
+
+    def setUp(self):
+        self.outbox = ElasticsearchOutbox()
+        self.outbox.register({_IndexedDocument: (_Serializer, 'documents', dict)})
+
+    @staticmethod
+    def _bulk_errors(*errors):
+        return mock.patch('utils.elasticsearch_outbox.helpers.bulk', return_value=(0, list(errors)))
+
+    def test_delete_of_a_document_that_is_not_indexed_succeeds(self, _):
+        with self._bulk_errors({'delete': {'_index': 'documents', '_id': '1', 'status': 404, 'result': 'not_found'}}):
+            failed = self.outbox._send({'IndexedDocument:1': 'delete'})
+
+        self.assertEqual(failed, [])
+
+    def test_index_of_a_deleted_document_turns_into_a_delete_that_may_miss(self, _):
+        with self._bulk_errors({'delete': {'_index': 'documents', '_id': 'gone', 'status': 404}}) as bulk:
+            failed = self.outbox._send({'IndexedDocument:gone': 'index'})
+
+        actions = list(bulk.call_args.args[1])
+        self.assertEqual([(action['_op_type'], action['_id']) for action in actions], [('delete', 'gone')])
+        self.assertEqual(failed, [])
+
+    def test_failed_delete_is_retried(self, _):
+        with self._bulk_errors({'delete': {'_index': 'documents', '_id': '1', 'status': 503}}):
+            failed = self.outbox._send({'IndexedDocument:1': 'delete', 'IndexedDocument:2': 'delete'})
+
+        self.assertEqual(failed, ['IndexedDocument:1'])
+
+    def test_failed_index_is_retried(self, _):
+        with self._bulk_errors({'index': {'_index': 'documents', '_id': '2', 'status': 429}}):
+            failed = self.outbox._send({'IndexedDocument:1': 'index', 'IndexedDocument:2': 'index'})
+
+        self.assertEqual(failed, ['IndexedDocument:2'])
+
+    def test_bulk_request_failure_retries_every_entry(self, _):
+        entries = {'IndexedDocument:1': 'delete', 'IndexedDocument:2': 'index'}
+        with mock.patch('utils.elasticsearch_outbox.helpers.bulk', side_effect=ConnectionError):
+            failed = self.outbox._send(entries)
+
+        self.assertEqual(sorted(failed), sorted(entries))
+
+
+@override_settings(ELASTICSEARCH_SEARCH_LIMIT=2)
+class SearchPaginationTests(SimpleTestCase):
+    """Paging of q= searches with and without limit/cursor."""
+
+    def setUp(self):
+        self.es = mock.Mock()
+        self.es.open_point_in_time.return_value = {'id': 'pit-1'}
+        self.es.search.return_value = {
+            'hits': {'total': {'value': 3}, 'hits': [
+                {'_id': str(number), '_source': {}, 'sort': [1.0, number]} for number in range(3)
+            ]},
+        }
+
+    def _search(self, **query_params):
+        view = BaseMongoAPIView()
+        view.request = SimpleNamespace(query_params=query_params)
+        view.elasticsearch_index_name = 'documents'
+        with override_settings(ELASTICSEARCH_CONNECTION=self.es):
+            return view, view.search_elasticsearch('term')
+
+    def test_unpaged_search_uses_no_point_in_time(self):
+        self.es.search.return_value['hits']['hits'] = self.es.search.return_value['hits']['hits'][:2]
+        view, results = self._search()
+
+        self.es.open_point_in_time.assert_not_called()
+        self.assertEqual(self.es.search.call_args.kwargs['index'], 'documents')
+        self.assertEqual(self.es.search.call_args.kwargs['size'], 2)
+        self.assertEqual(len(results), 2)
+        self.assertIsNone(view.next_cursor)
+
+    def test_paged_search_returns_a_cursor_on_a_point_in_time(self):
+        view, results = self._search(limit='2')
+
+        self.es.open_point_in_time.assert_called_once()
+        self.assertEqual(self.es.search.call_args.kwargs['pit']['id'], 'pit-1')
+        self.assertEqual([row['id'] for row in results], ['0', '1'])
+        self.assertIsNotNone(view.next_cursor)
+        self.es.close_point_in_time.assert_not_called()
+
+    def test_invalid_limit_or_cursor_is_rejected(self):
+        for query_params in ({'limit': 'abc'}, {'limit': '2', 'cursor': 'not-a-cursor'}, {'cursor': 'x'}):
+            with self.subTest(query_params=query_params), self.assertRaises(InvalidCursor):
+                self._search(**query_params)
+        self.es.search.assert_not_called()
+
+
+@mock.patch.object(PatchMongoAPIView, 'store_logs')
+class BulkPatchFilterTests(SimpleTestCase):
+    """Bulk PATCH only touches documents that also match the view's query-param filters."""
+
+    def _patch(self, filters):
+        view = PatchMongoAPIView()
+        view.model = mock.Mock()
+        view.model.objects.filter.return_value = []
+        view.serializer_class = {'PATCH': mock.Mock()}
+        request = SimpleNamespace(data={'data': [{'id': 'a'}, {'id': 'b'}]})
+        with mock.patch.object(view, 'check_patch_data', return_value=(True, {})), \
+                mock.patch.object(view, 'apply_filters', return_value=filters):
+            return view, view.bulk_patch_request(request)
+
+    def test_filters_are_applied_with_the_ids(self, store_logs):
+        view, response = self._patch((True, {'status': 'open'}))
+
+        filter_kwargs = view.model.objects.filter.call_args.kwargs
+        self.assertEqual(sorted(filter_kwargs.pop('id__in')), ['a', 'b'])
+        self.assertEqual(filter_kwargs, {'status': 'open'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_filters_are_rejected(self, store_logs):
+        view, response = self._patch((False, {'message': 'Invalid filter parameters received.'}))
+
+        view.model.objects.filter.assert_not_called()
+        self.assertEqual(response.status_code, 400)
+
+
+class LogShipperFailureTests(SimpleTestCase):
+    """A batch that cannot be shipped is logged and counted instead of printed."""
+
+    def test_unexpected_errors_are_logged_and_counted(self):
+        shipper = LogShipper(batch_size=2)
+        shipper._buffer.extend([{'status_code': 200}, {'status_code': 500}])
+        failed = LOG_RECORDS.labels('failed')
+        before = failed._value.get()
+
+        with mock.patch('utils.log_shipper.load_slaughter_erp_token', side_effect=RuntimeError('no token')), \
+                self.assertLogs('utils.log_shipper', level='ERROR'):
+            self.assertEqual(shipper.flush(), 0)
+
+        self.assertEqual(failed._value.get() - before, 2)
+
+
+class EnsureMongoIndexesTests(SimpleTestCase):
+    """Startup index creation gives up at the first connection failure."""
+
+    def _document(self, error=None):
+        document = mock.Mock(_meta={'index_specs': [{'fields': [('field', 1)]}]})
+        document.ensure_indexes.side_effect = error
+        document._get_collection_name.return_value = 'collection'
+        return document
+
+    def test_stops_after_the_first_connection_failure(self):
+        documents = [self._document(ServerSelectionTimeoutError('down')), self._document()]
+        with mock.patch('utils.mongo_indexes.iter_documents', return_value=documents), mock.patch('builtins.print'):
+            ensure_mongo_indexes(timeout=0.1)
+
+        documents[1].ensure_indexes.assert_not_called()
+
+    def test_other_failures_do_not_stop_the_run(self):
+        documents = [self._document(ValueError('conflicting index')), self._document()]
+        with mock.patch('utils.mongo_indexes.iter_documents', return_value=documents), mock.patch('builtins.print'):
+            ensure_mongo_indexes(timeout=0.1)
+
+        documents[1].ensure_indexes.assert_called_once()
+
+
+@override_settings(SERVICE_NAME='service', LOG_SERVER={'query_endpoint_url': 'http://logs/api/v1/log/'})
+class MongoIndexAdvisorSampleTests(SimpleTestCase):
+    """The log query of the advisor uses filters the Logs service accepts."""
+
+    def test_sample_logs_filters_by_service_and_method(self):
+        http_client = mock.Mock()
+        http_client.get.return_value.json.return_value = {'data': []}
+        with mock.patch('apps.core.management.commands.mongo_index_advisor.get_http_client', return_value=http_client), \
+                mock.patch('apps.core.management.commands.mongo_index_advisor.load_slaughter_erp_token', return_value='t'):
+            self.assertEqual(list(MongoIndexAdvisorCommand()._sample_logs(5)), [])
+
+        # Logs accepts `<field>__<operator>` filters only (see LogsAPIView.apply_filters)
+        self.assertEqual(http_client.get.call_args.kwargs['params'],
+                         {'service__exact': 'service', 'method__exact': 'GET', 'limit': 5})
+
+
+@mock.patch('utils.microservice.http_client.time.monotonic')
+class CircuitBreakerTests(SimpleTestCase):
+    """One trial request at a time while the circuit is half-open."""
+
+    def _open_breaker(self, monotonic):
+        monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+        breaker.record_failure()
+        breaker.record_failure()
+        return breaker
+
+    def test_open_circuit_refuses_requests_until_the_timeout(self, monotonic):
+        breaker = self._open_breaker(monotonic)
+
+        monotonic.return_value = 129.0
+        self.assertFalse(breaker.allow_request())
+
+    def test_half_open_circuit_lets_one_trial_through(self, monotonic):
+        breaker = self._open_breaker(monotonic)
+
+        monotonic.return_value = 130.0
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+
+    def test_successful_trial_closes_the_circuit(self, monotonic):
+        breaker = self._open_breaker(monotonic)
+        monotonic.return_value = 130.0
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        self.assertTrue(breaker.allow_request())
+        self.assertTrue(breaker.allow_request())
+
+    def test_failed_trial_reopens_the_circuit(self, monotonic):
+        breaker = self._open_breaker(monotonic)
+        monotonic.return_value = 130.0
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        monotonic.return_value = 159.0
+        self.assertFalse(breaker.allow_request())
+        monotonic.return_value = 160.0
+        self.assertTrue(breaker.allow_request())
+
+    def test_trial_that_never_reports_back_is_replaced(self, monotonic):
+        breaker = self._open_breaker(monotonic)
+        monotonic.return_value = 130.0
+        breaker.allow_request()
+
+        monotonic.return_value = 160.0
+        self.assertTrue(breaker.allow_request())
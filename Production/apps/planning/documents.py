@@ -22,6 +22,12 @@ class PlanningSeries(mongo.Document):
 
     is_finished = mongo.BooleanField(default=False)
 
+    meta = {
+        'indexes': [
+            {'fields': ['-create.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
+
 
 class PlanningSeriesCell(mongo.Document):
 
@@ -31,3 +37,9 @@ class PlanningSeriesCell(mongo.Document):
     import_type = mongo.StringField()
     # import_type = mongo.StringField(choices=import_type_dict)
     import_id = mongo.StringField(default='')
+
+    meta = {
+        'indexes': [
+            {'fields': ['priority', 'id'], 'name': 'priority'},
+        ],
+    }
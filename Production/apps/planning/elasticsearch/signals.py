@@ -1,52 +1,22 @@
 # apps/planning/elasticsearch/signals.py
 
-from mongoengine import signals
 from apps.planning.documents import PlanningSeries, PlanningSeriesCell
 from apps.planning.elasticsearch.utils import (
-    index_planning_series,
-    delete_planning_series,
-    index_planning_series_cell,
-    delete_planning_series_cell,
+    build_planning_series_document,
+    build_planning_series_cell_document,
 )
 from apps.planning.serializers import (
     PlanningSeriesSerializer,
     PlanningSeriesCellSerializer,
 )
+from utils.elasticsearch_outbox import register_indexers
 
 
-@signals.post_save.connect
-def index_planning_series_on_save(sender, document, **kwargs):
-    """
-    Signal to index a PlanningSeries document when it's saved.
-    """
-    if isinstance(document, PlanningSeries):
-        data = PlanningSeriesSerializer(document).data
-        index_planning_series(data)
+# Serializer, index name and document builder of every indexed document.
+# Writes of these documents are queued in the Elasticsearch outbox and indexed in bulk by its drainer.
+INDEXERS = {
+    PlanningSeries: (PlanningSeriesSerializer, 'planning_series', build_planning_series_document),
+    PlanningSeriesCell: (PlanningSeriesCellSerializer, 'planning_series_cell', build_planning_series_cell_document),
+}
 
-
-@signals.post_delete.connect
-def delete_planning_series_on_delete(sender, document, **kwargs):
-    """
-    Signal to delete a PlanningSeries document from the index when it's deleted.
-    """
-    if isinstance(document, PlanningSeries):
-        delete_planning_series(str(document.id))
-
-
-@signals.post_save.connect
-def index_planning_series_cell_on_save(sender, document, **kwargs):
-    """
-    Signal to index a PlanningSeriesCell document when it's saved.
-    """
-    if isinstance(document, PlanningSeriesCell):
-        data = PlanningSeriesCellSerializer(document).data
-        index_planning_series_cell(data)
-
-
-@signals.post_delete.connect
-def delete_planning_series_cell_on_delete(sender, document, **kwargs):
-    """
-    Signal to delete a PlanningSeriesCell document from the index when it's deleted.
-    """
-    if isinstance(document, PlanningSeriesCell):
-        delete_planning_series_cell(str(document.id))
+register_indexers(INDEXERS)
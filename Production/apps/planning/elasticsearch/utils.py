@@ -18,6 +18,15 @@ def create_index_planning_series():
     )
 
 
+def build_planning_series_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a PlanningSeries.
+    """
+    return {
+        'is_finished': data.get('is_finished', False),
+    }
+
+
 def index_planning_series(data: dict):
     """
     Index a PlanningSeries document in Elasticsearch.
@@ -26,9 +35,7 @@ def index_planning_series(data: dict):
     es.index(
         index='planning_series',
         id=data['id'],
-        document={
-            'is_finished': data.get('is_finished', False),
-        }
+        document=build_planning_series_document(data)
     )
 
 
@@ -56,6 +63,16 @@ def create_index_planning_series_cell():
     )
 
 
+def build_planning_series_cell_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a PlanningSeriesCell.
+    """
+    return {
+        'import_type': data.get('import_type', ''),
+        'import_id': data.get('import_id', ''),
+    }
+
+
 def index_planning_series_cell(data: dict):
     """
     Index a PlanningSeriesCell document in Elasticsearch.
@@ -64,10 +81,7 @@ def index_planning_series_cell(data: dict):
     es.index(
         index='planning_series_cell',
         id=data['id'],
-        document={
-            'import_type': data.get('import_type', ''),
-            'import_id': data.get('import_id', ''),
-        }
+        document=build_planning_series_cell_document(data)
     )
 
 
@@ -32,6 +32,12 @@ class PoultryCuttingProductionSeries(mongo.Document):
     # status = mongo.StringField(default='pending', choices=production_series_status)
     status = mongo.StringField(default='pending')
 
+    meta = {
+        'indexes': [
+            {'fields': ['-create.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
+
 
 class PoultryCuttingImportProduct(mongo.Document):
 
@@ -51,6 +57,13 @@ class PoultryCuttingImportProduct(mongo.Document):
 
     poultry_cutting_production_series = mongo.ReferenceField(PoultryCuttingProductionSeries, default='')
 
+    meta = {
+        'indexes': [
+            {'fields': ['poultry_cutting_production_series', '-create_date.date', '-id'], 'name': 'production_series_create_date_desc'},
+            {'fields': ['-create_date.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
+
 
 class PoultryCuttingExportProduct(mongo.Document):
 
@@ -66,6 +79,13 @@ class PoultryCuttingExportProduct(mongo.Document):
 
     poultry_cutting_production_series = mongo.ReferenceField(PoultryCuttingProductionSeries, default='')
 
+    meta = {
+        'indexes': [
+            {'fields': ['poultry_cutting_production_series', '-create.date', '-id'], 'name': 'production_series_create_date_desc'},
+            {'fields': ['-create.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
+
 
 class PoultryCuttingReturnProduct(mongo.Document):
     id = mongo.StringField(primary_key=True, default=lambda: id_generator('ExportProduct'))
@@ -85,3 +105,10 @@ class PoultryCuttingReturnProduct(mongo.Document):
     receiver_delivery_unit = mongo.StringField(default='')
 
     poultry_cutting_production_series = mongo.ReferenceField(PoultryCuttingProductionSeries, default='')
+
+    meta = {
+        'indexes': [
+            {'fields': ['poultry_cutting_production_series', '-create.date', '-id'], 'name': 'production_series_create_date_desc'},
+            {'fields': ['-create.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
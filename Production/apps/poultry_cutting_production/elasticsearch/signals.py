@@ -1,6 +1,5 @@
 # apps/poultry_cutting_production/elasticsearch/signals.py
 
-from mongoengine import signals
 from apps.poultry_cutting_production.documents import (
     PoultryCuttingProductionSeries,
     PoultryCuttingImportProduct,
@@ -8,14 +7,10 @@ from apps.poultry_cutting_production.documents import (
     PoultryCuttingReturnProduct,
 )
 from apps.poultry_cutting_production.elasticsearch.utils import (
-    index_poultry_cutting_production_series,
-    delete_poultry_cutting_production_series,
-    index_poultry_cutting_import_product,
-    delete_poultry_cutting_import_product,
-    index_poultry_cutting_export_product,
-    delete_poultry_cutting_export_product,
-    index_poultry_cutting_return_product,
-    delete_poultry_cutting_return_product,
+    build_poultry_cutting_production_series_document,
+    build_poultry_cutting_import_product_document,
+    build_poultry_cutting_export_product_document,
+    build_poultry_cutting_return_product_document,
 )
 from apps.poultry_cutting_production.serializers.series_serializer import (
     PoultryCuttingProductionSeriesSerializer,
@@ -29,79 +24,16 @@ from apps.poultry_cutting_production.serializers.export_serializer import (
 from apps.poultry_cutting_production.serializers.return_serializer import (
     PoultryCuttingReturnProductSerializer,
 )
+from utils.elasticsearch_outbox import register_indexers
 
 
-@signals.post_save.connect
-def index_poultry_cutting_production_series_on_save(sender, document, **kwargs):
-    """
-    Signal to index a PoultryCuttingProductionSeries document when it's saved.
-    """
-    if isinstance(document, PoultryCuttingProductionSeries):
-        data = PoultryCuttingProductionSeriesSerializer(document).data
-        index_poultry_cutting_production_series(data)
+# Serializer, index name and document builder of every indexed document.
+# Writes of these documents are queued in the Elasticsearch outbox and indexed in bulk by its drainer.
+INDEXERS = {
+    PoultryCuttingProductionSeries: (PoultryCuttingProductionSeriesSerializer, 'poultry_cutting_production_series', build_poultry_cutting_production_series_document),
+    PoultryCuttingImportProduct: (PoultryCuttingImportProductSerializer, 'poultry_cutting_import_product', build_poultry_cutting_import_product_document),
+    PoultryCuttingExportProduct: (PoultryCuttingExportProductSerializer, 'poultry_cutting_export_product', build_poultry_cutting_export_product_document),
+    PoultryCuttingReturnProduct: (PoultryCuttingReturnProductSerializer, 'poultry_cutting_return_product', build_poultry_cutting_return_product_document),
+}
 
-
-@signals.post_delete.connect
-def delete_poultry_cutting_production_series_on_delete(sender, document, **kwargs):
-    """
-    Signal to delete a PoultryCuttingProductionSeries document from the index when it's deleted.
-    """
-    if isinstance(document, PoultryCuttingProductionSeries):
-        delete_poultry_cutting_production_series(str(document.id))
-
-
-@signals.post_save.connect
-def index_poultry_cutting_import_product_on_save(sender, document, **kwargs):
-    """
-    Signal to index a PoultryCuttingImportProduct document when it's saved.
-    """
-    if isinstance(document, PoultryCuttingImportProduct):
-        data = PoultryCuttingImportProductSerializer(document).data
-        index_poultry_cutting_import_product(data)
-
-
-@signals.post_delete.connect
-def delete_poultry_cutting_import_product_on_delete(sender, document, **kwargs):
-    """
-    Signal to delete a PoultryCuttingImportProduct document from the index when it's deleted.
-    """
-    if isinstance(document, PoultryCuttingImportProduct):
-        delete_poultry_cutting_import_product(str(document.id))
-
-
-@signals.post_save.connect
-def index_poultry_cutting_export_product_on_save(sender, document, **kwargs):
-    """
-    Signal to index a PoultryCuttingExportProduct document when it's saved.
-    """
-    if isinstance(document, PoultryCuttingExportProduct):
-        data = PoultryCuttingExportProductSerializer(document).data
-        index_poultry_cutting_export_product(data)
-
-
-@signals.post_delete.connect
-def delete_poultry_cutting_export_product_on_delete(sender, document, **kwargs):
-    """
-    Signal to delete a PoultryCuttingExportProduct document from the index when it's deleted.
-    """
-    if isinstance(document, PoultryCuttingExportProduct):
-        delete_poultry_cutting_export_product(str(document.id))
-
-
-@signals.post_save.connect
-def index_poultry_cutting_return_product_on_save(sender, document, **kwargs):
-    """
-    Signal to index a PoultryCuttingReturnProduct document when it's saved.
-    """
-    if isinstance(document, PoultryCuttingReturnProduct):
-        data = PoultryCuttingReturnProductSerializer(document).data
-        index_poultry_cutting_return_product(data)
-
-
-@signals.post_delete.connect
-def delete_poultry_cutting_return_product_on_delete(sender, document, **kwargs):
-    """
-    Signal to delete a PoultryCuttingReturnProduct document from the index when it's deleted.
-    """
-    if isinstance(document, PoultryCuttingReturnProduct):
-        delete_poultry_cutting_return_product(str(document.id))
+register_indexers(INDEXERS)
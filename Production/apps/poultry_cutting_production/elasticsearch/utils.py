@@ -19,6 +19,16 @@ def create_index_poultry_cutting_production_series():
     )
 
 
+def build_poultry_cutting_production_series_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a PoultryCuttingProductionSeries.
+    """
+    return {
+        'product_owner': data.get('product_owner', ''),
+        'status': data.get('status', 'pending'),
+    }
+
+
 def index_poultry_cutting_production_series(data: dict):
     """
     Index a PoultryCuttingProductionSeries document in Elasticsearch.
@@ -27,10 +37,7 @@ def index_poultry_cutting_production_series(data: dict):
     es.index(
         index='poultry_cutting_production_series',
         id=data['id'],
-        document={
-            'product_owner': data.get('product_owner', ''),
-            'status': data.get('status', 'pending'),
-        }
+        document=build_poultry_cutting_production_series_document(data)
     )
 
 
@@ -58,6 +65,16 @@ def create_index_poultry_cutting_import_product():
     )
 
 
+def build_poultry_cutting_import_product_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a PoultryCuttingImportProduct.
+    """
+    return {
+        'product': data.get('product', {}).get('name', 'unknown'),
+        'dispatch_unit': data.get('dispatch_unit', ''),
+    }
+
+
 def index_poultry_cutting_import_product(data: dict):
     """
     Index a PoultryCuttingImportProduct document in Elasticsearch.
@@ -66,10 +83,7 @@ def index_poultry_cutting_import_product(data: dict):
     es.index(
         index='poultry_cutting_import_product',
         id=data['id'],
-        document={
-            'product': data.get('product', {}).get('name', 'unknown'),
-            'dispatch_unit': data.get('dispatch_unit', ''),
-        }
+        document=build_poultry_cutting_import_product_document(data)
     )
 
 
@@ -97,6 +111,16 @@ def create_index_poultry_cutting_export_product():
     )
 
 
+def build_poultry_cutting_export_product_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a PoultryCuttingExportProduct.
+    """
+    return {
+        'product': data.get('product', {}).get('name', 'unknown'),
+        'receiver_delivery_unit': data.get('receiver_delivery_unit', ''),
+    }
+
+
 def index_poultry_cutting_export_product(data: dict):
     """
     Index a PoultryCuttingExportProduct document in Elasticsearch.
@@ -105,10 +129,7 @@ def index_poultry_cutting_export_product(data: dict):
     es.index(
         index='poultry_cutting_export_product',
         id=data['id'],
-        document={
-            'product': data.get('product', {}).get('name', 'unknown'),
-            'receiver_delivery_unit': data.get('receiver_delivery_unit', ''),
-        }
+        document=build_poultry_cutting_export_product_document(data)
     )
 
 
@@ -136,6 +157,16 @@ def create_index_poultry_cutting_return_product():
     )
 
 
+def build_poultry_cutting_return_product_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a PoultryCuttingReturnProduct.
+    """
+    return {
+        'product': data.get('product', {}).get('name', 'unknown'),
+        'return_type': data.get('return_type', ''),
+    }
+
+
 def index_poultry_cutting_return_product(data: dict):
     """
     Index a PoultryCuttingReturnProduct document in Elasticsearch.
@@ -144,10 +175,7 @@ def index_poultry_cutting_return_product(data: dict):
     es.index(
         index='poultry_cutting_return_product',
         id=data['id'],
-        document={
-            'product': data.get('product', {}).get('name', 'unknown'),
-            'return_type': data.get('return_type', ''),
-        }
+        document=build_poultry_cutting_return_product_document(data)
     )
 
 
@@ -30,6 +30,13 @@ class ProductionSeries(mongo.Document):
     # status = mongo.StringField(default='pending', choices=production_series_status)
     status = mongo.StringField(default='pending')
 
+    meta = {
+        'indexes': [
+            {'fields': ['-create.date', '-id'], 'name': 'create_date_desc'},
+            {'fields': ['status', '-create.date', '-id'], 'name': 'status_create_date_desc'},
+        ],
+    }
+
 
 class FirstStepImportCar(mongo.EmbeddedDocument):
 
@@ -120,6 +127,13 @@ class ImportProduct(mongo.Document):
 
     production_series = mongo.ReferenceField(ProductionSeries, null=True)
 
+    meta = {
+        'indexes': [
+            {'fields': ['production_series', '-create.date', '-id'], 'name': 'production_series_create_date_desc'},
+            {'fields': ['-create.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
+
 
 class ImportProductFromWareHouseProductDescription(mongo.Document):
 
@@ -150,6 +164,13 @@ class ImportProductFromWareHouse(mongo.Document):
 
     production_series = mongo.ReferenceField(ProductionSeries, default='')
 
+    meta = {
+        'indexes': [
+            {'fields': ['production_series', '-create_date.date', '-id'], 'name': 'production_series_create_date_desc'},
+            {'fields': ['-create_date.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
+
 
 class ExportProduct(mongo.Document):
 
@@ -167,6 +188,13 @@ class ExportProduct(mongo.Document):
 
     production_series = mongo.ReferenceField(ProductionSeries, default='')
 
+    meta = {
+        'indexes': [
+            {'fields': ['production_series', '-create.date', '-id'], 'name': 'production_series_create_date_desc'},
+            {'fields': ['-create.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
+
 
 class ReturnProduct(mongo.Document):
 
@@ -187,3 +215,10 @@ class ReturnProduct(mongo.Document):
     is_repack = mongo.BooleanField(default=False)
 
     production_series = mongo.ReferenceField(ProductionSeries, default='')
+
+    meta = {
+        'indexes': [
+            {'fields': ['production_series', '-create.date', '-id'], 'name': 'production_series_create_date_desc'},
+            {'fields': ['-create.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
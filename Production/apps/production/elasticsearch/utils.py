@@ -19,6 +19,16 @@ def create_index_production_series():
     )
 
 
+def build_production_series_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a ProductionSeries.
+    """
+    return {
+        'product_owner': data.get('product_owner', 0),
+        'status': data.get('status', 'pending'),
+    }
+
+
 def index_production_series(data: dict):
     """
     Index a ProductionSeries document in Elasticsearch.
@@ -27,10 +37,7 @@ def index_production_series(data: dict):
     es.index(
         index='production_series',
         id=data['id'],
-        document={
-            'product_owner': data.get('product_owner', 0),
-            'status': data.get('status', 'pending'),
-        }
+        document=build_production_series_document(data)
     )
 
 
@@ -59,11 +66,10 @@ def create_index_import_product():
     )
 
 
-def index_import_product(data: dict):
+def build_import_product_document(data: dict) -> dict:
     """
-    Index an ImportProduct document in Elasticsearch.
+    Build the Elasticsearch document for an ImportProduct.
     """
-    es = settings.ELASTICSEARCH_CONNECTION
     try:
         car_postfix_number = data['car']['car']['postfix_number']
         car_prefix_number = data['car']['car']['prefix_number']
@@ -73,14 +79,22 @@ def index_import_product(data: dict):
 
     except Exception:
         car = 'unknown'
+    return {
+        'agriculture': data.get('agriculture', {}).get('name', 'unknown'),
+        'car': car,
+        'product': data.get('product', {}).get('name', 'unknown'),
+    }
+
+
+def index_import_product(data: dict):
+    """
+    Index an ImportProduct document in Elasticsearch.
+    """
+    es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='import_product',
         id=data['id'],
-        document={
-            'agriculture': data.get('agriculture', {}).get('name', 'unknown'),
-            'car': car,
-            'product': data.get('product', {}).get('name', 'unknown'),
-        }
+        document=build_import_product_document(data)
     )
 
 
@@ -107,6 +121,15 @@ def create_index_import_product_from_warehouse():
     )
 
 
+def build_import_product_from_warehouse_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for an ImportProductFromWareHouse.
+    """
+    return {
+        'product_description': data.get('product_description', {}).get('id', 'unknown'),
+    }
+
+
 def index_import_product_from_warehouse(data: dict):
     """
     Index an ImportProductFromWareHouse document in Elasticsearch.
@@ -115,9 +138,7 @@ def index_import_product_from_warehouse(data: dict):
     es.index(
         index='import_product_from_warehouse',
         id=data['id'],
-        document={
-            'product_description': data.get('product_description', {}).get('id', 'unknown'),
-        }
+        document=build_import_product_from_warehouse_document(data)
     )
 
 
@@ -145,6 +166,16 @@ def create_index_export_product():
     )
 
 
+def build_export_product_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for an ExportProduct.
+    """
+    return {
+        'product': data.get('product', 'unknown'),
+        'receiver_delivery_unit': data.get('receiver_delivery_unit', ''),
+    }
+
+
 def index_export_product(data: dict):
     """
     Index an ExportProduct document in Elasticsearch.
@@ -153,10 +184,7 @@ def index_export_product(data: dict):
     es.index(
         index='export_product',
         id=data['id'],
-        document={
-            'product': data.get('product', 'unknown'),
-            'receiver_delivery_unit': data.get('receiver_delivery_unit', ''),
-        }
+        document=build_export_product_document(data)
     )
 
 
@@ -184,6 +212,16 @@ def create_index_return_product():
     )
 
 
+def build_return_product_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a ReturnProduct.
+    """
+    return {
+        'product': data.get('product', {}).get('name', 'unknown'),
+        'return_type': data.get('return_type', ''),
+    }
+
+
 def index_return_product(data: dict):
     """
     Index a ReturnProduct document in Elasticsearch.
@@ -192,10 +230,7 @@ def index_return_product(data: dict):
     es.index(
         index='return_product',
         id=data['id'],
-        document={
-            'product': data.get('product', {}).get('name', 'unknown'),
-            'return_type': data.get('return_type', ''),
-        }
+        document=build_return_product_document(data)
     )
 
 
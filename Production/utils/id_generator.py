@@ -1,23 +1,184 @@
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, connection
+
+
+class IdBlockAllocator:
+    """
+    Hi/lo id allocator backed by the Core counter table.
+
+    Each worker atomically reserves a block of ids per counter name with a single
+    `UPDATE ... RETURNING` statement and then hands ids out from memory, so most
+    new documents need no SQL round trip at all.
+    """
+
+    def __init__(self, block_size: int = 50) -> None:
+        """
+        Initialize the allocator with no reserved blocks.
+
+        Args:
+            block_size: Number of ids reserved per round trip for each counter.
+        """
+        self.block_size = max(1, block_size)
+        self._blocks: Dict[str, List[int]] = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._hint = threading.local()
+
+    def _reserve(self, class_name: str, count: int) -> Tuple[int, int]:
+        """
+        Atomically advance a counter by `count` and return the reserved range.
+
+        Args:
+            class_name: Counter name in the Core table.
+            count: Number of ids to reserve.
+
+        Returns:
+            Tuple[int, int]: First and last reserved value (inclusive).
+        """
+        from apps.core.models import Core
+
+        table = connection.ops.quote_name(Core._meta.db_table)
+        sql = f'UPDATE {table} SET value = value + %s WHERE name = %s RETURNING value'
+
+        for _ in range(2):
+            with connection.cursor() as cursor:
+                cursor.execute(sql, [count, class_name])
+                row = cursor.fetchone()
+            if row:
+                return row[0] - count + 1, row[0]
+
+            # First use of this counter
+            try:
+                Core.objects.create(name=class_name)
+            except IntegrityError:
+                pass
+
+        raise RuntimeError(f'Could not reserve ids for counter {class_name}')
+
+    def _check_fork(self) -> None:
+        """Drop blocks inherited from a parent process so forked workers never share ids."""
+        if os.getpid() != self._pid:
+            self._blocks = {}
+            self._pid = os.getpid()
+
+    def next_id(self, class_name: str) -> int:
+        """
+        Return the next id for a counter, reserving a new block when the current one is used up.
+
+        Args:
+            class_name: Counter name in the Core table.
+
+        Returns:
+            int: The new id.
+        """
+        with self._lock:
+            self._check_fork()
+            block = self._blocks.get(class_name)
+            if not block or block[0] > block[1]:
+                block = list(self._reserve(class_name, self._refill_size(class_name)))
+                self._blocks[class_name] = block
+            value = block[0]
+            block[0] += 1
+            return value
+
+    def _refill_size(self, class_name: str) -> int:
+        """
+        Return how many ids to reserve for a counter whose block is used up.
+
+        Inside `expect(count)` the first refill of each counter reserves room for the
+        whole expected batch, so a bulk insert costs a single round trip per counter.
+
+        Args:
+            class_name: Counter name in the Core table.
+
+        Returns:
+            int: Number of ids to reserve.
+        """
+        expected = getattr(self._hint, 'expected', 0)
+        refilled = getattr(self._hint, 'refilled', None)
+        if expected and refilled is not None and class_name not in refilled:
+            refilled.add(class_name)
+            return max(self.block_size, expected)
+        return self.block_size
+
+    @contextmanager
+    def expect(self, count: int) -> Iterator[None]:
+        """
+        Hint that the current thread is about to generate `count` ids per counter.
+
+        Useful when ids come from document defaults, where the counter name is not
+        known to the caller.
+
+        Args:
+            count: Number of documents about to be created.
+        """
+        previous = getattr(self._hint, 'expected', 0), getattr(self._hint, 'refilled', None)
+        self._hint.expected, self._hint.refilled = count, set()
+        try:
+            yield
+        finally:
+            self._hint.expected, self._hint.refilled = previous
+
+    def reserve_ids(self, class_name: str, count: int) -> List[int]:
+        """
+        Reserve exactly `count` consecutive ids for a bulk insert in one round trip.
+
+        Args:
+            class_name: Counter name in the Core table.
+            count: Number of ids needed.
+
+        Returns:
+            List[int]: The reserved ids.
+        """
+        if count <= 0:
+            return []
+        start, end = self._reserve(class_name, count)
+        return list(range(start, end + 1))
+
+
+id_allocator = IdBlockAllocator(block_size=getattr(settings, 'ID_BLOCK_SIZE', 50))
 
 
 def id_generator(class_name: str) -> str:
     """
-    Generates a unique ID by incrementing the counter stored in the Core model.
+    Generates a unique ID from the worker's reserved block for the given counter.
 
     Args:
         class_name (str): The name used to identify the model class in the Core table.
 
     Returns:
-        str: The new incremented ID as a string.
+        str: The new ID as a string.
+    """
+    return str(id_allocator.next_id(class_name))
+
+
+def expect_ids(count: int):
     """
-    from apps.core.models import Core
-    try:
-        obj = Core.objects.get(name=class_name)
-    except Core.DoesNotExist:
-        obj = Core(name=class_name)
-        obj.save()
+    Context manager that lets a bulk insert reserve the ids of all its documents at once.
 
-    obj.increase()
-    obj.save()
+    Args:
+        count (int): Number of documents about to be created.
 
-    return str(obj.value)
+    Returns:
+        A context manager; ids generated inside it come from a block sized for the batch.
+    """
+    return id_allocator.expect(count)
+
+
+def reserve_ids(class_name: str, count: int) -> List[str]:
+    """
+    Reserves exactly `count` unique IDs for a bulk insert.
+
+    Args:
+        class_name (str): The name used to identify the model class in the Core table.
+        count (int): Number of IDs to reserve.
+
+    Returns:
+        List[str]: The reserved IDs as strings.
+    """
+    return [str(value) for value in id_allocator.reserve_ids(class_name, count)]
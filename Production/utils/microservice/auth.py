@@ -1,55 +1,30 @@
 from typing import Optional
-import requests
-from django.conf import settings
+
+from utils.microservice.token_manager import get_token_manager
 
 
 def load_slaughter_erp_token() -> Optional[str]:
     """
-    Load or refresh the Slaughter ERP authentication token.
+    Return the Slaughter ERP service token.
+
+    The token is served from process memory and only refreshed shortly before it expires,
+    so steady-state calls make no network round trips.
 
     Returns:
         Optional[str]: The valid JWT token if available, else None.
     """
-    try:
-        # Attempt to read existing token from file
-        with open('configs/settings/jwt/token.txt', 'r') as fd:
-            token = fd.read().strip()
-
-        # Verify token validity
-        response = requests.get(
-            settings.MICROSERVICE_URL['test_token'],
-            headers={'Authorization': f'Bearer {token}'}
-        )
-
-        if 199 <= response.status_code <= 299:
-            return token
-
-    except (FileNotFoundError, requests.RequestException):
-        pass
+    return get_token_manager().get_token()
 
-    # Token invalid or not found, attempt to refresh
-    try:
-        auth_data = {
-            'username': settings.MICROSERVICE_CONFIGS['SlaughterERP']['username'],
-            'password': settings.MICROSERVICE_CONFIGS['SlaughterERP']['password']
-        }
 
-        response = requests.post(
-            settings.MICROSERVICE_URL['login'],
-            json=auth_data
-        )
-
-        if 199 <= response.status_code <= 299:
-            new_token = response.json()['access']
-            with open('configs/settings/jwt/token.txt', 'w') as fd:
-                fd.write(new_token)
-            return new_token
-
-    except (requests.RequestException, KeyError, FileNotFoundError):
-        pass
+def invalidate_slaughter_erp_token(token: Optional[str] = None) -> None:
+    """
+    Discard a service token that Slaughter ERP rejected so the next call logs in again.
 
-    return None
+    Args:
+        token: The rejected token.
+    """
+    get_token_manager().invalidate(token)
 
 
 if __name__ == '__main__':
-    load_slaughter_erp_token()
\ No newline at end of file
+    load_slaughter_erp_token()
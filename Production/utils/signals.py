@@ -0,0 +1,10 @@
+from mongoengine.signals import _signals
+
+
+# Sent once per bulk update chunk with every updated document, instead of a `post_save` per document.
+# Receivers are called as `receiver(sender=<document class>, documents=[...])`.
+post_bulk_update = _signals.signal('post_bulk_update')
+
+# Sent once per bulk delete with the string ids of every deleted document, instead of a `post_delete` per document.
+# Receivers are called as `receiver(sender=<document class>, document_ids=[...])`.
+post_bulk_delete = _signals.signal('post_bulk_delete')
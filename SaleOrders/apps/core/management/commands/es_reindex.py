@@ -0,0 +1,183 @@
+import time
+from typing import Any, Dict, Iterator, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from elasticsearch import helpers
+
+from utils.elasticsearch import INDEX_MAPPINGS, REINDEX_TARGET_KEY
+from utils.elasticsearch_outbox import outbox
+
+
+class Command(BaseCommand):
+    """
+    Rebuild an Elasticsearch index from MongoDB without downtime.
+
+    The collection is streamed in `id` order into a new versioned index with parallel bulk
+    workers, while searches keep using the current index through its alias. Live writes are
+    mirrored into the new version by the indexing outbox. When the copy is complete the alias
+    is moved to the new version in one atomic request and the old version is dropped.
+    Progress is checkpointed after every window, so an interrupted run continues with
+    `--resume`.
+    """
+
+    help = 'Reindex an Elasticsearch index from MongoDB into a new version and swap its alias'
+
+    CHECKPOINT_KEY = 'es_reindex:{index}:checkpoint'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('index', help='Index (alias) name, e.g. "inventory"')
+        parser.add_argument('--batch-size', type=int, default=500, help='Documents per bulk request')
+        parser.add_argument('--workers', type=int, default=4, help='Parallel bulk workers')
+        parser.add_argument('--max-rate', type=float, default=0,
+                            help='Maximum documents per second (0 for unlimited)')
+        parser.add_argument('--resume', action='store_true', help='Continue the last interrupted run')
+        parser.add_argument('--keep-old', action='store_true', help='Keep the previous index version')
+
+    def handle(self, *args, **options) -> None:
+        es = getattr(settings, 'ELASTICSEARCH_CONNECTION', None)
+        if es is None:
+            raise CommandError('Elasticsearch is not enabled (ELASTICSEARCH_STATUS)')
+
+        index_name = options['index']
+        registered = outbox.get_indexer(index_name)
+        if registered is None or index_name not in INDEX_MAPPINGS:
+            raise CommandError(f'Unknown index <{index_name}>')
+        model, (serializer_class, _, build_document) = registered
+
+        batch_size = max(1, options['batch_size'])
+        workers = max(1, options['workers'])
+        checkpoint_key = self.CHECKPOINT_KEY.format(index=index_name)
+
+        checkpoint = cache.get(checkpoint_key) if options['resume'] else None
+        if checkpoint:
+            target = checkpoint['target']
+            self.stdout.write(f'Resuming {target} after id {checkpoint["last_id"]} ({checkpoint["indexed"]} indexed)')
+        else:
+            target = f'{index_name}_v{int(time.time())}'
+            checkpoint = {'target': target, 'last_id': None, 'indexed': 0, 'errors': 0}
+            es.indices.create(index=target, body={
+                'settings': {'refresh_interval': '-1', 'number_of_replicas': 0},
+                'mappings': {'properties': INDEX_MAPPINGS[index_name]},
+            })
+            cache.set(checkpoint_key, checkpoint, timeout=None)
+        cache.set(REINDEX_TARGET_KEY.format(index=index_name), target, timeout=None)
+
+        queryset = model.objects.order_by('id')
+        if checkpoint['last_id'] is not None:
+            queryset = queryset.filter(id__gt=checkpoint['last_id'])
+        total = checkpoint['indexed'] + queryset.count()
+
+        started = time.monotonic()
+        copied = 0
+        for window in self._windows(queryset, batch_size * workers):
+            # 'create' never overwrites a newer version already mirrored in by the outbox
+            actions = [
+                {'_op_type': 'create', '_index': target, '_id': str(row['id']), '_source': build_document(row)}
+                for row in serializer_class(window, many=True).data
+            ]
+            for ok, info in helpers.parallel_bulk(es, actions, thread_count=workers, chunk_size=batch_size,
+                                                  raise_on_error=False, raise_on_exception=False):
+                if not ok and info.get('create', {}).get('status') != 409:
+                    checkpoint['errors'] += 1
+                    self.stderr.write(f'Failed to index {info}')
+
+            copied += len(window)
+            checkpoint['indexed'] += len(window)
+            checkpoint['last_id'] = window[-1].pk
+            cache.set(checkpoint_key, checkpoint, timeout=None)
+
+            elapsed = time.monotonic() - started
+            if options['max_rate'] and copied / options['max_rate'] > elapsed:
+                time.sleep(copied / options['max_rate'] - elapsed)
+                elapsed = time.monotonic() - started
+            rate = copied / elapsed if elapsed else 0
+            remaining = (total - checkpoint['indexed']) / rate if rate else 0
+            self.stdout.write(
+                f'{checkpoint["indexed"]}/{total} indexed, {rate:.0f} docs/s, '
+                f'{checkpoint["errors"]} errors, ~{remaining:.0f}s left'
+            )
+
+        es.indices.put_settings(index=target, body={'index': {
+            'refresh_interval': None,
+            'number_of_replicas': self._replicas(es, index_name),
+        }})
+        es.indices.refresh(index=target)
+
+        previous = self._swap_alias(es, index_name, target)
+        cache.delete(REINDEX_TARGET_KEY.format(index=index_name))
+        cache.delete(checkpoint_key)
+        if previous and not options['keep_old']:
+            es.indices.delete(index=','.join(previous), ignore_unavailable=True)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Alias {index_name} now points to {target} ({checkpoint["indexed"]} documents, '
+            f'{checkpoint["errors"]} errors)'
+        ))
+
+    @staticmethod
+    def _windows(queryset: Any, size: int) -> Iterator[List[Any]]:
+        """
+        Stream a queryset with a batched cursor, in lists of up to `size` documents.
+
+        Args:
+            queryset: The ordered queryset.
+            size: Documents per window.
+
+        Yields:
+            List[Any]: The next window of documents.
+        """
+        window = []
+        for document in queryset.no_cache().batch_size(size):
+            window.append(document)
+            if len(window) >= size:
+                yield window
+                window = []
+        if window:
+            yield window
+
+    @staticmethod
+    def _replicas(es: Any, index_name: str) -> int:
+        """
+        Read the replica count of the index currently serving an alias.
+
+        Args:
+            es: The Elasticsearch client.
+            index_name: The alias or index name.
+
+        Returns:
+            int: The replica count (1 if the index does not exist yet).
+        """
+        try:
+            current = es.indices.get_settings(index=index_name)
+            return int(next(iter(current.values()))['settings']['index']['number_of_replicas'])
+        except Exception:
+            return 1
+
+    @staticmethod
+    def _swap_alias(es: Any, index_name: str, target: str) -> List[str]:
+        """
+        Point the alias at the new index version in one atomic request.
+
+        An index created before aliases were used has the alias' name itself; it is removed
+        in the same request.
+
+        Args:
+            es: The Elasticsearch client.
+            index_name: The alias name.
+            target: The new index version.
+
+        Returns:
+            List[str]: The index versions the alias pointed to before, to be dropped.
+        """
+        actions: List[Dict[str, Any]] = [{'add': {'index': target, 'alias': index_name}}]
+        previous: List[str] = []
+        if es.indices.exists_alias(name=index_name):
+            previous = [name for name in es.indices.get_alias(name=index_name) if name != target]
+            actions.extend({'remove': {'index': name, 'alias': index_name}} for name in previous)
+        elif es.indices.exists(index=index_name):
+            actions.insert(0, {'remove_index': {'index': index_name}})
+
+        es.indices.update_aliases(body={'actions': actions})
+        return previous
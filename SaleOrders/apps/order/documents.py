@@ -13,7 +13,12 @@ class Order(mongo.Document):
     cancelled = mongo.EmbeddedDocumentField(CheckStatus)
     verified = mongo.EmbeddedDocumentField(CheckStatus)
 
-    meta = {'collection': 'order'}
+    meta = {
+        'collection': 'order',
+        'indexes': [
+            {'fields': ['-create.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
 
 
 # Document for OrderItem
@@ -25,4 +30,9 @@ class OrderItem(mongo.Document):
     order = mongo.ReferenceField(Order, required=True)
     create = mongo.EmbeddedDocumentField(DateUser, default=lambda req: DateUser(user=req.user_payload['username']))
 
-    meta = {'collection': 'order_item'}
\ No newline at end of file
+    meta = {
+        'collection': 'order_item',
+        'indexes': [
+            {'fields': ['order', '-id'], 'name': 'order_id_desc'},
+        ],
+    }
\ No newline at end of file
@@ -19,11 +19,10 @@ def create_index_order():
     )
 
 
-def index_order(data: dict):
+def build_order_document(data: dict) -> dict:
     """
-    Index an Order document in Elasticsearch.
+    Build the Elasticsearch document for an Order.
     """
-    es = settings.ELASTICSEARCH_CONNECTION
     try:
         car_postfix_number = data['car']['car']['postfix_number']
         car_prefix_number = data['car']['car']['prefix_number']
@@ -33,13 +32,21 @@ def index_order(data: dict):
 
     except Exception:
         car = 'unknown'
+    return {
+        'customer': data.get('customer', ''),
+        'car': car,
+    }
+
+
+def index_order(data: dict):
+    """
+    Index an Order document in Elasticsearch.
+    """
+    es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='order',
         id=data['id'],
-        document={
-            'customer': data.get('customer', ''),
-            'car': car,
-        }
+        document=build_order_document(data)
     )
 
 
@@ -67,6 +74,16 @@ def create_index_order_item():
     )
 
 
+def build_order_item_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for an OrderItem.
+    """
+    return {
+        'product': data.get('product', 'unknown'),
+        'order': data.get('order', {}).get('id', 'unknown'),
+    }
+
+
 def index_order_item(data: dict):
     """
     Index an OrderItem document in Elasticsearch.
@@ -75,10 +92,7 @@ def index_order_item(data: dict):
     es.index(
         index='order_item',
         id=data['id'],
-        document={
-            'product': data.get('product', 'unknown'),
-            'order': data.get('order', {}).get('id', 'unknown'),
-        }
+        document=build_order_item_document(data)
     )
 
 
@@ -34,7 +34,13 @@ class TruckLoading(mongo.Document):
     exit_date = mongo.EmbeddedDocumentField(DateUser)
     is_cancelled = mongo.EmbeddedDocumentField(CheckStatus)
 
-    meta = {'collection': 'truck_loading'}
+    meta = {
+        'collection': 'truck_loading',
+        'indexes': [
+            {'fields': ['-create_at.date', '-id'], 'name': 'create_date_desc'},
+            {'fields': ['level', '-create_at.date', '-id'], 'name': 'level_create_date_desc'},
+        ],
+    }
 
 
 # Document for LoadedProduct
@@ -46,7 +52,13 @@ class LoadedProduct(mongo.Document):
     car = mongo.ReferenceField('TruckLoading')
     is_weight_base = mongo.BooleanField(default=True)
 
-    meta = {'collection': 'loaded_product'}
+    meta = {
+        'collection': 'loaded_product',
+        'indexes': [
+            {'fields': ['car', '-created.date', '-id'], 'name': 'car_create_date_desc'},
+            {'fields': ['-created.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
 
 
 # Document for LoadedProductItem
@@ -56,4 +68,9 @@ class LoadedProductItem(mongo.Document):
     number = mongo.IntField(required=True)
     loaded_product = mongo.ReferenceField(LoadedProduct, required=True)
 
-    meta = {'collection': 'loaded_product_item'}
\ No newline at end of file
+    meta = {
+        'collection': 'loaded_product_item',
+        'indexes': [
+            {'fields': ['loaded_product', '-id'], 'name': 'loaded_product_id_desc'},
+        ],
+    }
\ No newline at end of file
@@ -1,74 +1,25 @@
 # apps/sale/elasticsearch/signals.py
 
-from mongoengine import signals
 from apps.sale.documents import TruckLoading, LoadedProduct, LoadedProductItem
 from apps.sale.elasticsearch.utils import (
-    index_truck_loading,
-    delete_truck_loading,
-    index_loaded_product,
-    delete_loaded_product,
-    index_loaded_product_item,
-    delete_loaded_product_item,
+    build_truck_loading_document,
+    build_loaded_product_document,
+    build_loaded_product_item_document,
 )
 from apps.sale.serializer import (
     TruckLoadingSerializer,
     LoadedProductSerializer,
     LoadedProductItemSerializer,
 )
+from utils.elasticsearch_outbox import register_indexers
 
 
-@signals.post_save.connect
-def index_truck_loading_on_save(sender, document, **kwargs):
-    """
-    Signal to index a TruckLoading document when it's saved.
-    """
-    if isinstance(document, TruckLoading):
-        data = TruckLoadingSerializer(document).data
-        index_truck_loading(data)
+# Serializer, index name and document builder of every indexed document.
+# Writes of these documents are queued in the Elasticsearch outbox and indexed in bulk by its drainer.
+INDEXERS = {
+    TruckLoading: (TruckLoadingSerializer, 'truck_loading', build_truck_loading_document),
+    LoadedProduct: (LoadedProductSerializer, 'loaded_product', build_loaded_product_document),
+    LoadedProductItem: (LoadedProductItemSerializer, 'loaded_product_item', build_loaded_product_item_document),
+}
 
-
-@signals.post_delete.connect
-def delete_truck_loading_on_delete(sender, document, **kwargs):
-    """
-    Signal to delete a TruckLoading document from the index when it's deleted.
-    """
-    if isinstance(document, TruckLoading):
-        delete_truck_loading(str(document.id))
-
-
-@signals.post_save.connect
-def index_loaded_product_on_save(sender, document, **kwargs):
-    """
-    Signal to index a LoadedProduct document when it's saved.
-    """
-    if isinstance(document, LoadedProduct):
-        data = LoadedProductSerializer(document).data
-        index_loaded_product(data)
-
-
-@signals.post_delete.connect
-def delete_loaded_product_on_delete(sender, document, **kwargs):
-    """
-    Signal to delete a LoadedProduct document from the index when it's deleted.
-    """
-    if isinstance(document, LoadedProduct):
-        delete_loaded_product(str(document.id))
-
-
-@signals.post_save.connect
-def index_loaded_product_item_on_save(sender, document, **kwargs):
-    """
-    Signal to index a LoadedProductItem document when it's saved.
-    """
-    if isinstance(document, LoadedProductItem):
-        data = LoadedProductItemSerializer(document).data
-        index_loaded_product_item(data)
-
-
-@signals.post_delete.connect
-def delete_loaded_product_item_on_delete(sender, document, **kwargs):
-    """
-    Signal to delete a LoadedProductItem document from the index when it's deleted.
-    """
-    if isinstance(document, LoadedProductItem):
-        delete_loaded_product_item(str(document.id))
+register_indexers(INDEXERS)
@@ -19,11 +19,10 @@ def create_index_truck_loading():
     )
 
 
-def index_truck_loading(data: dict):
+def build_truck_loading_document(data: dict) -> dict:
     """
-    Index a TruckLoading document in Elasticsearch.
+    Build the Elasticsearch document for a TruckLoading.
     """
-    es = settings.ELASTICSEARCH_CONNECTION
     try:
         car_postfix_number = data['car']['car']['postfix_number']
         car_prefix_number = data['car']['car']['prefix_number']
@@ -33,13 +32,21 @@ def index_truck_loading(data: dict):
 
     except Exception:
         car = 'unknown'
+    return {
+        'car': car,
+        'buyer': data.get('buyer', ''),
+    }
+
+
+def index_truck_loading(data: dict):
+    """
+    Index a TruckLoading document in Elasticsearch.
+    """
+    es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='truck_loading',
         id=data['id'],
-        document={
-            'car': car,
-            'buyer': data.get('buyer', ''),
-        }
+        document=build_truck_loading_document(data)
     )
 
 
@@ -67,11 +74,10 @@ def create_index_loaded_product():
     )
 
 
-def index_loaded_product(data: dict):
+def build_loaded_product_document(data: dict) -> dict:
     """
-    Index a LoadedProduct document in Elasticsearch.
+    Build the Elasticsearch document for a LoadedProduct.
     """
-    es = settings.ELASTICSEARCH_CONNECTION
     try:
         car_postfix_number = data['car']['car']['postfix_number']
         car_prefix_number = data['car']['car']['prefix_number']
@@ -81,13 +87,21 @@ def index_loaded_product(data: dict):
 
     except Exception:
         car = 'unknown'
+    return {
+        'product': data.get('product', {}).get('name', 'unknown'),
+        'car': car,
+    }
+
+
+def index_loaded_product(data: dict):
+    """
+    Index a LoadedProduct document in Elasticsearch.
+    """
+    es = settings.ELASTICSEARCH_CONNECTION
     es.index(
         index='loaded_product',
         id=data['id'],
-        document={
-            'product': data.get('product', {}).get('name', 'unknown'),
-            'car': car,
-        }
+        document=build_loaded_product_document(data)
     )
 
 
@@ -114,6 +128,15 @@ def create_index_loaded_product_item():
     )
 
 
+def build_loaded_product_item_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a LoadedProductItem.
+    """
+    return {
+        'loaded_product': data.get('loaded_product', {}).get('id', 'unknown'),
+    }
+
+
 def index_loaded_product_item(data: dict):
     """
     Index a LoadedProductItem document in Elasticsearch.
@@ -122,9 +145,7 @@ def index_loaded_product_item(data: dict):
     es.index(
         index='loaded_product_item',
         id=data['id'],
-        document={
-            'loaded_product': data.get('loaded_product', {}).get('id', 'unknown'),
-        }
+        document=build_loaded_product_item_document(data)
     )
 
 
@@ -1,9 +1,14 @@
-from typing import Any, Dict, Optional
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from django.conf import settings
-from django.http import JsonResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
 from rest_framework import status
 
 from utils.CustomAPIView.base_api_view import BaseMongoAPIView
+from utils.CustomAPIView.pagination import InvalidCursor
+from utils.CustomSerializer.field_selection import FieldSelection
+from utils.request_timing import timed_stage
 
 
 class GetMongoAPIView(BaseMongoAPIView):
@@ -27,7 +32,7 @@ class GetMongoAPIView(BaseMongoAPIView):
 
     def single_get(self, request: Any, slug_field: Optional[str] = None, *args, **kwargs) -> JsonResponse:
         """
-        Retrieve a single MongoDB document by the lookup field.
+        Retrieve a single MongoDB document by the lookup field, limited to `fields` if given.
 
         Args:
             request: The incoming HTTP request.
@@ -36,6 +41,24 @@ class GetMongoAPIView(BaseMongoAPIView):
         Returns:
             JsonResponse: The serialized document or an error response if not found.
         """
+        selection_status, selection = self.get_field_selection()
+        if not selection_status:
+            self.store_logs(
+                request=request,
+                response=selection,
+                response_status_code=status.HTTP_400_BAD_REQUEST
+            )
+            return JsonResponse(data=selection, status=status.HTTP_400_BAD_REQUEST)
+
+        response_data, cache_key = self.get_cached_response('single_get', slug_field=slug_field)
+        if response_data is not None:
+            self.store_logs(
+                request=request,
+                response=response_data,
+                response_status_code=status.HTTP_200_OK
+            )
+            return JsonResponse(data=response_data, status=status.HTTP_200_OK)
+
         if slug_field == 'test_id':
             query_list = self.get_queryset()
             obj = query_list[0] if query_list else None
@@ -51,8 +74,9 @@ class GetMongoAPIView(BaseMongoAPIView):
             )
             return JsonResponse(data=response_data, status=status.HTTP_404_NOT_FOUND)
 
-        serializer = self.serializer_class['GET'](obj)
+        serializer = self.serializer_class['GET'](obj, fields=selection)
         response_data = serializer.data
+        self.store_cached_response(cache_key, response_data)
         self.store_logs(
             request=request,
             response=response_data,
@@ -64,34 +88,238 @@ class GetMongoAPIView(BaseMongoAPIView):
         """
         Retrieve a filtered and ordered list of MongoDB documents, optionally using Elasticsearch.
 
+        Pagination is opt-in: with `limit` (and the `cursor` of a previous page) the
+        response holds one page plus `next_cursor`, and `estimated_total` when
+        `estimated_total=1` is given. With `stream=1` (or `stream=ndjson`) every
+        matching document is streamed instead, see `stream_bulk_get`. `fields=a,b,c.d`
+        limits the loaded and returned fields. Non-streamed MongoDB results are served
+        from the versioned result cache when possible.
+
+        With `q`, the Elasticsearch index is searched instead: results are in relevance
+        order (paged by `limit`/`cursor` as above, otherwise the first
+        `ELASTICSEARCH_SEARCH_LIMIT` hits), answered from the indexed `_source` unless
+        `hydrate=1` asks for the full MongoDB objects, and reported with their hit count
+        and timing under `search`.
+
         Args:
             request: The incoming HTTP request containing query parameters.
 
         Returns:
             JsonResponse: The serialized list of documents or an error response.
         """
-        query_set = None
-        if getattr(settings, 'ELASTICSEARCH_STATUS', False):
-            for key, value in request.query_params.items():
-                if key == 'q':
-                    query_set = self.search_elasticsearch(value)
-                    break
-
-        if query_set is None:
-            query_status, query_set = self.get_queryset_with_filters()
-            if not query_status:
+        pagination_status, pagination = self.get_pagination_params()
+        if not pagination_status:
+            self.store_logs(
+                request=request,
+                response=pagination,
+                response_status_code=status.HTTP_400_BAD_REQUEST
+            )
+            return JsonResponse(data=pagination, status=status.HTTP_400_BAD_REQUEST)
+
+        selection_status, selection = self.get_field_selection()
+        if not selection_status:
+            self.store_logs(
+                request=request,
+                response=selection,
+                response_status_code=status.HTTP_400_BAD_REQUEST
+            )
+            return JsonResponse(data=selection, status=status.HTTP_400_BAD_REQUEST)
+
+        stream_format = self.get_stream_format()
+        if stream_format and pagination:
+            response_data = {'message': 'stream cannot be combined with limit or cursor'}
+            self.store_logs(
+                request=request,
+                response=response_data,
+                response_status_code=status.HTTP_400_BAD_REQUEST
+            )
+            return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        search_query = request.query_params.get('q')
+        if search_query is not None and getattr(settings, 'ELASTICSEARCH_STATUS', False):
+            if stream_format:
+                response_data = {'message': 'stream cannot be combined with q'}
+                self.store_logs(
+                    request=request,
+                    response=response_data,
+                    response_status_code=status.HTTP_400_BAD_REQUEST
+                )
+                return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
+
+            hydrate = request.query_params.get('hydrate', '').lower() in ('1', 'true', 'yes')
+            try:
+                with timed_stage('search'):
+                    query_set = self.search_elasticsearch(search_query, hydrate=hydrate)
+            except InvalidCursor as e:
+                response_data = {'message': str(e)}
                 self.store_logs(
                     request=request,
-                    response=query_set,
+                    response=response_data,
                     response_status_code=status.HTTP_400_BAD_REQUEST
                 )
-                return JsonResponse(data=query_set, status=status.HTTP_400_BAD_REQUEST)
+                return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
+
+            # Search results are paged and answered from the index unless full objects were asked for
+            response_data = {
+                'data': self.serializer_class['GET'](query_set, many=True, fields=selection).data
+                if hydrate else query_set,
+                'search': self.search_info,
+            }
+            if pagination:
+                response_data['next_cursor'] = self.next_cursor
+            if request.query_params.get('estimated_total', '').lower() in ('1', 'true', 'yes'):
+                response_data['estimated_total'] = self.estimated_total
+            self.store_logs(
+                request=request,
+                response=response_data,
+                response_status_code=status.HTTP_200_OK
+            )
+            return JsonResponse(data=response_data, status=status.HTTP_200_OK)
+
+        cache_key = None
+        if not stream_format:
+            response_data, cache_key = self.get_cached_response('bulk_get')
+            if response_data is not None:
+                self.store_logs(
+                    request=request,
+                    response=response_data,
+                    response_status_code=status.HTTP_200_OK
+                )
+                return JsonResponse(data=response_data, status=status.HTTP_200_OK)
+
+        query_status, query_set = self.get_queryset_with_filters()
+        if not query_status:
+            self.store_logs(
+                request=request,
+                response=query_set,
+                response_status_code=status.HTTP_400_BAD_REQUEST
+            )
+            return JsonResponse(data=query_set, status=status.HTTP_400_BAD_REQUEST)
+        if pagination:
+            query_set = self.fetch_page(query_set, pagination)
 
-        serializer = self.serializer_class['GET'](query_set, many=True)
+        if stream_format:
+            return self.stream_bulk_get(request, query_set, stream_format, selection)
+
+        serializer = self.serializer_class['GET'](query_set, many=True, fields=selection)
         response_data = {'data': serializer.data}
+        if pagination:
+            response_data['next_cursor'] = self.next_cursor
+            if request.query_params.get('estimated_total', '').lower() in ('1', 'true', 'yes'):
+                response_data['estimated_total'] = self.estimate_total()
+        self.store_cached_response(cache_key, response_data)
+
         self.store_logs(
             request=request,
             response=response_data,
             response_status_code=status.HTTP_200_OK
         )
-        return JsonResponse(data=response_data, status=status.HTTP_200_OK)
\ No newline at end of file
+        return JsonResponse(data=response_data, status=status.HTTP_200_OK)
+
+    def get_stream_format(self) -> Optional[str]:
+        """
+        Read the `stream` query parameter.
+
+        Returns:
+            Optional[str]: 'ndjson' or 'json' when streaming was requested, else None.
+        """
+        value = self.request.query_params.get('stream', '').lower()
+        if value == 'ndjson':
+            return 'ndjson'
+        if value in ('1', 'true', 'yes', 'json'):
+            return 'json'
+        return None
+
+    def stream_bulk_get(self, request: Any, query_set: Any, stream_format: str,
+                        selection: Optional[FieldSelection] = None) -> StreamingHttpResponse:
+        """
+        Stream every document of a query as NDJSON or as a chunked `{"data": [...]}` array.
+
+        The Mongo cursor is read in batches of `STREAM_BATCH_SIZE` without caching and each
+        batch is serialized on its own, so memory stays flat regardless of the result size.
+        A summary of the streamed response is logged once the stream ends.
+
+        Args:
+            request: The incoming HTTP request.
+            query_set: The filtered queryset (or list of documents for search results).
+            stream_format: 'ndjson' or 'json'.
+            selection: Sparse fieldset to serialize, if any.
+
+        Returns:
+            StreamingHttpResponse: The streamed documents.
+        """
+        batch_size = getattr(settings, 'STREAM_BATCH_SIZE', 500)
+        if hasattr(query_set, 'no_cache'):
+            query_set = query_set.no_cache().batch_size(batch_size)
+
+        content_type = 'application/x-ndjson' if stream_format == 'ndjson' else 'application/json'
+        response = StreamingHttpResponse(
+            self._stream_rows(request, query_set, stream_format, batch_size, selection),
+            content_type=content_type,
+            status=status.HTTP_200_OK
+        )
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def _stream_rows(self, request: Any, documents: Iterable[Any], stream_format: str,
+                     batch_size: int, selection: Optional[FieldSelection] = None) -> Iterator[str]:
+        """
+        Serialize documents batch by batch and yield the encoded chunks.
+
+        Args:
+            request: The incoming HTTP request, used for the log summary.
+            documents: Documents to stream.
+            stream_format: 'ndjson' or 'json'.
+            batch_size: Number of documents serialized at once.
+            selection: Sparse fieldset to serialize, if any.
+
+        Yields:
+            str: Encoded chunks of the response body.
+        """
+        serializer_class = self.serializer_class['GET']
+        ndjson = stream_format == 'ndjson'
+        count = 0
+        completed = False
+        try:
+            if not ndjson:
+                yield '{"data": ['
+
+            for batch in self._batched(documents, batch_size):
+                rows = serializer_class(batch, many=True, fields=selection).data
+                if ndjson:
+                    yield ''.join(json.dumps(row, cls=DjangoJSONEncoder) + '\n' for row in rows)
+                else:
+                    chunk = ', '.join(json.dumps(row, cls=DjangoJSONEncoder) for row in rows)
+                    yield (', ' if count else '') + chunk
+                count += len(rows)
+
+            if not ndjson:
+                yield ']}'
+            completed = True
+        finally:
+            self.store_logs(
+                request=request,
+                response={'stream': stream_format, 'count': count, 'completed': completed},
+                response_status_code=status.HTTP_200_OK
+            )
+
+    @staticmethod
+    def _batched(documents: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+        """
+        Split an iterable of documents into lists of at most `batch_size` items.
+
+        Args:
+            documents: Documents to split.
+            batch_size: Maximum batch length.
+
+        Yields:
+            List[Any]: The next batch.
+        """
+        batch = []
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
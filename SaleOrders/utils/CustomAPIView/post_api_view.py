@@ -1,4 +1,5 @@
 from typing import Any, Dict, Tuple, Optional
+from django.conf import settings
 from django.http import JsonResponse
 from rest_framework import status
 
@@ -67,11 +68,15 @@ class PostMongoAPIView(BaseMongoAPIView):
         """
         Create multiple MongoDB documents from the provided request data.
 
+        Documents are written with `insert_many` in chunks of `BULK_INSERT_CHUNK_SIZE`;
+        items that fail to insert are reported per index in `results` while the rest
+        are still created.
+
         Args:
             request: The incoming HTTP request containing a list of data in 'data'.
 
         Returns:
-            JsonResponse: The created documents or an error response if validation fails.
+            JsonResponse: The created documents with per-item results, or an error response if validation fails.
         """
         request_data = request.data.get('data')
         if not request_data:
@@ -112,17 +117,28 @@ class PostMongoAPIView(BaseMongoAPIView):
             )
             return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
 
-        model_serializer = serializer(request_data, many=True)
-        model_serializer.create(request)
+        model_serializer = serializer(request_data, many=True, parse_data=False)
+        results = model_serializer.bulk_create(
+            request,
+            chunk_size=getattr(settings, 'BULK_INSERT_CHUNK_SIZE', 500)
+        )
         self.update_cache()
 
-        response_data = {'data': model_serializer.data}
+        created = sum(1 for result in results.values() if isinstance(result, dict))
+        if created == len(results):
+            response_status_code = status.HTTP_200_OK
+        elif created:
+            response_status_code = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status_code = status.HTTP_400_BAD_REQUEST
+
+        response_data = {'data': model_serializer.data, 'results': results}
         self.store_logs(
             request=request,
             response=response_data,
-            response_status_code=status.HTTP_200_OK
+            response_status_code=response_status_code
         )
-        return JsonResponse(data=response_data, status=status.HTTP_200_OK)
+        return JsonResponse(data=response_data, status=response_status_code)
 
     def check_post_data(self, data: Any, serializer: Any, many: bool = False) -> Tuple[bool, Dict]:
         """
@@ -44,6 +44,13 @@ class CustomRouter:
             }))
         )
 
+        # Register URL pattern describing the filters accepted by bulk GET
+        self.urls.append(
+            path(f'{url}filters/', view.as_view({
+                'get': 'filters_metadata',
+            }))
+        )
+
         # Register URL patterns for single operations
         self.urls.append(
             path(f'{url}c/<str:slug_field>/', view.as_view({
@@ -2,6 +2,7 @@ from api.v1.core.views_roles.view import ViewsRolesAPIView
 from api.v1.warehouse.Inventory.view import InventoryAPIView
 from api.v1.warehouse.transaction.view import TransactionAPIView
 from api.v1.warehouse.warehouse.view import WarehouseAPIView
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 from utils.CustomRouter.CustomRouter import CustomRouter
 
@@ -16,4 +17,11 @@ drf_router = DefaultRouter()
 # drf_router.register('core-views-roles', ViewsRolesAPIView, basename='view-roles')
 
 urlpatterns = router.urls
+urlpatterns += [
+    # point-in-time stock balances per warehouse and product
+    path('inventory/balances/', InventoryAPIView.as_view({'get': 'balances'})),
+    # first expired first out picking and expiring stock
+    path('inventory/fefo/', InventoryAPIView.as_view({'get': 'fefo'})),
+    path('inventory/expiring/', InventoryAPIView.as_view({'get': 'expiring'})),
+]
 urlpatterns += drf_router.urls
@@ -0,0 +1,96 @@
+import datetime
+from typing import Any, List, Optional
+
+from apps.warehouse.documents import Inventory, Warehouse
+
+# Inventories with stock left according to their ledger balance, or to their legacy
+# quantity while the ledger has no entries for them (see rebuild_inventory_balances --backfill)
+IN_STOCK = {'$or': [
+    {'balance.weight': {'$gt': 0}},
+    {'balance.number': {'$gt': 0}},
+    {'balance.updated_at': None, '$or': [{'quantity.weight': {'$gt': 0}}, {'quantity.number': {'$gt': 0}}]},
+]}
+
+
+def fefo_inventories(product: int, limit: int, include_expired: bool = False,
+                     now: Optional[datetime.datetime] = None) -> Any:
+    """
+    Return the in-stock inventories of a product in active warehouses, first expiring first.
+
+    Served by the `product_expires_at` index. Inventories without an expiry (non-perishable
+    or unreadable expire_date) are not candidates.
+
+    Args:
+        product: Product id (an integer, or its string).
+        limit: Maximum number of inventories.
+        include_expired: Whether to include inventories that already expired.
+        now: Current UTC time, defaults to now.
+
+    Returns:
+        QuerySet: Inventories ordered by expiry, then id.
+    """
+    now = now or datetime.datetime.utcnow()
+    expires_at = {'$ne': None} if include_expired else {'$gt': now}
+    return Inventory.objects(__raw__={
+        'product': _product_id(product),
+        'shelf_life.expires_at': expires_at,
+        'warehouse': {'$in': _active_warehouses()},
+        **IN_STOCK,
+    }).order_by('shelf_life__expires_at', 'id').limit(limit)
+
+
+def expiring_inventories(hours: float, limit: int, warehouses: Optional[List[str]] = None,
+                         product: Optional[int] = None, now: Optional[datetime.datetime] = None) -> Any:
+    """
+    Return the in-stock inventories expiring between now and `hours` from now, soonest first.
+
+    A range scan of the `expires_at` index (or `product_expires_at` with a product).
+
+    Args:
+        hours: Size of the window in hours.
+        limit: Maximum number of inventories.
+        warehouses: Only these warehouses, if given.
+        product: Only this product id (an integer, or its string), if given.
+        now: Current UTC time, defaults to now.
+
+    Returns:
+        QuerySet: Inventories ordered by expiry, then id.
+    """
+    now = now or datetime.datetime.utcnow()
+    query = {
+        'shelf_life.expires_at': {'$gt': now, '$lte': now + datetime.timedelta(hours=hours)},
+        **IN_STOCK,
+    }
+    if warehouses:
+        query['warehouse'] = {'$in': warehouses}
+    if product:
+        query['product'] = _product_id(product)
+    return Inventory.objects(__raw__=query).order_by('shelf_life__expires_at', 'id').limit(limit)
+
+
+def _product_id(product: Any) -> int:
+    """
+    Convert a product id to its stored type, as raw queries bypass the field conversion.
+
+    `Product.id` is an IntField, so `Inventory.product` holds integers.
+
+    Args:
+        product: Product id.
+
+    Returns:
+        int: The id as stored in `Inventory.product`.
+
+    Raises:
+        ValueError: If the id is not an integer.
+    """
+    return int(product)
+
+
+def _active_warehouses() -> List[str]:
+    """
+    Return the ids of the active warehouses.
+
+    Returns:
+        List[str]: Warehouse ids.
+    """
+    return [row['_id'] for row in Warehouse._get_collection().find({'is_active': True}, {'_id': 1})]
@@ -1,4 +1,8 @@
+import datetime
+
+from django.http import JsonResponse
 from django.utils.decorators import method_decorator
+from rest_framework import status
 
 from api.v1.warehouse.Inventory.swagger_decorator import (
     bulk_post_request_decorator,
@@ -10,8 +14,10 @@ from api.v1.warehouse.Inventory.swagger_decorator import (
     bulk_delete_request_decorator,
     single_delete_request_decorator,
 )
+from api.v1.warehouse.Inventory.utils import expiring_inventories, fefo_inventories
 from apps.warehouse.documents import Inventory
-from apps.warehouse.serializer import InventorySerializer, InventorySerializerPOST
+from apps.warehouse.serializer import InventorySerializer, InventorySerializerPATCH, InventorySerializerPOST
+from apps.warehouse.snapshots import HistoryUnavailable, balances_as_of
 from utils.CustomAPIView.api_view import CustomAPIView
 
 
@@ -48,7 +54,8 @@ class InventoryAPIView(CustomAPIView):
         self.serializer_class = {
             'GET': InventorySerializer,
             'POST': InventorySerializerPOST,
-            'PATCH': InventorySerializer,
+            # balance is maintained by the transaction ledger only
+            'PATCH': InventorySerializerPATCH,
             'PERFORM_ACTION': {}
         }
 
@@ -74,3 +81,102 @@ class InventoryAPIView(CustomAPIView):
             QuerySet: All Inventory objects.
         """
         return Inventory.objects()
+
+    def balances(self, request):
+        """
+        Return the stock balance per warehouse and product at a point in time.
+
+        Query parameters: `as_of` (ISO 8601, UTC when naive; defaults to now) and
+        comma-separated `warehouse` and `product` ids. An `as_of` before the start of the
+        ledger history is refused.
+
+        Returns:
+            JsonResponse: The balances computed from the nearest snapshot and the ledger.
+        """
+        as_of = request.query_params.get('as_of')
+        try:
+            as_of = datetime.datetime.fromisoformat(as_of) if as_of else datetime.datetime.utcnow()
+        except ValueError:
+            response_data = {'message': f'invalid as_of datetime: {as_of}'}
+            self.store_logs(request=request, response=response_data, response_status_code=status.HTTP_400_BAD_REQUEST)
+            return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
+        if as_of.tzinfo is not None:
+            as_of = as_of.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+        warehouses = [value for value in request.query_params.get('warehouse', '').split(',') if value]
+        products = [value for value in request.query_params.get('product', '').split(',') if value]
+        try:
+            response_data = balances_as_of(as_of, warehouses or None, products or None)
+        except HistoryUnavailable as e:
+            response_data = {'message': str(e), 'history_start': e.history_start}
+            self.store_logs(request=request, response=response_data, response_status_code=status.HTTP_400_BAD_REQUEST)
+            return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
+        self.store_logs(request=request, response=response_data, response_status_code=status.HTTP_200_OK)
+        return JsonResponse(data=response_data, status=status.HTTP_200_OK)
+
+    def fefo(self, request):
+        """
+        Return the picking candidates of a product across warehouses, first expired first out.
+
+        Query parameters: `product` (required), `limit` (default 20) and `include_expired`.
+
+        Returns:
+            JsonResponse: In-stock inventories of active warehouses ordered by expiry.
+        """
+        product = self._positive_int(request.query_params.get('product'), None)
+        limit = self._positive_int(request.query_params.get('limit'), 20)
+        if product is None or limit is None:
+            response_data = {'message': 'product is required; product and limit must be positive integers'}
+            self.store_logs(request=request, response=response_data, response_status_code=status.HTTP_400_BAD_REQUEST)
+            return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        include_expired = request.query_params.get('include_expired', '').lower() in ('1', 'true', 'yes')
+        query_set = fefo_inventories(product, limit, include_expired=include_expired)
+        response_data = {'data': self.serializer_class['GET'](query_set, many=True).data}
+        self.store_logs(request=request, response=response_data, response_status_code=status.HTTP_200_OK)
+        return JsonResponse(data=response_data, status=status.HTTP_200_OK)
+
+    def expiring(self, request):
+        """
+        Return the in-stock inventories expiring within the next N hours.
+
+        Query parameters: `hours` (default 48), `limit` (default 100) and optional
+        comma-separated `warehouse` ids and a `product` id.
+
+        Returns:
+            JsonResponse: The inventories ordered by expiry.
+        """
+        limit = self._positive_int(request.query_params.get('limit'), 100)
+        product = self._positive_int(request.query_params.get('product'), 0)
+        try:
+            hours = float(request.query_params.get('hours', 48))
+        except ValueError:
+            hours = -1
+        if limit is None or product is None or not 0 < hours < float('inf'):
+            response_data = {'message': 'hours, limit and product must be positive numbers'}
+            self.store_logs(request=request, response=response_data, response_status_code=status.HTTP_400_BAD_REQUEST)
+            return JsonResponse(data=response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        warehouses = [value for value in request.query_params.get('warehouse', '').split(',') if value]
+        query_set = expiring_inventories(
+            hours, limit, warehouses=warehouses or None, product=product or None
+        )
+        response_data = {'data': self.serializer_class['GET'](query_set, many=True).data}
+        self.store_logs(request=request, response=response_data, response_status_code=status.HTTP_200_OK)
+        return JsonResponse(data=response_data, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _positive_int(value, default):
+        """
+        Parse an optional positive integer query parameter.
+
+        Returns:
+            Optional[int]: The value, the default when missing, or None when invalid.
+        """
+        if value in (None, ''):
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            return None
+        return value if value > 0 else None
@@ -3,4 +3,5 @@ from django.utils import timezone
 http_200_transaction = {'message': 'transaction successfully verified'}
 http_400_transaction = {'message': 'you cant verify this transaction because ware house is not active right now.'
                                f' (date : {timezone.now()})'}
-http_404_transaction = {'message': 'object didint find with your send id'}
\ No newline at end of file
+http_404_transaction = {'message': 'object didint find with your send id'}
+http_409_transaction = {'message': 'transaction is already verified'}
@@ -4,6 +4,7 @@ from rest_framework import status
 from api.v1.warehouse.transaction.conf import *
 from apps.core.documents import CheckStatus, DateUser
 from apps.warehouse.documents import Transaction
+from apps.warehouse.ledger import post_transaction
 from utils.models_utils import get_model_object
 
 
@@ -13,13 +14,16 @@ def verify_transaction(user, slug, lookup_field):
 
     if obj:
 
+        if obj.is_verified and obj.is_verified.status:
+            return JsonResponse(data=http_409_transaction, status=status.HTTP_409_CONFLICT)
+
         warehouse = obj.inventory.warehouse
 
         if warehouse.is_active:
 
-            obj.is_verified = CheckStatus(status=True, user_date=DateUser(user=user))
-
-            obj.save()
+            # marks the transaction verified and applies it to the inventory balance and ledger
+            if not post_transaction(obj, user):
+                return JsonResponse(data=http_409_transaction, status=status.HTTP_409_CONFLICT)
 
             return JsonResponse(data=http_200_transaction, status=status.HTTP_200_OK)
 
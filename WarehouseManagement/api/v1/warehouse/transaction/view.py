@@ -13,7 +13,7 @@ from api.v1.warehouse.transaction.swagger_decorator import (
 )
 from api.v1.warehouse.transaction.utils import verify_transaction
 from apps.warehouse.documents import Transaction
-from apps.warehouse.serializer import TransactionSerializer, TransactionSerializerPOST
+from apps.warehouse.serializer import TransactionSerializer, TransactionSerializerPATCH, TransactionSerializerPOST
 from utils.CustomAPIView.api_view import CustomAPIView
 
 
@@ -52,7 +52,7 @@ class TransactionAPIView(CustomAPIView):
         self.serializer_class = {
             'GET': TransactionSerializer,
             'POST': TransactionSerializerPOST,
-            'PATCH': TransactionSerializer,
+            'PATCH': TransactionSerializerPATCH,
             'PERFORM_ACTION': {}
         }
 
@@ -65,6 +65,9 @@ class TransactionAPIView(CustomAPIView):
             'PERFORM_ACTION': ['admin'],
         }
 
+        # Verified transactions are in the inventory ledger and balances: they are not deleted
+        self.delete_protected_query = {'is_verified.status': True}
+
         self.elasticsearch_index_name = 'transaction'
         self.elasticsearch_fields = [
             "product_name",
@@ -86,6 +89,7 @@ class TransactionAPIView(CustomAPIView):
         Verify a transaction.
         """
         return verify_transaction(
+            user=getattr(request, 'user_payload', {}).get('username'),
             slug=slug,
             lookup_field=getattr(self, 'lookup_field', 'id')
         )
\ No newline at end of file
@@ -1,6 +1,9 @@
+import datetime
+
 import mongoengine as mongo
 
 from apps.core.documents import Product, DateUser, CheckStatus
+from apps.warehouse.expiry import parse_expire_date
 from utils.id_generator import id_generator
 
 
@@ -11,6 +14,15 @@ class Quantity(mongo.EmbeddedDocument):
     is_weight_base = mongo.BooleanField(default=True)
 
 
+# Embedded document for the materialized stock balance of an Inventory
+class Balance(mongo.EmbeddedDocument):
+    weight = mongo.FloatField(default=0.0)
+    number = mongo.IntField(default=0)
+    updated_at = mongo.DateTimeField()
+    # last transactions added to the balance, so a retried posting is never added twice
+    transactions = mongo.ListField(mongo.StringField())
+
+
 # Embedded document for ShelfLife
 class ShelfLife(mongo.EmbeddedDocument):
 
@@ -19,6 +31,15 @@ class ShelfLife(mongo.EmbeddedDocument):
     # production_date = mongo.DateTimeField()
     # expire_date = mongo.DateTimeField()
     is_perishable = mongo.BooleanField(default=True)
+    # expire_date parsed to UTC on every validated write, for FEFO and expiry queries
+    expires_at = mongo.DateTimeField()
+
+    def clean(self):
+        self.expires_at = parse_expire_date(self.expire_date)
+        # Stored unreadable values are left without expires_at (backfill_inventory_expiry lists them); only new ones are refused
+        written = self._created or 'expire_date' in self._get_changed_fields()
+        if written and self.expire_date and self.expires_at is None:
+            raise mongo.ValidationError(f'Unreadable expire_date: {self.expire_date}')
 
 
 # Document for production warehouse
@@ -29,7 +50,12 @@ class Warehouse(mongo.Document):
     description = mongo.StringField(null=True, default='')
     is_production_warehouse = mongo.BooleanField(default=True)
     create_date = mongo.EmbeddedDocumentField(DateUser, default=lambda req: DateUser(user=req.user_payload['username']))
-    meta = {'collection': 'warehouse'}
+    meta = {
+        'collection': 'warehouse',
+        'indexes': [
+            {'fields': ['-create_date.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
 
 
 # Document for Inventory
@@ -37,10 +63,45 @@ class Inventory(mongo.Document):
     id = mongo.StringField(primary_key=True, default=lambda: id_generator('Inventory'))
     product = mongo.ReferenceField(Product, required=True)
     shelf_life = mongo.EmbeddedDocumentField(ShelfLife, required=True)
+    # Legacy stock figure; mirrors the balance once the inventory has ledger entries
     quantity = mongo.EmbeddedDocumentField(Quantity, default=lambda x: Quantity())
     warehouse = mongo.ReferenceField(Warehouse, required=True)
+    # Sum of the verified transactions, maintained by apps.warehouse.ledger
+    balance = mongo.EmbeddedDocumentField(Balance, default=lambda: Balance())
+
+    meta = {
+        'collection': 'inventory',
+        'indexes': [
+            {'fields': ['product', 'warehouse'], 'name': 'product_warehouse'},
+            {'fields': ['warehouse', 'product'], 'name': 'warehouse_product'},
+            {'fields': ['product', 'shelf_life.expires_at'], 'name': 'product_expires_at'},
+            {'fields': ['shelf_life.expires_at'], 'name': 'expires_at'},
+        ],
+    }
 
-    meta = {'collection': 'inventory'}
+    def clean(self):
+        # Postings are grouped by the warehouse and product they were made in
+        changed = self._get_changed_fields()
+        if self.pk and not self._created and ('warehouse' in changed or 'product' in changed):
+            warehouse, product = self.ledger_keys()
+            moved = InventoryLedger._get_collection().find_one({
+                'inventory': self.pk,
+                '$or': [{'warehouse': {'$ne': warehouse}}, {'product': {'$ne': product}}],
+            }, {'_id': 1})
+            if moved:
+                raise mongo.ValidationError('The warehouse and product of an inventory with verified transactions cannot change')
+
+    def ledger_keys(self):
+        """
+        Return the warehouse and product ids as stored in the inventory ledger (as strings), without dereferencing them.
+
+        Returns:
+            tuple: The warehouse id and the product id.
+        """
+        return tuple(
+            str(self._fields[name].to_mongo(self._data.get(name))) if self._data.get(name) is not None else None
+            for name in ('warehouse', 'product')
+        )
 
 
 # Document for Transaction
@@ -54,4 +115,82 @@ class Transaction(mongo.Document):
     storage_location = mongo.StringField(null=True, default='')
     description = mongo.StringField(default='')
 
-    meta = {'collection': 'transaction'}
+    meta = {
+        'collection': 'transaction',
+        'indexes': [
+            {'fields': ['inventory', '-create_date.date', '-id'], 'name': 'inventory_create_date_desc'},
+            {'fields': ['-create_date.date', '-id'], 'name': 'create_date_desc'},
+        ],
+    }
+
+    def clean(self):
+        # A verified transaction is in the inventory ledger and balance: it is only changed by verifying it
+        if self.pk and not self._created and self._get_changed_fields() and self._get_collection().count_documents(
+                {'_id': self.pk, 'is_verified.status': True}, limit=1):
+            raise mongo.ValidationError('Verified transactions cannot be changed')
+
+
+# Append-only ledger of the stock movements of every Inventory (one entry per verified Transaction)
+class InventoryLedger(mongo.Document):
+    inventory = mongo.StringField(required=True)
+    transaction = mongo.StringField(required=True)
+    # denormalized from the inventory so balances can be grouped per warehouse and product
+    warehouse = mongo.StringField()
+    product = mongo.StringField()
+    weight = mongo.FloatField(default=0.0)  # signed: positive for imports, negative for exports
+    number = mongo.IntField(default=0)
+    user = mongo.StringField(null=True)
+    created_at = mongo.DateTimeField(default=datetime.datetime.utcnow)
+    # set by apps.warehouse.ledger once the movement is in the inventory balance
+    applied = mongo.BooleanField(default=False)
+    # posted by the backfill of transactions verified before the ledger existed, dated at the backfill
+    backfilled = mongo.BooleanField(default=False)
+
+    meta = {
+        'collection': 'inventory_ledger',
+        'indexes': [
+            {'fields': ['transaction'], 'name': 'transaction_unique', 'unique': True},
+            {'fields': ['inventory', 'created_at'], 'name': 'inventory_created_at'},
+            {'fields': ['created_at'], 'name': 'created_at'},
+            {'fields': ['applied'], 'name': 'unapplied', 'partialFilterExpression': {'applied': False}},
+            {'fields': ['-created_at'], 'name': 'backfilled_created_at', 'partialFilterExpression': {'backfilled': True}},
+        ],
+    }
+
+    def save(self, *args, **kwargs):
+        if self.pk is not None:
+            raise mongo.OperationError('Inventory ledger entries are immutable')
+        return super().save(*args, **kwargs)
+
+    def update(self, **kwargs):
+        raise mongo.OperationError('Inventory ledger entries are immutable')
+
+    def delete(self, *args, **kwargs):
+        raise mongo.OperationError('Inventory ledger entries are immutable')
+
+
+# Balance of one (warehouse, product) pair at the time of a snapshot run
+class BalanceSnapshot(mongo.Document):
+    taken_at = mongo.DateTimeField(required=True)
+    warehouse = mongo.StringField(required=True)
+    product = mongo.StringField(required=True)
+    weight = mongo.FloatField(default=0.0)
+    number = mongo.IntField(default=0)
+
+    meta = {
+        'collection': 'balance_snapshots',
+        'indexes': [
+            {'fields': ['taken_at', 'warehouse', 'product'], 'name': 'taken_at_warehouse_product', 'unique': True},
+        ],
+    }
+
+
+# A snapshot run; only completed runs are read, so a run interrupted halfway is never used
+class BalanceSnapshotRun(mongo.Document):
+    taken_at = mongo.DateTimeField(required=True, unique=True)
+    completed_at = mongo.DateTimeField()
+    rows = mongo.IntField(default=0)
+
+    meta = {
+        'collection': 'balance_snapshot_runs',
+    }
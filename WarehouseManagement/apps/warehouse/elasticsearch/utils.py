@@ -21,6 +21,18 @@ def create_index_warehouse():
     )
 
 
+def build_warehouse_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a Warehouse.
+    """
+    return {
+        'name': data.get('name', ''),
+        'is_active': data.get('is_active', True),
+        'description': data.get('description', ''),
+        'is_production_warehouse': data.get('is_production_warehouse', True),
+    }
+
+
 def index_warehouse(data: dict):
     """
     Index a Warehouse document in Elasticsearch.
@@ -29,12 +41,7 @@ def index_warehouse(data: dict):
     es.index(
         index='warehouse',
         id=data['id'],
-        document={
-            'name': data.get('name', ''),
-            'is_active': data.get('is_active', True),
-            'description': data.get('description', ''),
-            'is_production_warehouse': data.get('is_production_warehouse', True),
-        }
+        document=build_warehouse_document(data)
     )
 
 
@@ -62,6 +69,16 @@ def create_index_inventory():
     )
 
 
+def build_inventory_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for an Inventory.
+    """
+    return {
+        'product': data.get('product', {}).get('name', 'unknown'),
+        'warehouse': data.get('warehouse', {}).get('name', 'unknown'),
+    }
+
+
 def index_inventory(data: dict):
     """
     Index an Inventory document in Elasticsearch.
@@ -70,10 +87,7 @@ def index_inventory(data: dict):
     es.index(
         index='inventory',
         id=data['id'],
-        document={
-            'product': data.get('product', {}).get('name', 'unknown'),
-            'warehouse': data.get('warehouse', {}).get('name', 'unknown'),
-        }
+        document=build_inventory_document(data)
     )
 
 
@@ -102,6 +116,17 @@ def create_index_transaction():
     )
 
 
+def build_transaction_document(data: dict) -> dict:
+    """
+    Build the Elasticsearch document for a Transaction.
+    """
+    return {
+        'inventory': data.get('inventory', {}).get('id', 'unknown'),
+        'is_import': data.get('is_import', True),
+        'storage_location': data.get('storage_location', ''),
+    }
+
+
 def index_transaction(data: dict):
     """
     Index a Transaction document in Elasticsearch.
@@ -110,11 +135,7 @@ def index_transaction(data: dict):
     es.index(
         index='transaction',
         id=data['id'],
-        document={
-            'inventory': data.get('inventory', {}).get('id', 'unknown'),
-            'is_import': data.get('is_import', True),
-            'storage_location': data.get('storage_location', ''),
-        }
+        document=build_transaction_document(data)
     )
 
 
@@ -0,0 +1,49 @@
+import datetime
+from typing import Optional
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+# Formats accepted besides ISO 8601 dates and datetimes
+EXPIRE_DATE_FORMATS = ('%Y/%m/%d', '%Y/%m/%d %H:%M', '%Y/%m/%d %H:%M:%S', '%d/%m/%Y', '%d-%m-%Y', '%d.%m.%Y')
+
+
+def parse_expire_date(value: Optional[str]) -> Optional[datetime.datetime]:
+    """
+    Parse a free-form `ShelfLife.expire_date` string into a naive UTC datetime.
+
+    ISO 8601 datetimes and dates are tried first, then EXPIRE_DATE_FORMATS. Naive values
+    are read in the project time zone; a date without a time expires at the start of that
+    day, so stock is never picked or reported later than it should be.
+
+    Args:
+        value: The stored string.
+
+    Returns:
+        Optional[datetime.datetime]: The expiry in UTC, or None when the string is empty or unreadable.
+    """
+    value = (value or '').strip()
+    if not value:
+        return None
+
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            date = parse_date(value)
+            parsed = datetime.datetime.combine(date, datetime.time.min) if date else None
+    except ValueError:
+        parsed = None
+
+    for date_format in EXPIRE_DATE_FORMATS:
+        if parsed is not None:
+            break
+        try:
+            parsed = datetime.datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+
+    if parsed is None:
+        return None
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, timezone.get_default_timezone())
+    return parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,280 @@
+import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from apps.core.documents import CheckStatus, DateUser
+from apps.warehouse.documents import Inventory, InventoryLedger, Quantity, Transaction
+from utils.signals import post_bulk_update
+
+
+# Transactions remembered per balance to apply a retried posting once
+APPLIED_TRANSACTIONS_KEPT = 100
+
+
+class AlreadyPosted(Exception):
+    """Raised when a transaction already has its ledger entry."""
+
+
+def transaction_delta(transaction: Transaction) -> Tuple[float, int]:
+    """
+    Return the signed stock movement of a transaction.
+
+    Args:
+        transaction: The transaction.
+
+    Returns:
+        Tuple[float, int]: Weight and number, positive for imports and negative for exports.
+    """
+    return _delta(transaction.quantity, transaction.is_import)
+
+
+def _delta(quantity: Quantity, is_import: bool) -> Tuple[float, int]:
+    """Return a quantity signed by its direction: positive for imports, negative for exports."""
+    sign = 1 if is_import else -1
+    return sign * float(quantity.weight or 0), sign * int(quantity.number or 0)
+
+
+def post_transaction(transaction: Transaction, user: Optional[str]) -> bool:
+    """
+    Verify a transaction and apply it to the balance of its inventory.
+
+    Three writes make up a posting: the ledger entry is appended (its unique `transaction`
+    index makes a transaction count once, even under concurrent verifies), its movement is
+    applied to the inventory balance (see `apply_entry`), and the transaction is marked
+    verified. With WAREHOUSE_LEDGER['TRANSACTIONS'] (replica set deployments) the three run
+    in one MongoDB transaction. Without it they run in that order; a posting interrupted
+    after the ledger insert is completed by the next verify of the transaction or by
+    `complete_postings`.
+
+    Args:
+        transaction: The transaction to post.
+        user: Username of the verifier.
+
+    Returns:
+        bool: False if the transaction had already been posted.
+    """
+    weight, number = transaction_delta(transaction)
+    inventory = transaction.inventory
+    warehouse, product = inventory.ledger_keys()
+    verified = CheckStatus(status=True, user_date=DateUser(user=user)).to_mongo()
+    entry = {
+        'inventory': inventory.pk,
+        'transaction': transaction.pk,
+        'warehouse': warehouse,
+        'product': product,
+        'weight': weight,
+        'number': number,
+        'user': user,
+        'created_at': datetime.datetime.utcnow(),
+        'applied': False,
+    }
+
+    def write(session: Any = None) -> None:
+        try:
+            InventoryLedger._get_collection().insert_one(dict(entry), session=session)
+        except DuplicateKeyError:
+            raise AlreadyPosted(transaction.pk)
+
+        apply_entry(entry, session=session)
+        Transaction._get_collection().update_one(
+            {'_id': transaction.pk}, {'$set': {'is_verified': verified}}, session=session
+        )
+
+    try:
+        _run(write)
+    except AlreadyPosted:
+        # A previous posting may have stopped before applying its movement or marking the transaction verified
+        apply_entry(InventoryLedger._get_collection().find_one({'transaction': transaction.pk}))
+        Transaction._get_collection().update_one(
+            {'_id': transaction.pk, 'is_verified.status': {'$ne': True}}, {'$set': {'is_verified': verified}}
+        )
+        return False
+    finally:
+        # Raw writes bypass the document signals: reindex and invalidate cached responses
+        post_bulk_update.send(Transaction, documents=[transaction])
+        post_bulk_update.send(Inventory, documents=[inventory])
+
+    return True
+
+
+def apply_entry(entry: Optional[Dict[str, Any]], session: Any = None) -> None:
+    """
+    Add the movement of a ledger entry to its inventory balance, exactly once.
+
+    The `$inc` only matches while the transaction is missing from the last
+    APPLIED_TRANSACTIONS_KEPT transactions of the balance and records it there in the same
+    update, so an entry whose `applied` flag was never written is not added twice when it
+    is completed again. Entries without the flag predate it and are already applied.
+    `quantity` receives the same movement, so it mirrors the balance.
+
+    Args:
+        entry: The raw ledger entry.
+        session: Optional MongoDB session.
+    """
+    if not entry or entry.get('applied', True):
+        return
+
+    Inventory._get_collection().update_one(
+        {'_id': entry['inventory'], 'balance.transactions': {'$ne': entry['transaction']}},
+        {
+            '$inc': {
+                'balance.weight': entry['weight'], 'balance.number': entry['number'],
+                'quantity.weight': entry['weight'], 'quantity.number': entry['number'],
+            },
+            '$set': {'balance.updated_at': entry['created_at']},
+            '$push': {'balance.transactions': {'$each': [entry['transaction']], '$slice': -APPLIED_TRANSACTIONS_KEPT}},
+        },
+        session=session,
+    )
+    InventoryLedger._get_collection().update_one(
+        {'transaction': entry['transaction']}, {'$set': {'applied': True}}, session=session
+    )
+
+
+def complete_postings() -> int:
+    """
+    Apply the ledger entries of postings interrupted before their balance update.
+
+    Returns:
+        int: The number of entries applied.
+    """
+    entries = list(InventoryLedger._get_collection().find({'applied': False}))
+    for entry in entries:
+        apply_entry(entry)
+    if entries:
+        post_bulk_update.send(Inventory, documents=[])
+    return len(entries)
+
+
+def backfill_postings(batch_size: int = 500, dry_run: bool = False) -> int:
+    """
+    Post the transactions that were verified before the ledger existed.
+
+    Every verified transaction without a ledger entry gets one, dated now, and its movement
+    is applied to the inventory balance. Inventories that receive entries then have their
+    `quantity` reset to the balance, which replaces the hand-maintained figure. The unique
+    `transaction` index and `apply_entry` make a rerun, or a verify racing the backfill,
+    count every transaction once.
+
+    Args:
+        batch_size: Transactions read and posted per round.
+        dry_run: Only count the transactions that would be posted.
+
+    Returns:
+        int: The number of transactions posted (or, with `dry_run`, missing from the ledger).
+    """
+    count = 0
+    inventories = set()
+    for rows in _verified_transactions(batch_size):
+        posted = {
+            row['transaction'] for row in InventoryLedger._get_collection().find(
+                {'transaction': {'$in': [row['_id'] for row in rows]}}, {'transaction': 1}
+            )
+        }
+        rows = [row for row in rows if row['_id'] not in posted]
+        if dry_run:
+            count += len(rows)
+            continue
+
+        entries = _backfill_entries(rows)
+        if not entries:
+            continue
+        count += len(entries)
+        try:
+            InventoryLedger._get_collection().insert_many(entries, ordered=False)
+        except BulkWriteError:
+            # Transactions posted by a verify since they were read
+            pass
+        for entry in InventoryLedger._get_collection().find(
+                {'transaction': {'$in': [entry['transaction'] for entry in entries]}, 'applied': False}):
+            apply_entry(entry)
+        inventories.update(entry['inventory'] for entry in entries)
+
+    if inventories:
+        collection = Inventory._get_collection()
+        for row in collection.find({'_id': {'$in': list(inventories)}}, {'balance': 1}):
+            collection.update_one({'_id': row['_id']}, {'$set': {
+                'quantity.weight': row['balance']['weight'],
+                'quantity.number': row['balance']['number'],
+            }})
+        post_bulk_update.send(Inventory, documents=[])
+    return count
+
+
+def _verified_transactions(batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield the raw verified transactions in batches, in id order.
+
+    Args:
+        batch_size: Transactions per batch.
+
+    Yields:
+        List[Dict[str, Any]]: A batch of raw transactions.
+    """
+    cursor = Transaction._get_collection().find(
+        {'is_verified.status': True}, {'quantity': 1, 'is_import': 1, 'inventory': 1, 'is_verified': 1}
+    ).sort('_id', 1).batch_size(batch_size)
+    batch = []
+    for row in cursor:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _backfill_entries(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Build the ledger entries of raw verified transactions.
+
+    Args:
+        rows: Raw transactions.
+
+    Returns:
+        List[Dict[str, Any]]: One unapplied entry per transaction whose inventory still exists.
+    """
+    keys = {
+        row['_id']: (str(row['warehouse']), str(row['product']))
+        for row in Inventory._get_collection().find(
+            {'_id': {'$in': list({row['inventory'] for row in rows})}}, {'warehouse': 1, 'product': 1}
+        )
+    }
+    now = datetime.datetime.utcnow()
+    entries = []
+    for row in rows:
+        if row['inventory'] not in keys:
+            continue
+        weight, number = _delta(Quantity._from_son(row['quantity']), row.get('is_import', True))
+        warehouse, product = keys[row['inventory']]
+        entries.append({
+            'inventory': row['inventory'],
+            'transaction': row['_id'],
+            'warehouse': warehouse,
+            'product': product,
+            'weight': weight,
+            'number': number,
+            'user': ((row.get('is_verified') or {}).get('user_date') or {}).get('user'),
+            'created_at': now,
+            'applied': False,
+            'backfilled': True,
+        })
+    return entries
+
+
+def _run(write: Callable[[Any], None]) -> None:
+    """
+    Run the writes of a posting, in a MongoDB transaction when enabled.
+
+    Args:
+        write: Callable performing the writes with an optional session.
+    """
+    if not getattr(settings, 'WAREHOUSE_LEDGER', {}).get('TRANSACTIONS', False):
+        write(None)
+        return
+
+    client = Inventory._get_db().client
+    with client.start_session() as session:
+        session.with_transaction(write)
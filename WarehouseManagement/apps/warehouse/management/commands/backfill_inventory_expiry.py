@@ -0,0 +1,59 @@
+from typing import Any, Dict, List
+
+from django.core.management.base import BaseCommand
+from pymongo import UpdateOne
+
+from apps.warehouse.documents import Inventory
+from apps.warehouse.expiry import parse_expire_date
+from utils.signals import post_bulk_update
+
+
+class Command(BaseCommand):
+    """
+    Parse the `shelf_life.expire_date` strings of existing inventories into `shelf_life.expires_at`.
+
+    Inventories are read in `_id` order, `--batch-size` at a time, and each batch is written
+    with one `bulk_write`. Only inventories without `expires_at` are parsed unless `--all`
+    is given (e.g. after adding a date format). Unreadable strings are listed and left as
+    they are; those inventories are missing from FEFO picking and expiry queries until
+    their expire_date is corrected.
+    """
+
+    help = 'Backfill the indexed Inventory expiry datetime from the expire_date strings in batches'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--batch-size', type=int, default=1000, help='Inventories per batch')
+        parser.add_argument('--all', action='store_true', help='Parse inventories that already have expires_at')
+
+    def handle(self, *args, **options) -> None:
+        batch_size = max(1, options['batch_size'])
+        query: Dict[str, Any] = {'shelf_life.expire_date': {'$nin': [None, '']}}
+        if not options['all']:
+            query['shelf_life.expires_at'] = None
+
+        collection = Inventory._get_collection()
+        last_id, updated, unreadable = None, 0, []
+        while True:
+            batch_query = dict(query, _id={'$gt': last_id}) if last_id is not None else query
+            rows = list(collection.find(batch_query, {'shelf_life.expire_date': 1}).sort('_id', 1).limit(batch_size))
+            if not rows:
+                break
+            last_id = rows[-1]['_id']
+
+            operations: List[UpdateOne] = []
+            for row in rows:
+                expire_date = row['shelf_life']['expire_date']
+                expires_at = parse_expire_date(expire_date)
+                if expires_at is None:
+                    unreadable.append((row['_id'], expire_date))
+                    continue
+                operations.append(UpdateOne({'_id': row['_id']}, {'$set': {'shelf_life.expires_at': expires_at}}))
+            if operations:
+                updated += collection.bulk_write(operations, ordered=False).modified_count
+
+        for inventory_id, expire_date in unreadable:
+            self.stdout.write(self.style.WARNING(f'{inventory_id}: unreadable expire_date {expire_date!r}'))
+        if updated:
+            # Raw writes bypass the document signals: invalidate cached responses
+            post_bulk_update.send(Inventory, documents=[])
+        self.stdout.write(self.style.SUCCESS(f'{updated} inventories backfilled, {len(unreadable)} unreadable'))
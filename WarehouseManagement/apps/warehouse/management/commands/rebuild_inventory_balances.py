@@ -0,0 +1,122 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.warehouse.documents import Inventory, InventoryLedger
+from apps.warehouse.ledger import backfill_postings, complete_postings
+
+
+# Weight differences below this are float rounding, not drift
+WEIGHT_TOLERANCE = 1e-6
+
+
+class Command(BaseCommand):
+    """
+    Recompute inventory balances from the ledger and report (or repair) drift.
+
+    Inventories are split into chunks of `--chunk-size` ids; each chunk is summed with one
+    `$group` aggregation over the ledger and compared with the stored balances, and the
+    chunks run on `--workers` threads. With `--fix` a drifted balance (and the `quantity`
+    that mirrors it) is set to the ledger sum. Postings interrupted before their balance
+    update are completed first, and with `--backfill` transactions verified before the
+    ledger existed are posted. `--fix` is refused while such transactions remain, as the
+    ledger sum would zero their stock. Run `--fix` while no transactions are being verified:
+    a posting that lands between the ledger sum and the fix of its inventory would be
+    overwritten.
+    """
+
+    help = 'Recompute Inventory balances from the inventory ledger in parallel chunks and report drift'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--chunk-size', type=int, default=500, help='Inventories per aggregation')
+        parser.add_argument('--workers', type=int, default=4, help='Parallel chunks')
+        parser.add_argument('--fix', action='store_true', help='Set drifted balances to the ledger sum')
+        parser.add_argument('--backfill', action='store_true',
+                            help='First post the verified transactions missing from the ledger')
+
+    def handle(self, *args, **options) -> None:
+        completed = complete_postings()
+        if completed:
+            self.stdout.write(f'{completed} interrupted postings completed')
+
+        if options['backfill']:
+            self.stdout.write(f'{backfill_postings()} verified transactions posted to the ledger')
+        else:
+            unposted = backfill_postings(dry_run=True)
+            if unposted and options['fix']:
+                raise CommandError(f'{unposted} verified transactions are not in the ledger; run with --backfill')
+            if unposted:
+                self.stdout.write(self.style.WARNING(
+                    f'{unposted} verified transactions are not in the ledger; run with --backfill'
+                ))
+
+        chunk_size = max(1, options['chunk_size'])
+        inventory_ids = [row['_id'] for row in Inventory._get_collection().find({}, {'_id': 1}).sort('_id', 1)]
+        chunks = [inventory_ids[start:start + chunk_size] for start in range(0, len(inventory_ids), chunk_size)]
+
+        started = time.monotonic()
+        drifted: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as executor:
+            for chunk_drift in executor.map(lambda chunk: self._check_chunk(chunk, options['fix']), chunks):
+                drifted.extend(chunk_drift)
+
+        for drift in drifted:
+            self.stdout.write(self.style.WARNING(
+                f'{drift["inventory"]}: balance {drift["balance"]} != ledger {drift["ledger"]}'
+                f'{" (fixed)" if options["fix"] else ""}'
+            ))
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(inventory_ids)} inventories checked in {len(chunks)} chunks in '
+            f'{time.monotonic() - started:.1f}s, {len(drifted)} drifted'
+        ))
+
+    @staticmethod
+    def _check_chunk(inventory_ids: List[str], fix: bool) -> List[Dict[str, Any]]:
+        """
+        Compare the balances of a chunk of inventories with their ledger sums.
+
+        Args:
+            inventory_ids: Ids of the inventories.
+            fix: Whether to overwrite drifted balances with the ledger sum.
+
+        Returns:
+            List[Dict[str, Any]]: Inventory id, stored balance and ledger sum of each drifted inventory.
+        """
+        ledger: Dict[str, Tuple[float, int]] = {
+            row['_id']: (row['weight'], row['number'])
+            for row in InventoryLedger._get_collection().aggregate([
+                {'$match': {'inventory': {'$in': inventory_ids}}},
+                {'$group': {'_id': '$inventory', 'weight': {'$sum': '$weight'}, 'number': {'$sum': '$number'}}},
+            ])
+        }
+
+        inventories = Inventory._get_collection()
+        drifted = []
+        for row in inventories.find({'_id': {'$in': inventory_ids}}, {'balance': 1, 'quantity': 1}):
+            expected = ledger.get(row['_id'], (0.0, 0))
+            stored = Command._stored(row.get('balance'))
+            # Without ledger entries `quantity` is still the hand-maintained figure
+            quantity = Command._stored(row.get('quantity')) if row['_id'] in ledger else expected
+            if Command._matches(stored, expected) and Command._matches(quantity, expected):
+                continue
+
+            drifted.append({'inventory': row['_id'], 'balance': stored, 'ledger': expected})
+            if fix:
+                update = {'balance.weight': expected[0], 'balance.number': expected[1]}
+                if row['_id'] in ledger:
+                    update.update({'quantity.weight': expected[0], 'quantity.number': expected[1]})
+                inventories.update_one({'_id': row['_id']}, {'$set': update})
+        return drifted
+
+    @staticmethod
+    def _stored(values: Dict[str, Any]) -> Tuple[float, int]:
+        """Return the weight and number of a raw balance or quantity."""
+        values = values or {}
+        return float(values.get('weight') or 0.0), int(values.get('number') or 0)
+
+    @staticmethod
+    def _matches(stored: Tuple[float, int], expected: Tuple[float, int]) -> bool:
+        """Check whether stored figures equal the ledger sum, up to float rounding."""
+        return abs(stored[0] - expected[0]) <= WEIGHT_TOLERANCE and stored[1] == expected[1]
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from apps.warehouse.snapshots import SnapshotRunning, take_snapshot
+
+
+class Command(BaseCommand):
+    """
+    Write a per (warehouse, product) balance snapshot for point-in-time balance queries.
+
+    Meant to be run often by cron (or the `snapshot_inventory_balances` Celery task): a
+    snapshot is only written once WAREHOUSE_LEDGER['SNAPSHOT_INTERVAL_HOURS'] has passed
+    since the last one, unless `--force` is given.
+    """
+
+    help = 'Write a per (warehouse, product) balance snapshot when the snapshot interval has passed'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--force', action='store_true', help='Write a snapshot even if one is not due')
+
+    def handle(self, *args, **options) -> None:
+        try:
+            run = take_snapshot(force=options['force'])
+        except SnapshotRunning:
+            self.stdout.write(self.style.WARNING('Another snapshot is being written'))
+            return
+        if run is None:
+            self.stdout.write('No snapshot due')
+            return
+
+        self.stdout.write(self.style.SUCCESS(f'Snapshot at {run.taken_at.isoformat()} written with {run.rows} rows'))
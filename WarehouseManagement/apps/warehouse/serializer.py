@@ -28,6 +28,12 @@ class InventorySerializerPOST(CustomSerializer):
         fields = ['product', 'shelf_life', 'warehouse']
 
 
+class InventorySerializerPATCH(CustomSerializer):
+    class Meta:
+        model = Inventory
+        fields = ['product', 'shelf_life', 'warehouse']
+
+
 class TransactionSerializer(CustomSerializer):
     class Meta:
         model = Transaction
@@ -37,4 +43,11 @@ class TransactionSerializer(CustomSerializer):
 class TransactionSerializerPOST(CustomSerializer):
     class Meta:
         model = Transaction
-        fields = ['quantity', 'is_import', 'inventory', 'storage_location', 'description']
\ No newline at end of file
+        fields = ['quantity', 'is_import', 'inventory', 'storage_location', 'description']
+
+
+# is_verified is only set by the verify action, which posts the transaction to the ledger
+class TransactionSerializerPATCH(CustomSerializer):
+    class Meta:
+        model = Transaction
+        fields = ['quantity', 'is_import', 'inventory', 'storage_location', 'description']
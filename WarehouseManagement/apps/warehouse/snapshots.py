@@ -0,0 +1,302 @@
+import datetime
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.warehouse.documents import BalanceSnapshot, BalanceSnapshotRun, InventoryLedger
+
+# Balances keyed by (warehouse, product): (weight, number)
+Balances = Dict[Tuple[str, str], Tuple[float, int]]
+
+INSERT_BATCH_SIZE = 1000
+
+# Held while a run is written, so overlapping runs never discard each other's rows
+SNAPSHOT_LOCK_KEY = 'warehouse:balance_snapshot:lock'
+
+
+class SnapshotRunning(Exception):
+    """Raised when another worker is taking a snapshot."""
+
+
+class HistoryUnavailable(Exception):
+    """Raised for a point in time before the ledger holds complete balances."""
+
+    def __init__(self, history_start: datetime.datetime) -> None:
+        super().__init__(f'Balances are only available from {history_start.isoformat()}')
+        self.history_start = history_start
+
+
+def snapshot_settings() -> Dict[str, Any]:
+    """
+    Return the snapshot settings of WAREHOUSE_LEDGER with their defaults.
+
+    Returns:
+        Dict[str, Any]: SNAPSHOT_INTERVAL_HOURS, SNAPSHOT_SETTLE_SECONDS and SNAPSHOT_LOCK_SECONDS.
+    """
+    config = getattr(settings, 'WAREHOUSE_LEDGER', {})
+    return {
+        'SNAPSHOT_INTERVAL_HOURS': float(config.get('SNAPSHOT_INTERVAL_HOURS', 24)),
+        'SNAPSHOT_SETTLE_SECONDS': float(config.get('SNAPSHOT_SETTLE_SECONDS', 60)),
+        'SNAPSHOT_LOCK_SECONDS': int(config.get('SNAPSHOT_LOCK_SECONDS', 3600)),
+    }
+
+
+def snapshot_due(now: Optional[datetime.datetime] = None) -> bool:
+    """
+    Check whether the snapshot interval has passed since the last completed run.
+
+    Args:
+        now: Current UTC time, defaults to now.
+
+    Returns:
+        bool: True when no run completed within SNAPSHOT_INTERVAL_HOURS.
+    """
+    now = now or datetime.datetime.utcnow()
+    last = _completed_runs().order_by('-taken_at').first()
+    interval = datetime.timedelta(hours=snapshot_settings()['SNAPSHOT_INTERVAL_HOURS'])
+    return last is None or last.taken_at + interval <= now
+
+
+def take_snapshot(now: Optional[datetime.datetime] = None, force: bool = True) -> Optional[BalanceSnapshotRun]:
+    """
+    Write the balance of every (warehouse, product) pair as of now.
+
+    A run starts from the previous completed run and adds the ledger entries created since
+    it, so its cost depends on the pairs and the entries of one interval, not on the length
+    of the history. The snapshot is taken SNAPSHOT_SETTLE_SECONDS in the past: ledger
+    entries are stamped before they are inserted, and an entry landing after the run with
+    an earlier stamp would be missed by this run and every following one. Pairs with a
+    zero balance are not stored. Rows of runs that never completed are removed first.
+
+    The due check and the run happen under a cache lock (held at most
+    SNAPSHOT_LOCK_SECONDS), so a run never removes the rows of one still being written.
+
+    Args:
+        now: Current UTC time, defaults to now.
+        force: Write a snapshot even if none is due.
+
+    Returns:
+        Optional[BalanceSnapshotRun]: The completed run, or None when no snapshot was due.
+
+    Raises:
+        SnapshotRunning: If another worker holds the lock.
+    """
+    lock_id = uuid.uuid4().hex
+    if not cache.add(SNAPSHOT_LOCK_KEY, lock_id, timeout=snapshot_settings()['SNAPSHOT_LOCK_SECONDS']):
+        raise SnapshotRunning()
+    try:
+        if not force and not snapshot_due(now):
+            return None
+        return _write_snapshot(now or datetime.datetime.utcnow())
+    finally:
+        # Release the lock only if it was not taken over after expiring
+        if cache.get(SNAPSHOT_LOCK_KEY) == lock_id:
+            cache.delete(SNAPSHOT_LOCK_KEY)
+
+
+def _write_snapshot(now: datetime.datetime) -> BalanceSnapshotRun:
+    """
+    Write one snapshot run; see `take_snapshot`.
+
+    Args:
+        now: Current UTC time.
+
+    Returns:
+        BalanceSnapshotRun: The completed run.
+    """
+    taken_at = _truncate(now - datetime.timedelta(seconds=snapshot_settings()['SNAPSHOT_SETTLE_SECONDS']))
+    _discard_incomplete_runs()
+
+    previous = _completed_runs().filter(taken_at__lt=taken_at).order_by('-taken_at').first()
+    run = BalanceSnapshotRun(taken_at=taken_at).save()
+
+    balances = _snapshot_balances(previous.taken_at) if previous else {}
+    _add(balances, ledger_deltas(previous.taken_at if previous else None, taken_at))
+
+    rows = [
+        {'taken_at': taken_at, 'warehouse': warehouse, 'product': product, 'weight': weight, 'number': number}
+        for (warehouse, product), (weight, number) in balances.items()
+        if weight or number
+    ]
+    collection = BalanceSnapshot._get_collection()
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        collection.insert_many(rows[start:start + INSERT_BATCH_SIZE], ordered=False)
+
+    run.update(set__completed_at=datetime.datetime.utcnow(), set__rows=len(rows))
+    run.reload()
+    return run
+
+
+def balances_as_of(as_of: datetime.datetime, warehouses: Optional[List[str]] = None,
+                   products: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Compute the balances of (warehouse, product) pairs at a point in time.
+
+    The completed snapshot nearest to `as_of` is loaded and the ledger entries between the
+    two are added (snapshot before `as_of`) or subtracted (snapshot after it). Without any
+    snapshot the ledger is summed from the beginning. Points in time before
+    `history_start` are refused, as stock posted later by the backfill would be missing.
+
+    Args:
+        as_of: The point in time (UTC).
+        warehouses: Only these warehouses, if given.
+        products: Only these products, if given.
+
+    Returns:
+        Dict[str, Any]: `as_of`, the `snapshot_at` used and the non-zero `balances` rows
+        (warehouse, product, weight, number) ordered by warehouse and product.
+
+    Raises:
+        HistoryUnavailable: If `as_of` is before `history_start`.
+    """
+    start = history_start()
+    if start is not None and as_of < start:
+        raise HistoryUnavailable(start)
+
+    # Ids are stored as strings in the ledger and the snapshots
+    warehouses = [str(warehouse) for warehouse in warehouses] if warehouses else None
+    products = [str(product) for product in products] if products else None
+    before = _completed_runs().filter(taken_at__lte=as_of).order_by('-taken_at').first()
+    after = _completed_runs().filter(taken_at__gt=as_of).order_by('taken_at').first()
+
+    if after and (before is None or after.taken_at - as_of < as_of - before.taken_at):
+        snapshot_at = after.taken_at
+        balances = _snapshot_balances(snapshot_at, warehouses, products)
+        _add(balances, ledger_deltas(as_of, snapshot_at, warehouses, products), sign=-1)
+    else:
+        snapshot_at = before.taken_at if before else None
+        balances = _snapshot_balances(snapshot_at, warehouses, products) if before else {}
+        _add(balances, ledger_deltas(snapshot_at, as_of, warehouses, products))
+
+    return {
+        'as_of': as_of,
+        'snapshot_at': snapshot_at,
+        'balances': [
+            {'warehouse': warehouse, 'product': product, 'weight': weight, 'number': number}
+            for (warehouse, product), (weight, number) in sorted(balances.items())
+            if weight or number
+        ],
+    }
+
+
+def history_start() -> Optional[datetime.datetime]:
+    """
+    Return the earliest point in time the ledger holds complete balances for.
+
+    That is the last backfill of transactions verified before the ledger existed (its
+    entries are dated when it ran), or the first ledger entry when nothing was backfilled.
+
+    Returns:
+        Optional[datetime.datetime]: The start of the history, or None for an empty ledger.
+    """
+    collection = InventoryLedger._get_collection()
+    entry = collection.find_one({'backfilled': True}, {'created_at': 1}, sort=[('created_at', -1)]) \
+        or collection.find_one({}, {'created_at': 1}, sort=[('created_at', 1)])
+    return entry['created_at'] if entry else None
+
+
+def ledger_deltas(start: Optional[datetime.datetime], end: datetime.datetime,
+                  warehouses: Optional[List[str]] = None, products: Optional[List[str]] = None) -> Balances:
+    """
+    Sum the ledger entries created in (start, end] per (warehouse, product).
+
+    Args:
+        start: Exclusive lower bound, or None for the beginning of the ledger.
+        end: Inclusive upper bound.
+        warehouses: Only these warehouses, if given.
+        products: Only these products, if given.
+
+    Returns:
+        Balances: The summed movements.
+    """
+    created_at = {'$lte': end}
+    if start is not None:
+        created_at['$gt'] = start
+    match: Dict[str, Any] = {'created_at': created_at}
+    if warehouses:
+        match['warehouse'] = {'$in': warehouses}
+    if products:
+        match['product'] = {'$in': products}
+
+    return {
+        (row['_id']['warehouse'], row['_id']['product']): (row['weight'], row['number'])
+        for row in InventoryLedger._get_collection().aggregate([
+            {'$match': match},
+            {'$group': {
+                '_id': {'warehouse': '$warehouse', 'product': '$product'},
+                'weight': {'$sum': '$weight'},
+                'number': {'$sum': '$number'},
+            }},
+        ])
+    }
+
+
+def _snapshot_balances(taken_at: datetime.datetime, warehouses: Optional[List[str]] = None,
+                       products: Optional[List[str]] = None) -> Balances:
+    """
+    Load the rows of one snapshot run.
+
+    Args:
+        taken_at: Time of the run.
+        warehouses: Only these warehouses, if given.
+        products: Only these products, if given.
+
+    Returns:
+        Balances: The stored balances.
+    """
+    query: Dict[str, Any] = {'taken_at': taken_at}
+    if warehouses:
+        query['warehouse'] = {'$in': warehouses}
+    if products:
+        query['product'] = {'$in': products}
+
+    return {
+        (row['warehouse'], row['product']): (row['weight'], row['number'])
+        for row in BalanceSnapshot._get_collection().find(query, {'_id': 0, 'taken_at': 0})
+    }
+
+
+def _add(balances: Balances, deltas: Balances, sign: int = 1) -> None:
+    """
+    Add (or subtract) movements to balances in place.
+
+    Args:
+        balances: The balances to update.
+        deltas: The movements.
+        sign: 1 to add, -1 to subtract.
+    """
+    for key, (weight, number) in deltas.items():
+        current_weight, current_number = balances.get(key, (0.0, 0))
+        balances[key] = (current_weight + sign * weight, current_number + sign * number)
+
+
+def _completed_runs() -> Any:
+    """
+    Return the runs whose rows were all written.
+
+    Returns:
+        QuerySet: The completed BalanceSnapshotRun documents.
+    """
+    return BalanceSnapshotRun.objects(completed_at__ne=None)
+
+
+def _discard_incomplete_runs() -> None:
+    """Remove the runs (and their rows) that stopped before completing."""
+    for run in BalanceSnapshotRun.objects(completed_at=None):
+        BalanceSnapshot._get_collection().delete_many({'taken_at': run.taken_at})
+        run.delete()
+
+
+def _truncate(moment: datetime.datetime) -> datetime.datetime:
+    """
+    Drop the sub-millisecond part of a datetime, which MongoDB does not store.
+
+    Args:
+        moment: The datetime.
+
+    Returns:
+        datetime.datetime: The truncated datetime.
+    """
+    return moment.replace(microsecond=moment.microsecond // 1000 * 1000)
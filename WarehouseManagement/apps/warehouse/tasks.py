@@ -0,0 +1,28 @@
+from celery import shared_task
+
+
+@shared_task
+def snapshot_inventory_balances():
+
+    """
+    write the per (warehouse, product) balance snapshot when SNAPSHOT_INTERVAL_HOURS has passed
+    """
+
+    from apps.warehouse.snapshots import SnapshotRunning, take_snapshot
+
+    try:
+        take_snapshot(force=False)
+    except SnapshotRunning:
+        pass
+
+
+@shared_task
+def complete_inventory_postings():
+
+    """
+    apply the ledger entries of transaction postings interrupted before their balance update
+    """
+
+    from apps.warehouse.ledger import complete_postings
+
+    complete_postings()
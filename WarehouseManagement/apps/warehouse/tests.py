@@ -1,3 +1,412 @@
-from django.test import TestCase
+import datetime
+import itertools
+import json
+from unittest import mock
 
-# Create your tests here.
+import mongomock
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+from mongoengine import ValidationError, connect, disconnect
+
+from api.v1.warehouse.Inventory.utils import expiring_inventories, fefo_inventories
+from api.v1.warehouse.transaction.utils import verify_transaction
+from api.v1.warehouse.transaction.view import TransactionAPIView
+from apps.core.documents import CheckStatus, DateUser, Product
+from apps.warehouse import ledger
+from apps.warehouse.snapshots import (
+    SNAPSHOT_LOCK_KEY, HistoryUnavailable, SnapshotRunning, balances_as_of, take_snapshot,
+)
+from apps.warehouse.expiry import parse_expire_date
+from apps.warehouse.documents import Inventory, InventoryLedger, Quantity, ShelfLife, Transaction, Warehouse
+
+
+class MongoTestCase(SimpleTestCase):
+    """Runs against an in-memory mongomock database; ids are given explicitly instead of from the SQL counter."""
+
+    ids = itertools.count(1)
+
+    def setUp(self):
+        disconnect()
+        connect('test', mongo_client_class=mongomock.MongoClient)
+        # Keep the reindex and cache invalidation receivers out of these tests
+        patcher = mock.patch('apps.warehouse.ledger.post_bulk_update')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(disconnect)
+
+    @staticmethod
+    def create_inventory(warehouse_id='WareHouse-1', product_id=12, **kwargs):
+        warehouse = Warehouse.objects(id=warehouse_id).first() or Warehouse(
+            id=warehouse_id, name=warehouse_id, create_date=DateUser(user='user')
+        ).save()
+        product = Product.objects(id=product_id).first() or Product(id=product_id, product='p', product_owner='o').save()
+        kwargs.setdefault('quantity', Quantity())
+        return Inventory(id=f'Inventory-{next(MongoTestCase.ids)}', product=product, warehouse=warehouse,
+                         shelf_life=ShelfLife(), **kwargs).save()
+
+    @staticmethod
+    def create_transaction(inventory, weight=2.5, number=3, is_import=True):
+        return Transaction(
+            id=f'Transaction-{next(MongoTestCase.ids)}', inventory=inventory, is_import=is_import,
+            quantity=Quantity(weight=weight, number=number), create_date=DateUser(user='user'),
+        ).save()
+
+
+class PostTransactionTests(MongoTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.inventory = self.create_inventory()
+
+    def balance(self):
+        balance = Inventory._get_collection().find_one({'_id': self.inventory.pk})['balance']
+        return balance['weight'], balance['number']
+
+    def test_posting_applies_the_movement_once(self):
+        transaction = self.create_transaction(self.inventory)
+
+        self.assertTrue(ledger.post_transaction(transaction, 'user'))
+        self.assertFalse(ledger.post_transaction(transaction, 'user'))
+
+        self.assertEqual(self.balance(), (2.5, 3))
+        self.assertEqual(Inventory.objects.get(id=self.inventory.pk).quantity.weight, 2.5)
+        entry = InventoryLedger._get_collection().find_one({'transaction': transaction.pk})
+        self.assertTrue(entry['applied'])
+        self.assertEqual((entry['warehouse'], entry['product']), ('WareHouse-1', '12'))
+        self.assertTrue(Transaction.objects.get(id=transaction.pk).is_verified.status)
+
+    def test_exports_are_subtracted(self):
+        ledger.post_transaction(self.create_transaction(self.inventory), 'user')
+        ledger.post_transaction(self.create_transaction(self.inventory, weight=1.0, number=1, is_import=False), 'user')
+
+        self.assertEqual(self.balance(), (1.5, 2))
+
+    def test_posting_interrupted_before_the_balance_update_is_completed_by_a_retry(self):
+        transaction = self.create_transaction(self.inventory)
+        with mock.patch('apps.warehouse.ledger.apply_entry', side_effect=ConnectionError), \
+                self.assertRaises(ConnectionError):
+            ledger.post_transaction(transaction, 'user')
+        self.assertEqual(self.balance(), (0.0, 0))
+
+        self.assertFalse(ledger.post_transaction(transaction, 'user'))
+
+        self.assertEqual(self.balance(), (2.5, 3))
+        self.assertTrue(Transaction.objects.get(id=transaction.pk).is_verified.status)
+
+    def test_posting_interrupted_before_the_applied_flag_is_not_added_twice(self):
+        transaction = self.create_transaction(self.inventory)
+        collection = mock.Mock(wraps=InventoryLedger._get_collection())
+        collection.update_one.side_effect = ConnectionError
+        with mock.patch.object(InventoryLedger, '_get_collection', return_value=collection), \
+                self.assertRaises(ConnectionError):
+            ledger.post_transaction(transaction, 'user')
+        self.assertEqual(self.balance(), (2.5, 3))
+        self.assertFalse(InventoryLedger._get_collection().find_one({'transaction': transaction.pk})['applied'])
+
+        self.assertEqual(ledger.complete_postings(), 1)
+        self.assertEqual(ledger.complete_postings(), 0)
+
+        self.assertEqual(self.balance(), (2.5, 3))
+
+    def test_verify_answers_409_for_a_verified_transaction(self):
+        transaction = self.create_transaction(self.inventory)
+
+        first = verify_transaction(user='user', slug=transaction.pk, lookup_field='id')
+        second = verify_transaction(user='user', slug=transaction.pk, lookup_field='id')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 409)
+        self.assertEqual(json.loads(second.content)['message'], 'transaction is already verified')
+        self.assertEqual(self.balance(), (2.5, 3))
+
+
+class BackfillTests(MongoTestCase):
+    """Transactions verified before the ledger existed are posted once by the backfill."""
+
+    def setUp(self):
+        super().setUp()
+        self.inventory = self.create_inventory(quantity=Quantity(weight=40.0, number=4))
+        for transaction in (self.create_transaction(self.inventory),
+                            self.create_transaction(self.inventory, weight=1.0, number=1, is_import=False)):
+            Transaction._get_collection().update_one({'_id': transaction.pk}, {'$set': {
+                'is_verified': CheckStatus(status=True, user_date=DateUser(user='user')).to_mongo(),
+            }})
+        self.create_transaction(self.inventory, weight=9.0, number=9)
+
+    def stock(self):
+        row = Inventory._get_collection().find_one({'_id': self.inventory.pk})
+        return (row['balance']['weight'], row['balance']['number']), (row['quantity']['weight'], row['quantity']['number'])
+
+    def test_verified_transactions_are_posted_once(self):
+        self.assertEqual(ledger.backfill_postings(dry_run=True), 2)
+        self.assertEqual(InventoryLedger._get_collection().count_documents({}), 0)
+
+        self.assertEqual(ledger.backfill_postings(batch_size=1), 2)
+        self.assertEqual(ledger.backfill_postings(), 0)
+
+        self.assertEqual(self.stock(), ((1.5, 2), (1.5, 2)))
+        self.assertEqual(InventoryLedger._get_collection().count_documents({'applied': True}), 2)
+
+    def test_fix_is_refused_until_the_backfill_ran(self):
+        with self.assertRaises(CommandError):
+            call_command('rebuild_inventory_balances', '--fix', stdout=mock.Mock())
+        self.assertEqual(self.stock(), ((0.0, 0), (40.0, 4)))
+
+        call_command('rebuild_inventory_balances', '--fix', '--backfill', stdout=mock.Mock())
+        self.assertEqual(self.stock(), ((1.5, 2), (1.5, 2)))
+
+    def test_fix_resyncs_quantity_with_the_ledger(self):
+        ledger.backfill_postings()
+        Inventory._get_collection().update_one({'_id': self.inventory.pk}, {'$set': {'quantity.weight': 7.0}})
+
+        call_command('rebuild_inventory_balances', '--fix', stdout=mock.Mock())
+
+        self.assertEqual(self.stock(), ((1.5, 2), (1.5, 2)))
+
+
+class PostedDataTests(MongoTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.inventory = self.create_inventory()
+        self.transaction = self.create_transaction(self.inventory)
+
+    def test_unverified_transaction_can_change(self):
+        self.transaction.quantity = Quantity(weight=1.0)
+        self.transaction.save()
+
+    def test_verified_transaction_cannot_change(self):
+        ledger.post_transaction(self.transaction, 'user')
+        transaction = Transaction.objects.get(id=self.transaction.pk)
+
+        transaction.quantity = Quantity(weight=1.0)
+        with self.assertRaises(ValidationError):
+            transaction.save()
+        transaction = Transaction.objects.get(id=self.transaction.pk)
+        transaction.is_verified = CheckStatus(status=False)
+        with self.assertRaises(ValidationError):
+            transaction.save()
+
+    def test_inventory_with_postings_keeps_its_warehouse_and_product(self):
+        other = self.create_inventory(warehouse_id='WareHouse-2', product_id=13)
+        ledger.post_transaction(self.transaction, 'user')
+        inventory = Inventory.objects.get(id=self.inventory.pk)
+
+        inventory.warehouse = other.warehouse
+        with self.assertRaises(ValidationError):
+            inventory.save()
+        inventory = Inventory.objects.get(id=self.inventory.pk)
+        inventory.product = other.product
+        with self.assertRaises(ValidationError):
+            inventory.save()
+
+        inventory = Inventory.objects.get(id=self.inventory.pk)
+        inventory.warehouse = Warehouse.objects.get(id='WareHouse-1')
+        inventory.shelf_life = ShelfLife(expire_date='2030-01-01')
+        inventory.save()
+
+    def test_inventory_without_postings_can_move(self):
+        other = self.create_inventory(warehouse_id='WareHouse-2')
+        self.inventory.warehouse = other.warehouse
+        self.inventory.save()
+
+    @mock.patch('utils.CustomAPIView.delete_api_view.post_bulk_delete')
+    def test_verified_transaction_is_not_deleted(self, _):
+        verified = self.create_transaction(self.inventory)
+        ledger.post_transaction(verified, 'user')
+
+        deleted, refused = TransactionAPIView().delete_many([verified.pk, self.transaction.pk])
+
+        self.assertEqual((deleted, refused), ({self.transaction.pk}, {verified.pk}))
+        self.assertEqual([transaction.pk for transaction in Transaction.objects()], [verified.pk])
+
+
+@override_settings(
+    WAREHOUSE_LEDGER={'SNAPSHOT_SETTLE_SECONDS': 0, 'SNAPSHOT_INTERVAL_HOURS': 24},
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class BalanceSnapshotTests(MongoTestCase):
+
+    start = datetime.datetime(2026, 1, 1)
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        for hours, warehouse, product, weight in [
+            (1, 'WareHouse-1', '12', 10.0), (2, 'WareHouse-2', '13', 1.0), (3, 'WareHouse-1', '12', 5.0),
+            (3.75, 'WareHouse-1', '12', 4.0), (5.75, 'WareHouse-1', '12', -2.0),
+        ]:
+            InventoryLedger._get_collection().insert_one({
+                'inventory': 'Inventory-1', 'transaction': f'Transaction-{hours}', 'warehouse': warehouse,
+                'product': product, 'weight': weight, 'number': 0, 'applied': True,
+                'created_at': self.at(hours),
+            })
+
+    def at(self, hours):
+        return self.start + datetime.timedelta(hours=hours)
+
+    def balances(self, hours, **filters):
+        result = balances_as_of(self.at(hours), **filters)
+        return result['snapshot_at'], {(row['warehouse'], row['product']): row['weight'] for row in result['balances']}
+
+    def test_ledger_is_summed_without_snapshots(self):
+        self.assertEqual(self.balances(3), (None, {('WareHouse-1', '12'): 15.0, ('WareHouse-2', '13'): 1.0}))
+
+    def test_deltas_after_the_nearest_snapshot_are_added(self):
+        take_snapshot(self.at(4))
+
+        self.assertEqual(self.balances(6), (self.at(4), {('WareHouse-1', '12'): 17.0, ('WareHouse-2', '13'): 1.0}))
+
+    def test_deltas_before_the_nearest_snapshot_are_subtracted(self):
+        take_snapshot(self.at(4))
+        take_snapshot(self.at(6))
+
+        self.assertEqual(self.balances(3.5), (self.at(4), {('WareHouse-1', '12'): 15.0, ('WareHouse-2', '13'): 1.0}))
+        self.assertEqual(self.balances(5.5), (self.at(6), {('WareHouse-1', '12'): 19.0, ('WareHouse-2', '13'): 1.0}))
+
+    def test_points_before_the_ledger_history_are_refused(self):
+        take_snapshot(self.at(4))
+
+        with self.assertRaises(HistoryUnavailable):
+            self.balances(0.5)
+        self.assertEqual(self.balances(1), (self.at(4), {('WareHouse-1', '12'): 10.0}))
+
+    def test_history_starts_at_the_last_backfill(self):
+        InventoryLedger._get_collection().insert_one({
+            'inventory': 'Inventory-2', 'transaction': 'Transaction-legacy', 'warehouse': 'WareHouse-2',
+            'product': '13', 'weight': 7.0, 'number': 0, 'applied': True, 'backfilled': True,
+            'created_at': self.at(2.5),
+        })
+
+        with self.assertRaises(HistoryUnavailable) as raised:
+            self.balances(2)
+        self.assertEqual(raised.exception.history_start, self.at(2.5))
+        self.assertEqual(self.balances(3)[1][('WareHouse-2', '13')], 8.0)
+
+    def test_filters_match_integer_and_string_ids(self):
+        take_snapshot(self.at(4))
+
+        self.assertEqual(self.balances(5, products=[12]), (self.at(4), {('WareHouse-1', '12'): 19.0}))
+        self.assertEqual(self.balances(5, warehouses=['WareHouse-2']), (self.at(4), {('WareHouse-2', '13'): 1.0}))
+
+    def test_snapshot_is_written_once_per_interval(self):
+        self.assertEqual(take_snapshot(self.at(4), force=False).rows, 2)
+        self.assertIsNone(take_snapshot(self.at(5), force=False))
+
+    def test_overlapping_run_is_refused(self):
+        cache.add(SNAPSHOT_LOCK_KEY, 'other worker')
+
+        with self.assertRaises(SnapshotRunning):
+            take_snapshot(self.at(4))
+        self.assertEqual(cache.get(SNAPSHOT_LOCK_KEY), 'other worker')
+
+
+@override_settings(TIME_ZONE='Asia/Tehran')
+class ParseExpireDateTests(SimpleTestCase):
+
+    def test_naive_values_are_read_in_the_project_time_zone(self):
+        expected = datetime.datetime(2026, 3, 1, 8, 30)
+        for value in ('2026-03-01 12:00', '2026-03-01T12:00:00', '2026/03/01 12:00', '2026/03/01 12:00:00'):
+            with self.subTest(value=value):
+                self.assertEqual(parse_expire_date(value), expected)
+
+    def test_dates_expire_at_the_start_of_the_day(self):
+        expected = datetime.datetime(2026, 2, 28, 20, 30)
+        for value in ('2026-03-01', '2026/03/01', '01/03/2026', '01-03-2026', '01.03.2026', ' 2026-03-01 '):
+            with self.subTest(value=value):
+                self.assertEqual(parse_expire_date(value), expected)
+
+    def test_offsets_are_converted_to_utc(self):
+        self.assertEqual(parse_expire_date('2026-03-01T12:00:00+02:00'), datetime.datetime(2026, 3, 1, 10))
+        self.assertEqual(parse_expire_date('2026-03-01T12:00:00Z'), datetime.datetime(2026, 3, 1, 12))
+
+    def test_empty_and_unreadable_values(self):
+        for value in (None, '', '   ', 'next week', '2026-13-01', '31/02/2026'):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_expire_date(value))
+
+
+class ExpiryQueryTests(MongoTestCase):
+
+    now = datetime.datetime(2026, 1, 1)
+
+    def setUp(self):
+        super().setUp()
+        self.inventories = {}
+        for name, warehouse, product, expires_in, weight in [
+            ('expired', 'WareHouse-1', 12, -1, 1.0),
+            ('soon', 'WareHouse-1', 12, 10, 1.0),
+            ('later', 'WareHouse-2', 12, 100, 1.0),
+            ('empty', 'WareHouse-1', 12, 5, 0.0),
+            ('inactive', 'WareHouse-3', 12, 1, 1.0),
+            ('other_product', 'WareHouse-1', 13, 2, 1.0),
+        ]:
+            inventory = self.create_inventory(warehouse_id=warehouse, product_id=product)
+            Inventory._get_collection().update_one({'_id': inventory.pk}, {'$set': {
+                'shelf_life.expires_at': self.now + datetime.timedelta(hours=expires_in),
+                'balance.weight': weight,
+                'balance.updated_at': self.now,
+            }})
+            self.inventories[inventory.pk] = name
+        self.create_inventory()  # not perishable
+        Warehouse.objects(id='WareHouse-3').update(set__is_active=False)
+
+    def names(self, query_set):
+        return [self.inventories.get(inventory.pk) for inventory in query_set]
+
+    def test_fefo_picks_in_stock_inventories_of_active_warehouses_first_expiring_first(self):
+        self.assertEqual(self.names(fefo_inventories(12, 10, now=self.now)), ['soon', 'later'])
+        self.assertEqual(self.names(fefo_inventories('12', 1, now=self.now)), ['soon'])
+        self.assertEqual(self.names(fefo_inventories(12, 10, include_expired=True, now=self.now)),
+                         ['expired', 'soon', 'later'])
+
+    def test_expiring_returns_the_window_soonest_first(self):
+        self.assertEqual(self.names(expiring_inventories(48, 10, now=self.now)), ['inactive', 'other_product', 'soon'])
+        self.assertEqual(self.names(expiring_inventories(48, 10, product=12, now=self.now)), ['inactive', 'soon'])
+        self.assertEqual(self.names(expiring_inventories(200, 10, warehouses=['WareHouse-2'], now=self.now)), ['later'])
+
+    def test_non_integer_product_is_rejected(self):
+        with self.assertRaises(ValueError):
+            fefo_inventories('abc', 10, now=self.now)
+
+    def test_inventories_without_ledger_entries_use_their_quantity(self):
+        for name, updated_at in (('legacy', None), ('stale_quantity', self.now)):
+            inventory = self.create_inventory(quantity=Quantity(weight=5.0))
+            Inventory._get_collection().update_one({'_id': inventory.pk}, {'$set': {
+                'shelf_life.expires_at': self.now + datetime.timedelta(hours=3),
+                'balance.updated_at': updated_at,
+            }})
+            self.inventories[inventory.pk] = name
+
+        self.assertEqual(self.names(fefo_inventories(12, 10, now=self.now)), ['legacy', 'soon', 'later'])
+
+
+class ShelfLifeTests(MongoTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.inventory = self.create_inventory()
+        Inventory._get_collection().update_one({'_id': self.inventory.pk}, {'$set': {'shelf_life.expire_date': 'next spring'}})
+
+    def test_stored_unreadable_expire_date_does_not_block_saves(self):
+        inventory = Inventory.objects.get(id=self.inventory.pk)
+        inventory.shelf_life.is_perishable = False
+        inventory.save()
+
+        self.assertIsNone(Inventory.objects.get(id=self.inventory.pk).shelf_life.expires_at)
+
+    def test_unreadable_expire_date_is_refused_when_written(self):
+        inventory = Inventory.objects.get(id=self.inventory.pk)
+        inventory.shelf_life.expire_date = 'next summer'
+        with self.assertRaises(ValidationError):
+            inventory.save()
+
+        inventory = Inventory.objects.get(id=self.inventory.pk)
+        inventory.shelf_life = ShelfLife(expire_date='next summer')
+        with self.assertRaises(ValidationError):
+            inventory.save()
+
+        inventory.shelf_life = ShelfLife(expire_date='2030-01-01')
+        inventory.save()
+        self.assertIsNotNone(Inventory.objects.get(id=self.inventory.pk).shelf_life.expires_at)
@@ -58,10 +58,16 @@ CACHES["default"]["LOCATION"] = REDIS_URL
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", CELERY_BROKER_URL)
 CELERY_TASK_SERIALIZER = os.getenv("CELERY_TASK_SERIALIZER", CELERY_TASK_SERIALIZER)
 CELERY_ACCEPT_CONTENT = ["json"]
+CELERY_BEAT_SCHEDULE["complete-inventory-postings"]["schedule"] = float(os.getenv(
+    "WAREHOUSE_COMPLETE_POSTINGS_SECONDS", CELERY_BEAT_SCHEDULE["complete-inventory-postings"]["schedule"]))
+CELERY_BEAT_SCHEDULE["snapshot-inventory-balances"]["schedule"] = float(os.getenv(
+    "WAREHOUSE_SNAPSHOT_CHECK_SECONDS", CELERY_BEAT_SCHEDULE["snapshot-inventory-balances"]["schedule"]))
 
 LOG_SERVER_ENDPOINT = os.getenv("LOG_SERVER_ENDPOINT", LOG_SERVER.get("endpoint_url"))
 if LOG_SERVER_ENDPOINT:
-    LOG_SERVER = {"endpoint_url": LOG_SERVER_ENDPOINT}
+    LOG_SERVER = {**LOG_SERVER, "endpoint_url": LOG_SERVER_ENDPOINT}
+LOG_SERVER["bulk_endpoint_url"] = os.getenv("LOG_SERVER_BULK_ENDPOINT", LOG_SERVER.get("bulk_endpoint_url"))
+LOG_SERVER["query_endpoint_url"] = os.getenv("LOG_SERVER_QUERY_ENDPOINT", LOG_SERVER.get("query_endpoint_url"))
 STORE_LOGS = env_bool("STORE_LOGS", STORE_LOGS)
 
 HEALTHCHECK_URL = os.getenv("HEALTHCHECK_URL", "/health/")
@@ -1,7 +1,6 @@
 import inspect
-import json
+import time
 from typing import Dict, Tuple, Optional, List, Any
-from django.core.cache import cache
 from django.http import JsonResponse
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
@@ -9,8 +8,20 @@ from rest_framework.request import Request
 from rest_framework.viewsets import ViewSet
 from django.conf import settings
 
-from utils.celery_utils import store_logs_in_background
-from utils.microservice.auth import load_slaughter_erp_token
+from utils.CustomAPIView.filter_schema import MONGO_FILTER_OPERATORS, get_filter_schema
+from utils.CustomAPIView.pagination import (
+    InvalidCursor,
+    build_seek_query,
+    decode_cursor,
+    encode_cursor,
+    get_sort_value,
+    parse_limit,
+    resolve_sort_key,
+)
+from utils.CustomSerializer.field_selection import FieldSelection, FieldSelectionError
+from utils.log_shipper import log_shipper
+from utils.request_timing import finish_request_timer, start_request_timer, timed_stage
+from utils.result_cache import result_cache
 
 
 class BaseMongoAPIView(GenericAPIView, ViewSet):
@@ -33,33 +44,10 @@ class BaseMongoAPIView(GenericAPIView, ViewSet):
     }
 
     # Supported MongoDB filter operations for each field type
-    MONGO_FILTER_OPERATORS: Dict[str, List[str]] = {
-        'IntField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'mod', 'exists'],
-        'LongField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
-        'FloatField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
-        'DecimalField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
-        'BooleanField': ['exact', 'ne', 'exists'],
-        'StringField': [
-            'exact', 'iexact', 'contains', 'icontains', 'startswith', 'istartswith',
-            'endswith', 'iendswith', 'ne', 'in', 'nin', 'exists', 'regex', 'iregex'
-        ],
-        'EmailField': ['exact', 'iexact', 'contains', 'icontains', 'ne', 'in', 'nin', 'exists'],
-        'URLField': ['exact', 'contains', 'icontains', 'ne', 'in', 'nin', 'exists'],
-        'DateTimeField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
-        'DateField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
-        'TimeField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'exists'],
-        'UUIDField': ['exact', 'ne', 'in', 'nin', 'exists'],
-        'ObjectIdField': ['exact', 'ne', 'in', 'nin', 'exists'],
-        'ReferenceField': ['exact', 'ne', 'in', 'nin', 'exists'],
-        'ListField': ['all', 'size', 'in', 'nin', 'exists'],
-        'EmbeddedDocumentField': ['exact', 'exists'],
-        'DictField': ['exact', 'exists'],
-        'GeoPointField': ['geo_within_box', 'geo_within_polygon', 'geo_within_center', 'near', 'near_sphere', 'exists'],
-        'FileField': ['exists'],
-        'ImageField': ['exists'],
-        'BinaryField': ['exists'],
-        'SequenceField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
-    }
+    MONGO_FILTER_OPERATORS: Dict[str, List[str]] = MONGO_FILTER_OPERATORS
+
+    # Query parameters that shape the response and are never treated as filters
+    RESERVED_QUERY_PARAMS: Tuple[str, ...] = ('limit', 'cursor', 'estimated_total', 'stream', 'fields', 'q', 'hydrate')
 
     def __init__(self, *args, **kwargs) -> None:
         """Initialize the view with default attributes."""
@@ -67,6 +55,38 @@ class BaseMongoAPIView(GenericAPIView, ViewSet):
         self.model = None  # MongoEngine document class
         self.lookup_field: str = 'id'  # Field used for object retrieval
         self.serializer_class = None  # Dictionary of method-based serializers
+        self.next_cursor: Optional[str] = None  # Cursor of the next page after a paginated query
+        self.estimated_total: Optional[int] = None  # Total reported by the search backend, if any
+        self.search_info: Optional[Dict[str, Any]] = None  # Hit count and timing of the last Elasticsearch search
+        self.result_cache_enabled: bool = True  # Set to False in a view to opt out of the result cache
+        self.bulk_patch_ordered: bool = False  # Set to True to stop a bulk PATCH at the first failed write
+        self.delete_protected_query: Optional[Dict[str, Any]] = None  # Raw query of documents DELETE refuses (409)
+        self.request_timer_token = None  # Context token of the per-stage request timer, if enabled
+
+    def initial(self, request: Request, *args, **kwargs) -> None:
+        """
+        Stamp the request start time, used for the duration in request logs, and start
+        the per-stage request timer when REQUEST_TIMING is enabled.
+        """
+        request.started_at = time.monotonic()
+        self.request_timer_token = start_request_timer(self.__class__.__name__)
+        super().initial(request, *args, **kwargs)
+
+    def perform_authentication(self, request: Request) -> None:
+        """Authenticate the request (JWT verification), timed as the 'auth' stage."""
+        with timed_stage('auth'):
+            super().perform_authentication(request)
+
+    def check_permissions(self, request: Request) -> None:
+        """Check the ViewsRoles permissions, timed as the 'permissions' stage."""
+        with timed_stage('permissions'):
+            super().check_permissions(request)
+
+    def finalize_response(self, request: Request, response: Any, *args, **kwargs) -> Any:
+        """Record the request's stage timings and add the Server-Timing header if allowed."""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        finish_request_timer(self.request_timer_token, request, response)
+        return response
 
     def get_query(self, query: Dict[str, Any]) -> JsonResponse:
         """
@@ -82,7 +102,8 @@ class BaseMongoAPIView(GenericAPIView, ViewSet):
         if not query_status:
             return JsonResponse(data=query_set, status=status.HTTP_400_BAD_REQUEST)
         try:
-            return query_set.filter(**query).first()
+            with timed_stage('query'):
+                return query_set.filter(**query).first()
         except Exception as e:
             return JsonResponse(
                 data={'error': f'Query failed: {str(e)}'},
@@ -93,85 +114,263 @@ class BaseMongoAPIView(GenericAPIView, ViewSet):
         """
         Apply query parameters as filters and return the ordered queryset.
 
+        When a `limit` is given, the queryset is narrowed to the next page with keyset
+        pagination on the ordering field plus `id` and holds one extra row, which
+        `fetch_page` uses to detect whether another page exists.
+
         Returns:
             Tuple[bool, Any]: Status of the operation and the resulting queryset or error message.
         """
         queryset = self.model.objects
-        filter_status, filters_param = self.apply_filters()
+        with timed_stage('filters'):
+            filter_status, filters_param = self.apply_filters()
         ordering_field = getattr(self, 'ordering_fields', 'id')
-        cache_key = f'{self.model.__name__}:{json.dumps(filters_param, sort_keys=True)}'
+        if not filter_status:
+            return False, filters_param
+
+        query_data = queryset.filter(**filters_param).order_by(ordering_field)
+
+        selection_status, selection = self.get_field_selection()
+        if not selection_status:
+            return False, selection
+        if selection:
+            query_data = query_data.only(*self.get_projection(selection, ordering_field))
+
+        pagination_status, pagination = self.get_pagination_params()
+        if not pagination_status:
+            return False, pagination
+        if pagination:
+            try:
+                query_data = self.apply_keyset_pagination(query_data, ordering_field, pagination)
+            except InvalidCursor as e:
+                return False, {'message': str(e)}
+        return True, query_data
+
+    def get_field_selection(self) -> Tuple[bool, Any]:
+        """
+        Read the sparse fieldset requested with `?fields=a,b,c.d`.
 
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return True, cached_data
+        Returns:
+            Tuple[bool, Any]: Validation status and the FieldSelection (None when all
+            fields are requested), or an error message.
+        """
+        value = self.request.query_params.get('fields')
+        if not value:
+            return True, None
 
-        if filter_status:
-            query_data = queryset.filter(**filters_param).order_by(ordering_field)
-            cache.set(cache_key, query_data, timeout=300)  # Cache for 5 minutes
-            return True, query_data
-        return False, filters_param
+        serializer = (self.serializer_class or {}).get('GET')
+        allowed_fields = getattr(getattr(serializer, 'Meta', None), 'fields', '__all__')
+        try:
+            return True, FieldSelection.parse(value, self.model, allowed_fields)
+        except FieldSelectionError as e:
+            return False, {'message': str(e)}
 
-    def update_cache(self) -> None:
+    def get_projection(self, selection: FieldSelection, ordering_field: Optional[str] = None) -> List[str]:
         """
-        Update cache after PATCH, POST, or DELETE requests to ensure data consistency.
+        Build the `only()` projection of a selection, keeping the sort key loaded for cursors.
+
+        Args:
+            selection: The requested sparse fieldset.
+            ordering_field: The view's ordering, if the query is ordered.
+
+        Returns:
+            List[str]: Field paths for `QuerySet.only()`.
         """
-        queryset = self.model.objects
+        projection = list(selection.projection)
+        if ordering_field:
+            try:
+                fields, _, _ = resolve_sort_key(self.model, ordering_field)
+                projection.append('.'.join(field.name for field in fields))
+            except InvalidCursor:
+                pass
+        return projection
+
+    def get_pagination_params(self) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Read the opt-in pagination parameters `limit` and `cursor` from the request.
+
+        Returns:
+            Tuple[bool, Dict[str, Any]]: Validation status and the page size and decoded
+            cursor (empty when pagination was not requested), or an error message.
+        """
+        query_params = self.request.query_params
+        if 'limit' not in query_params:
+            if 'cursor' in query_params:
+                return False, {'message': 'cursor requires the limit parameter'}
+            return True, {}
+
+        try:
+            limit = parse_limit(query_params.get('limit'), getattr(settings, 'PAGINATION_MAX_LIMIT', 1000))
+            cursor = query_params.get('cursor')
+            return True, {'limit': limit, 'cursor': decode_cursor(cursor) if cursor else None}
+        except InvalidCursor as e:
+            return False, {'message': str(e)}
+
+    def apply_keyset_pagination(self, queryset: Any, ordering_field: str, pagination: Dict[str, Any]) -> Any:
+        """
+        Narrow a queryset to the page after the cursor position.
+
+        Args:
+            queryset: The filtered queryset.
+            ordering_field: The view's ordering, e.g. '-created_at__date'.
+            pagination: Page size and decoded cursor from `get_pagination_params`.
+
+        Returns:
+            QuerySet: The page, ordered by the sort key and `id`, with one extra row.
+
+        Raises:
+            InvalidCursor: If the cursor was issued for another query.
+        """
+        fields, db_path, descending = resolve_sort_key(self.model, ordering_field)
+        id_ordering = '-id' if descending else 'id'
+        ordering = (id_ordering,) if db_path == '_id' else (ordering_field, id_ordering)
+
+        cursor = pagination.get('cursor')
+        if cursor:
+            if cursor.get('type') != 'keyset' or cursor.get('ordering') != ordering_field:
+                raise InvalidCursor('Cursor does not belong to this query')
+            queryset = queryset.filter(__raw__=build_seek_query(db_path, descending, cursor.get('value'), cursor.get('id')))
+
+        return queryset.order_by(*ordering).limit(pagination['limit'] + 1)
+
+    def fetch_page(self, queryset: Any, pagination: Dict[str, Any]) -> List[Any]:
+        """
+        Evaluate a keyset-paginated queryset and set `next_cursor`.
+
+        Args:
+            queryset: Queryset returned by `get_queryset_with_filters` with pagination.
+            pagination: Page size and decoded cursor from `get_pagination_params`.
+
+        Returns:
+            List[Any]: The documents of the current page.
+        """
+        limit = pagination['limit']
+        with timed_stage('query'):
+            documents = list(queryset)
+        self.next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            ordering_field = getattr(self, 'ordering_fields', 'id')
+            fields, _, _ = resolve_sort_key(self.model, ordering_field)
+            last = documents[-1]
+            self.next_cursor = encode_cursor({
+                'type': 'keyset',
+                'ordering': ordering_field,
+                'value': get_sort_value(last, fields),
+                'id': last.pk,
+            })
+        return documents
+
+    def estimate_total(self) -> int:
+        """
+        Cheaply estimate the number of documents matching the current filters.
+
+        Unfiltered collections use the collection metadata count; filtered counts stop at
+        `PAGINATION_COUNT_LIMIT`, so the value is exact only below that bound.
+
+        Returns:
+            int: The estimated total.
+        """
+        if self.estimated_total is not None:
+            return self.estimated_total
+
         filter_status, filters_param = self.apply_filters()
-        cache_key = f'{self.model.__name__}:{json.dumps(filters_param, sort_keys=True)}'
-        ordering_field = getattr(self, 'ordering_fields', 'id')
+        if filter_status and not filters_param:
+            return self.model._get_collection().estimated_document_count()
 
-        if filter_status:
-            query_data = queryset.filter(**filters_param).order_by(ordering_field)
-            cache.set(cache_key, query_data, timeout=300)  # Cache for 5 minutes
+        count_limit = getattr(settings, 'PAGINATION_COUNT_LIMIT', 10000)
+        return self.model.objects.filter(**filters_param).limit(count_limit).count(with_limit_and_skip=True)
+
+    def update_cache(self) -> None:
+        """
+        Invalidate the cached responses of the view's model after PATCH, POST, or DELETE requests.
+
+        Bumps the model's result cache generation, which drops every cached filter and
+        page of the model at once.
+        """
+        result_cache.invalidate(self.model)
+
+    def get_cached_response(self, kind: str, **params: Any) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a cached GET response for the current request.
+
+        Args:
+            kind: Which handler the response belongs to, e.g. 'bulk_get'.
+            params: Extra values the response depends on, such as the lookup value.
+
+        Returns:
+            Tuple[Optional[Any], Optional[str]]: The cached response (None on a miss) and
+            the key for `store_cached_response` (None when caching is disabled for the view).
+        """
+        if not getattr(self, 'result_cache_enabled', True):
+            return None, None
+
+        return result_cache.get(self.model, {
+            'view': self.__class__.__name__,
+            'kind': kind,
+            'ordering': getattr(self, 'ordering_fields', 'id'),
+            'query': sorted(self.request.query_params.lists()),
+            **params,
+        })
+
+    @staticmethod
+    def store_cached_response(key: Optional[str], response_data: Any) -> None:
+        """
+        Store a serialized GET response under a key from `get_cached_response`.
+
+        Args:
+            key: The cache key, or None to skip caching.
+            response_data: The serialized response.
+        """
+        result_cache.set(key, response_data)
 
     def apply_filters(self) -> Tuple[bool, Dict[str, Any]]:
         """
-        Validate and extract filter query parameters from the request.
+        Validate filter query parameters against the model's precompiled filter schema
+        and coerce their values to the field types.
 
         Returns:
-            Tuple[bool, Dict[str, Any]]: Status of filter validation and the filter parameters or error message.
+            Tuple[bool, Dict[str, Any]]: Status of filter validation and the typed filter parameters or error message.
         """
-        fields = {
-            name: {'type': field.__class__.__name__, '__class__': field}
-            for name, field in self.model._fields.items()
+        schema = get_filter_schema(self.model)
+        query_params = {
+            key: value for key, value in self.request.query_params.items()
+            if key not in self.RESERVED_QUERY_PARAMS
         }
-        allowed_filters = self._generate_filters_param(fields)
-        query_params = self.request.query_params
 
-        invalid_filters = [query for query in query_params if query not in allowed_filters]
+        invalid_filters = [query for query in query_params if query not in schema]
         if invalid_filters:
             return False, {
                 'message': 'Invalid filter parameters received.',
-                'allowed_filter_parameters': allowed_filters,
+                'allowed_filter_parameters': schema.params,
                 'invalid_filters': invalid_filters
             }
-        return True, {key: value for key, value in query_params.items()}
 
-    def _generate_filters_param(self, fields: Dict[str, Any], base_name: str = '') -> List[str]:
+        filters, errors = schema.parse(query_params)
+        if errors:
+            return False, {
+                'message': 'Invalid filter values received.',
+                'invalid_values': errors
+            }
+        return True, filters
+
+    def filters_metadata(self, request: Request) -> JsonResponse:
         """
-        Generate valid filter query parameters for MongoDB fields, including nested fields.
+        Describe the filters accepted by the view's bulk GET route.
 
         Args:
-            fields: Dictionary of field names and their metadata.
-            base_name: Prefix for nested field names.
+            request: The HTTP request object.
 
         Returns:
-            List[str]: List of valid filter parameters.
-        """
-        filters_param = []
-        for name, value in fields.items():
-            if name != 'id':
-                for filter_type in self.MONGO_FILTER_OPERATORS.get(value['type'], []):
-                    filters_param.append(f'{base_name}{name}__{filter_type}')
-            if value['type'] in ['EmbeddedDocumentField', 'ReferenceField']:
-                field_document = getattr(value['__class__'], 'document_type', None)
-                if field_document:
-                    nested_fields = {
-                        field_name: {'type': field.__class__.__name__, '__class__': field}
-                        for field_name, field in field_document._fields.items()
-                    }
-                    filters_param.extend(self._generate_filters_param(nested_fields, f'{base_name}{name}__'))
-        return filters_param
+            JsonResponse: The model name, every allowed filter with its type and operator,
+            and the reserved query parameters.
+        """
+        response_data = {
+            'model': self.model._class_name,
+            'filters': get_filter_schema(self.model).describe(),
+            'reserved_query_parameters': list(self.RESERVED_QUERY_PARAMS),
+        }
+        return JsonResponse(data=response_data, status=status.HTTP_200_OK)
 
     def validate_data(self, data: Any, serializer: Any, many: bool = False) -> Tuple[bool, Dict]:
         """
@@ -250,7 +449,12 @@ class BaseMongoAPIView(GenericAPIView, ViewSet):
     @staticmethod
     def store_logs(request: Request, response: JsonResponse, response_status_code: int = 200) -> None:
         """
-        Store API request and response logs in a background task if enabled in settings.
+        Queue the API request and response log for the batched log shipper if enabled in settings.
+
+        The record is only appended to an in-process buffer; serialization and delivery to
+        the Logs service happen in the shipper's background flusher. The record carries the
+        request duration, the URL route template and the service name, from which the Logs
+        service keeps per-endpoint latency aggregates.
 
         Args:
             request: The incoming HTTP request.
@@ -261,52 +465,151 @@ class BaseMongoAPIView(GenericAPIView, ViewSet):
             return
 
         try:
-            jwt_data = getattr(request, 'user_payload', {'user': 'unknown'})
-            log_server_information = settings.LOG_SERVER
-
-            log_data = {
-                'status_code': response_status_code,
-                'response': json.dumps(response),
-                'token_payload': json.dumps(jwt_data),
-                'url': request.build_absolute_uri(),
-                'request_body': json.dumps(request.data),
-                'method': request.method,
-                'request_header': json.dumps(dict(request.headers)),
-                'request_session': json.dumps(dict(request.session)),
-            }
-            token = load_slaughter_erp_token()
-            store_logs_in_background.delay(
-                logs_data=log_data,
-                log_server_information=log_server_information,
-                token=token
-            )
+            with timed_stage('store_logs'):
+                started_at = getattr(request, 'started_at', None)
+                resolver_match = getattr(request, 'resolver_match', None)
+                log_shipper.submit({
+                    'status_code': response_status_code,
+                    'response': response,
+                    'token_payload': getattr(request, 'user_payload', {'user': 'unknown'}),
+                    'url': request.build_absolute_uri(),
+                    'request_body': request.data,
+                    'method': request.method,
+                    'request_header': dict(request.headers),
+                    'request_session': dict(request.session),
+                    'duration_ms': round((time.monotonic() - started_at) * 1000, 3) if started_at else None,
+                    'route': getattr(resolver_match, 'route', None),
+                    'service': getattr(settings, 'SERVICE_NAME', None),
+                })
         except Exception as e:
             # Log error silently to avoid disrupting the main flow
             print(f"Failed to store logs: {str(e)}")
 
-    def search_elasticsearch(self, query: str) -> Any:
+    def search_elasticsearch(self, query: str, hydrate: bool = False) -> List[Any]:
         """
-        Search Elasticsearch index using the provided query string.
+        Search the Elasticsearch index with the provided query string.
+
+        Results are kept in relevance order. With `limit` (and the `cursor` of a previous
+        page) they are paged with `search_after` on a point in time and `next_cursor` is
+        set; without it, the first `ELASTICSEARCH_SEARCH_LIMIT` hits are returned by a
+        plain search, with no point in time and no `next_cursor`. `estimated_total` and
+        `search_info` (hit count and timing) are set on the view.
 
         Args:
             query: Query string from URL parameters.
+            hydrate: Whether to load the full documents from MongoDB instead of answering
+                from the indexed `_source`.
 
         Returns:
-            QuerySet: Filtered MongoDB queryset based on Elasticsearch results.
+            List[Any]: The MongoDB documents of the page when hydrating, otherwise the
+            `_source` of each hit with its `id`.
+
+        Raises:
+            InvalidCursor: If `limit` or `cursor` is invalid.
         """
         es = settings.ELASTICSEARCH_CONNECTION
+        search_query = {
+            'multi_match': {
+                'query': query,
+                'fields': getattr(self, 'elasticsearch_fields', [])
+            }
+        }
+        pagination_status, pagination = self.get_pagination_params()
+        if not pagination_status:
+            raise InvalidCursor(pagination['message'])
         try:
-            response = es.search(
-                index=getattr(self, 'elasticsearch_index_name', 'main'),
-                query={
-                    'multi_match': {
-                        'query': query,
-                        'fields': getattr(self, 'elasticsearch_fields', [])
-                    }
-                }
-            )
-            return self.model.objects(id__in=[res['_id'] for res in response['hits']['hits']])
+            return self._search_elasticsearch_page(es, search_query, pagination, hydrate)
+        except InvalidCursor:
+            raise
         except Exception as e:
-            # Return empty queryset to avoid breaking the flow
+            # Return no results to avoid breaking the flow
             print(f"Elasticsearch query failed: {str(e)}")
-            return self.model.objects.none()
\ No newline at end of file
+            self.search_info = {'total': 0, 'relation': 'eq', 'took_ms': None, 'hydrated': hydrate, 'failed': True}
+            return []
+
+    def _project(self, queryset: Any) -> Any:
+        """
+        Apply the requested sparse fieldset, if any, to a queryset.
+
+        Args:
+            queryset: The queryset to narrow.
+
+        Returns:
+            QuerySet: The queryset limited to the selected fields.
+        """
+        selection_status, selection = self.get_field_selection()
+        if selection_status and selection:
+            return queryset.only(*self.get_projection(selection))
+        return queryset
+
+    def _search_elasticsearch_page(self, es: Any, search_query: Dict[str, Any], pagination: Dict[str, Any],
+                                   hydrate: bool = False) -> List[Any]:
+        """
+        Fetch one page of Elasticsearch results, with `search_after` on a point in time when paginated.
+
+        Args:
+            es: The Elasticsearch connection.
+            search_query: The query clause.
+            pagination: Page size and decoded cursor from `get_pagination_params`, empty
+                when the client did not paginate.
+            hydrate: Whether to load the full documents from MongoDB.
+
+        Returns:
+            List[Any]: The MongoDB documents or the `_source` rows of the page, in relevance order.
+        """
+        started = time.monotonic()
+        limit = pagination.get('limit') or getattr(settings, 'ELASTICSEARCH_SEARCH_LIMIT', 100)
+        cursor = pagination.get('cursor') or {}
+        if cursor and cursor.get('type') != 'search_after':
+            raise InvalidCursor('Cursor does not belong to this query')
+
+        index_name = getattr(self, 'elasticsearch_index_name', 'main')
+        search_params = {'query': search_query, 'size': limit}
+        pit_id = None
+        if pagination:
+            # A point in time keeps the following pages consistent with this one
+            keep_alive = getattr(settings, 'ELASTICSEARCH_PIT_KEEP_ALIVE', '1m')
+            pit_id = cursor.get('pit') or es.open_point_in_time(index=index_name, keep_alive=keep_alive)['id']
+            search_params.update({
+                'size': limit + 1,
+                'pit': {'id': pit_id, 'keep_alive': keep_alive},
+                'sort': [{'_score': 'desc'}, {'_shard_doc': 'asc'}],
+            })
+        else:
+            search_params['index'] = index_name
+        if hydrate:
+            search_params['source'] = False
+        else:
+            selection_status, selection = self.get_field_selection()
+            if selection_status and selection:
+                search_params['source'] = {'includes': [name for name in selection.tree if name != 'id']}
+        if cursor.get('after'):
+            search_params['search_after'] = cursor['after']
+        response = es.search(**search_params)
+
+        hits = response['hits']['hits']
+        self.estimated_total = response['hits']['total']['value']
+        self.next_cursor = None
+        if pit_id:
+            pit_id = response.get('pit_id', pit_id)
+            if len(hits) > limit:
+                hits = hits[:limit]
+                self.next_cursor = encode_cursor({'type': 'search_after', 'pit': pit_id, 'after': hits[-1]['sort']})
+            else:
+                es.close_point_in_time(id=pit_id)
+
+        if hydrate:
+            ids = [hit['_id'] for hit in hits]
+            documents = {str(document.pk): document for document in self._project(self.model.objects(id__in=ids))}
+            results = [documents[document_id] for document_id in ids if document_id in documents]
+        else:
+            results = [{'id': hit['_id'], **hit.get('_source', {})} for hit in hits]
+
+        self.search_info = {
+            'total': response['hits']['total']['value'],
+            'relation': response['hits']['total'].get('relation', 'eq'),
+            'took_ms': response.get('took'),
+            'elapsed_ms': round((time.monotonic() - started) * 1000, 1),
+            'hydrated': hydrate,
+        }
+        return results
@@ -0,0 +1,300 @@
+import importlib
+import importlib.util
+import json
+import threading
+import uuid
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from django.apps import apps
+from mongoengine import Document
+from mongoengine.base.common import _document_registry
+
+
+# Supported MongoDB filter operations for each field type
+MONGO_FILTER_OPERATORS: Dict[str, List[str]] = {
+    'IntField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'mod', 'exists'],
+    'LongField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
+    'FloatField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
+    'DecimalField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
+    'BooleanField': ['exact', 'ne', 'exists'],
+    'StringField': [
+        'exact', 'iexact', 'contains', 'icontains', 'startswith', 'istartswith',
+        'endswith', 'iendswith', 'ne', 'in', 'nin', 'exists', 'regex', 'iregex'
+    ],
+    'EmailField': ['exact', 'iexact', 'contains', 'icontains', 'ne', 'in', 'nin', 'exists'],
+    'URLField': ['exact', 'contains', 'icontains', 'ne', 'in', 'nin', 'exists'],
+    'DateTimeField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
+    'DateField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
+    'TimeField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'exists'],
+    'UUIDField': ['exact', 'ne', 'in', 'nin', 'exists'],
+    'ObjectIdField': ['exact', 'ne', 'in', 'nin', 'exists'],
+    'ReferenceField': ['exact', 'ne', 'in', 'nin', 'exists'],
+    'ListField': ['all', 'size', 'in', 'nin', 'exists'],
+    'EmbeddedDocumentField': ['exact', 'exists'],
+    'DictField': ['exact', 'exists'],
+    'GeoPointField': ['geo_within_box', 'geo_within_polygon', 'geo_within_center', 'near', 'near_sphere', 'exists'],
+    'FileField': ['exists'],
+    'ImageField': ['exists'],
+    'BinaryField': ['exists'],
+    'SequenceField': ['exact', 'lt', 'lte', 'gt', 'gte', 'ne', 'in', 'nin', 'exists'],
+}
+
+# Operators whose value is a comma separated list of items
+LIST_OPERATORS = ('in', 'nin', 'all')
+
+# Operators whose value is matched as text regardless of the field type
+TEXT_OPERATORS = ('iexact', 'contains', 'icontains', 'startswith', 'istartswith', 'endswith', 'iendswith',
+                  'regex', 'iregex')
+
+
+class InvalidFilterValue(ValueError):
+    """Raised when a filter value cannot be coerced into the field's type."""
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse 'true'/'false' style query values."""
+    lowered = value.strip().lower()
+    if lowered in ('1', 'true', 'yes'):
+        return True
+    if lowered in ('0', 'false', 'no'):
+        return False
+    raise ValueError(value)
+
+
+def _parse_decimal(value: str) -> Decimal:
+    """Parse a decimal query value."""
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValueError(value)
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 datetime, accepting a trailing 'Z'."""
+    return datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+
+
+def _parse_object_id(value: str) -> ObjectId:
+    """Parse a MongoDB ObjectId."""
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise ValueError(value)
+
+
+def _parse_json_object(value: str) -> Dict[str, Any]:
+    """Parse a JSON object used to match embedded documents and dicts."""
+    parsed = json.loads(value)
+    if not isinstance(parsed, dict):
+        raise ValueError(value)
+    return parsed
+
+
+def _parse_coordinates(value: str) -> List[float]:
+    """Parse comma separated coordinates."""
+    return [float(item) for item in value.split(',')]
+
+
+# Value parser for each field type; types not listed are matched as strings
+VALUE_PARSERS: Dict[str, Callable[[str], Any]] = {
+    'IntField': int,
+    'LongField': int,
+    'SequenceField': int,
+    'FloatField': float,
+    'DecimalField': _parse_decimal,
+    'BooleanField': _parse_bool,
+    'DateTimeField': _parse_datetime,
+    'DateField': date.fromisoformat,
+    'ObjectIdField': _parse_object_id,
+    'UUIDField': uuid.UUID,
+    'EmbeddedDocumentField': _parse_json_object,
+    'DictField': _parse_json_object,
+    'GeoPointField': _parse_coordinates,
+}
+
+
+class FilterSpec:
+    """A single allowed `field__operator` query parameter and how to parse its value."""
+
+    def __init__(self, param: str, field_type: str, operator: str, parser: Callable[[str], Any]) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            param: The query parameter, e.g. 'final_price__gte'.
+            field_type: MongoEngine field class name.
+            operator: The MongoEngine query operator.
+            parser: Coerces one raw value into the field's type.
+        """
+        self.param = param
+        self.field_type = field_type
+        self.operator = operator
+        self.parser = parser
+
+    def parse(self, value: str) -> Any:
+        """
+        Coerce a raw query value for this filter.
+
+        Args:
+            value: The raw query string value.
+
+        Returns:
+            Any: The typed value passed to MongoEngine.
+
+        Raises:
+            InvalidFilterValue: If the value does not match the field type.
+        """
+        try:
+            if self.operator == 'exists':
+                return _parse_bool(value)
+            if self.operator == 'size':
+                return int(value)
+            if self.operator == 'mod':
+                divisor, remainder = (int(item) for item in value.split(','))
+                return [divisor, remainder]
+            if self.operator in TEXT_OPERATORS:
+                return value
+            if self.operator in LIST_OPERATORS:
+                return [self.parser(item.strip()) for item in value.split(',') if item.strip()]
+            return self.parser(value)
+        except (TypeError, ValueError) as e:
+            raise InvalidFilterValue(f'Invalid value for <{self.param}>: {value!r} ({self.field_type} expected)') from e
+
+    def describe(self) -> Dict[str, Any]:
+        """Describe the filter for the filters metadata route."""
+        return {
+            'param': self.param,
+            'type': self.field_type,
+            'operator': self.operator,
+            'many': self.operator in LIST_OPERATORS,
+        }
+
+
+class FilterSchema:
+    """
+    Precompiled set of allowed filters for a document class.
+
+    Built once per model; request handling only does dict lookups and value coercion.
+    """
+
+    def __init__(self, model: Type[Document], operators: Optional[Dict[str, List[str]]] = None) -> None:
+        """
+        Compile the filters of a model.
+
+        Args:
+            model: The MongoEngine document class.
+            operators: Allowed operators per field type.
+        """
+        self.model = model
+        self.operators = operators or MONGO_FILTER_OPERATORS
+        self.filters: Dict[str, FilterSpec] = {}
+        self._compile(model, '', set())
+        self.params = list(self.filters)
+
+    def _compile(self, document: Any, prefix: str, seen: set) -> None:
+        """
+        Add the filters of a document's fields, recursing into embedded documents.
+
+        Args:
+            document: The document class whose fields are compiled.
+            prefix: Query prefix of the enclosing fields.
+            seen: Embedded classes on the current path, to stop recursive structures.
+        """
+        for name, field in document._fields.items():
+            field_type = field.__class__.__name__
+            parser = self._value_parser(field)
+            for operator in self.operators.get(field_type, []):
+                param = f'{prefix}{name}__{operator}'
+                self.filters[param] = FilterSpec(param, field_type, operator, parser)
+
+            # References are stored as ids, so only embedded documents can be filtered by subfield
+            if field_type == 'EmbeddedDocumentField':
+                embedded = field.document_type
+                if embedded not in seen:
+                    self._compile(embedded, f'{prefix}{name}__', seen | {embedded})
+
+    @staticmethod
+    def _value_parser(field: Any) -> Callable[[str], Any]:
+        """
+        Return the parser for a single value of a field.
+
+        Args:
+            field: The MongoEngine field.
+
+        Returns:
+            Callable[[str], Any]: The value parser.
+        """
+        field_type = field.__class__.__name__
+        if field_type == 'ListField' and getattr(field, 'field', None) is not None:
+            return FilterSchema._value_parser(field.field)
+        if field_type == 'ReferenceField':
+            return FilterSchema._value_parser(field.document_type._fields[field.document_type._meta['id_field']])
+        return VALUE_PARSERS.get(field_type, str)
+
+    def __contains__(self, param: str) -> bool:
+        """Check whether a query parameter is an allowed filter."""
+        return param in self.filters
+
+    def parse(self, query_params: Dict[str, str]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Coerce the values of allowed query parameters.
+
+        Args:
+            query_params: Filter query parameters, all known to the schema.
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, str]]: The typed filters and the errors per parameter.
+        """
+        filters, errors = {}, {}
+        for param, value in query_params.items():
+            try:
+                filters[param] = self.filters[param].parse(value)
+            except InvalidFilterValue as e:
+                errors[param] = str(e)
+        return filters, errors
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """Describe every allowed filter for the filters metadata route."""
+        return [spec.describe() for spec in self.filters.values()]
+
+
+_schemas: Dict[Type[Document], FilterSchema] = {}
+_schemas_lock = threading.Lock()
+
+
+def get_filter_schema(model: Type[Document]) -> FilterSchema:
+    """
+    Return the compiled filter schema of a model, compiling it on first use.
+
+    Args:
+        model: The MongoEngine document class.
+
+    Returns:
+        FilterSchema: The compiled schema.
+    """
+    schema = _schemas.get(model)
+    if schema is None:
+        with _schemas_lock:
+            schema = _schemas.get(model)
+            if schema is None:
+                schema = _schemas[model] = FilterSchema(model)
+    return schema
+
+
+def compile_filter_schemas() -> None:
+    """
+    Import the `documents` module of every installed app and compile the filter schema of
+    every document class, so no request pays for it. Called from the core app's `ready`.
+    """
+    for app_config in apps.get_app_configs():
+        module_name = f'{app_config.name}.documents'
+        if importlib.util.find_spec(module_name) is not None:
+            importlib.import_module(module_name)
+
+    for document in list(_document_registry.values()):
+        if getattr(document, '_is_document', False) and not document._meta.get('abstract'):
+            get_filter_schema(document)
@@ -1,20 +1,13 @@
-import time
-
-import requests
 from celery import shared_task
 
 
 @shared_task
-def store_logs_in_background(logs_data: dict, log_server_information: dict, token:str):
+def drain_elasticsearch_outbox():
 
     """
-    send logs_data to logging server
-
-    Args:
-        logs_data: logs data
-        log_server_information: logs server information
-        token: authentication token
+    send the queued elasticsearch_api writes of the outbox in bulk requests
     """
 
-    _ = requests.post(url=log_server_information['endpoint_url'], json=logs_data,
-                        headers={'Authorization': f'Bearer {token}'})
+    from utils.elasticsearch_outbox import outbox
+
+    outbox.drain()
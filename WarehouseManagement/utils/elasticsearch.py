@@ -1,4 +1,14 @@
+from typing import Dict, Optional
+
 from django.conf import settings
+from django.core.cache import cache
+
+
+# Mapping properties of every index created by the apps, used to build new index versions on reindex
+INDEX_MAPPINGS: Dict[str, dict] = {}
+
+# Cache key holding the index version that a running reindex fills, so live writes reach it too
+REINDEX_TARGET_KEY = 'es_reindex:{index}:target'
 
 
 def index_document(index_name: str, properties: dict):
@@ -10,6 +20,7 @@ def index_document(index_name: str, properties: dict):
          properties: documents fields in elasticsearch_api
 
     """
+    INDEX_MAPPINGS[index_name] = properties
     es = settings.ELASTICSEARCH_CONNECTION
 
     if not es.indices.exists(index=index_name):
@@ -18,3 +29,19 @@ def index_document(index_name: str, properties: dict):
                 "properties": properties
             }
         })
+
+
+def get_reindex_target(index_name: str) -> Optional[str]:
+    """
+    Return the new index version being filled by a running `es_reindex` of an index
+
+    Args:
+         index_name: index name (alias) in elasticsearch_api
+
+    Returns:
+        Optional[str]: the new index version, or None when no reindex is running
+    """
+    try:
+        return cache.get(REINDEX_TARGET_KEY.format(index=index_name))
+    except Exception:
+        return None
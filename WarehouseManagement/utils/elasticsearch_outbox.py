@@ -0,0 +1,353 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from elasticsearch import helpers
+from mongoengine import Document, signals
+from prometheus_client import Counter, Gauge
+from redis.exceptions import RedisError
+
+from utils.elasticsearch import get_reindex_target
+from utils.signals import post_bulk_delete, post_bulk_update
+
+
+OUTBOX_DEPTH = Gauge(
+    'elasticsearch_outbox_depth',
+    'Documents waiting in the Elasticsearch indexing outbox.',
+)
+OUTBOX_LAG = Gauge(
+    'elasticsearch_outbox_lag_seconds',
+    'Age of the oldest document waiting in the Elasticsearch indexing outbox.',
+)
+OUTBOX_OPERATIONS = Counter(
+    'elasticsearch_outbox_operations_total',
+    'Outbox operations sent to Elasticsearch, by operation and result.',
+    ['op', 'result'],
+)
+
+# Serializer class, index name and document builder of an indexed document class
+Indexer = Tuple[Any, str, Callable[[dict], dict]]
+
+
+class ElasticsearchOutbox:
+    """
+    Redis-backed outbox that takes Elasticsearch indexing off the request thread.
+
+    Writes only record `(model, id, op)` entries: a hash holds the latest operation of each
+    document, so repeated saves of the same document coalesce into one entry, and a sorted
+    set orders the entries by the time they were first queued. A drainer (a background
+    thread or a Celery task) takes the oldest entries in batches, serializes the current
+    state of the documents and sends one `_bulk` request per batch.
+    """
+
+    OPS_KEY = 'es_outbox:ops'
+    QUEUE_KEY = 'es_outbox:queue'
+    SCHEDULED_KEY = 'es_outbox:scheduled'
+
+    def __init__(self, batch_size: int = 500, poll_interval: float = 1.0, drainer: str = 'thread') -> None:
+        """
+        Initialize an empty outbox.
+
+        Args:
+            batch_size: Maximum number of documents per `_bulk` request.
+            poll_interval: Seconds between drains when the outbox is idle.
+            drainer: 'thread' to drain in a background thread of every process, 'celery' to
+                schedule the `drain_elasticsearch_outbox` task, or 'none' to drain externally.
+        """
+        self.batch_size = max(1, batch_size)
+        self.poll_interval = poll_interval
+        self.drainer = drainer
+        self._indexers: Dict[str, Tuple[Type[Document], Indexer]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup = threading.Event()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def register(self, indexers: Dict[Type[Document], Indexer]) -> None:
+        """
+        Register the indexed document classes of an app.
+
+        Args:
+            indexers: Serializer, index name and document builder per document class.
+        """
+        for model, indexer in indexers.items():
+            self._indexers[model._class_name] = (model, indexer)
+
+    def get_indexer(self, index_name: str) -> Optional[Tuple[Type[Document], Indexer]]:
+        """
+        Return the document class and indexer registered for an index.
+
+        Args:
+            index_name: The index name.
+
+        Returns:
+            Optional[Tuple[Type[Document], Indexer]]: The document class and its indexer, or None.
+        """
+        for model, indexer in self._indexers.values():
+            if indexer[1] == index_name:
+                return model, indexer
+        return None
+
+    def is_indexed(self, model: Any) -> bool:
+        """Check whether a document class is registered for indexing."""
+        return isinstance(model, type) and getattr(model, '_class_name', None) in self._indexers
+
+    def enqueue(self, model: Type[Document], document_ids: Iterable[Any], op: str) -> None:
+        """
+        Queue documents for indexing or deletion.
+
+        Falls back to writing them to Elasticsearch inline if Redis is unavailable.
+
+        Args:
+            model: The document class.
+            document_ids: Ids of the written documents.
+            op: 'index' or 'delete'.
+        """
+        if not self.is_indexed(model) or getattr(settings, 'ELASTICSEARCH_CONNECTION', None) is None:
+            return
+        entries = {f'{model._class_name}:{document_id}': op for document_id in document_ids}
+        if not entries:
+            return
+
+        try:
+            connection = get_redis_connection('default')
+            now = time.time()
+            pipeline = connection.pipeline(transaction=True)
+            pipeline.hset(self.OPS_KEY, mapping=entries)
+            pipeline.zadd(self.QUEUE_KEY, {member: now for member in entries}, nx=True)
+            pipeline.execute()
+        except (RedisError, NotImplementedError):
+            self._send(entries)
+            return
+
+        self._notify_drainer()
+
+    def drain(self, max_batches: Optional[int] = None) -> int:
+        """
+        Send queued entries to Elasticsearch, oldest first, until the outbox is empty.
+
+        Entries are claimed atomically, so several drainers can run at once. Entries whose
+        `_bulk` item fails are queued again with their original timestamp.
+
+        Args:
+            max_batches: Stop after this many batches.
+
+        Returns:
+            int: Number of entries sent successfully.
+        """
+        connection = get_redis_connection('default')
+        sent, batches = 0, 0
+        while max_batches is None or batches < max_batches:
+            queued = connection.zrange(self.QUEUE_KEY, 0, self.batch_size - 1, withscores=True)
+            if not queued:
+                break
+            members = [member for member, _ in queued]
+
+            pipeline = connection.pipeline(transaction=True)
+            pipeline.hmget(self.OPS_KEY, members)
+            pipeline.hdel(self.OPS_KEY, *members)
+            pipeline.zrem(self.QUEUE_KEY, *members)
+            ops = pipeline.execute()[0]
+
+            # Entries claimed by a concurrent drainer have no operation left
+            entries = {member.decode(): op.decode() for member, op in zip(members, ops) if op is not None}
+            scores = {member.decode(): score for member, score in queued}
+
+            failed = self._send(entries)
+            if failed:
+                self._requeue(connection, {member: entries[member] for member in failed}, scores)
+            sent += len(entries) - len(failed)
+            batches += 1
+
+        self.refresh_metrics(connection)
+        return sent
+
+    def _send(self, entries: Dict[str, str]) -> List[str]:
+        """
+        Serialize the current state of the queued documents and send one `_bulk` request.
+
+        Args:
+            entries: Operation per outbox member ('<model>:<id>').
+
+        Returns:
+            List[str]: Members whose operation failed.
+        """
+        es = getattr(settings, 'ELASTICSEARCH_CONNECTION', None)
+        if es is None or not entries:
+            return list(entries)
+
+        actions, members = [], {}
+        grouped: Dict[str, Dict[str, List[str]]] = {}
+        for member, op in entries.items():
+            model_name, document_id = member.split(':', 1)
+            grouped.setdefault(model_name, {}).setdefault(op, []).append(document_id)
+
+        for model_name, operations in grouped.items():
+            if model_name not in self._indexers:
+                continue
+            model, (serializer_class, index_name, build_document) = self._indexers[model_name]
+
+            index_ids = operations.get('index', [])
+            delete_ids = list(operations.get('delete', []))
+            if index_ids:
+                documents = list(model.objects(id__in=index_ids))
+                # Documents deleted since they were queued are removed from the index instead
+                found = {str(document.pk) for document in documents}
+                delete_ids.extend(document_id for document_id in index_ids if document_id not in found)
+                rows = serializer_class(documents, many=True).data if documents else []
+                for row in rows:
+                    actions.append({'_op_type': 'index', '_index': index_name, '_id': str(row['id']),
+                                    '_source': build_document(row)})
+                    members[(index_name, str(row['id']))] = f'{model_name}:{row["id"]}'
+            for document_id in delete_ids:
+                actions.append({'_op_type': 'delete', '_index': index_name, '_id': document_id})
+                members[(index_name, document_id)] = f'{model_name}:{document_id}'
+
+            # Mirror the writes into the index version a running reindex is filling
+            target = get_reindex_target(index_name)
+            if target:
+                mirrored = [dict(action, _index=target) for action in actions if action['_index'] == index_name]
+                actions.extend(mirrored)
+                for action in mirrored:
+                    members[(target, action['_id'])] = members[(index_name, action['_id'])]
+
+        if not actions:
+            return []
+
+        try:
+            _, errors = helpers.bulk(es, actions, raise_on_error=False)
+        except Exception:
+            OUTBOX_OPERATIONS.labels('bulk', 'error').inc(len(actions))
+            return list(entries)
+
+        failed, counts = [], {}
+        for action in actions:
+            counts[action['_op_type']] = counts.get(action['_op_type'], 0) + 1
+        for error in errors:
+            op, item = next(iter(error.items()))
+            if op == 'delete' and item.get('status') == 404:
+                # The document was never indexed (or is already gone): the delete is done
+                continue
+            counts[op] = counts.get(op, 0) - 1
+            OUTBOX_OPERATIONS.labels(op, 'error').inc()
+            member = members.get((item.get('_index'), str(item.get('_id'))))
+            if member:
+                failed.append(member)
+        for op, count in counts.items():
+            OUTBOX_OPERATIONS.labels(op, 'ok').inc(max(0, count))
+        return failed
+
+    def _requeue(self, connection: Any, entries: Dict[str, str], scores: Dict[str, float]) -> None:
+        """
+        Queue failed entries again, unless the document was queued anew meanwhile.
+
+        Args:
+            connection: The Redis connection.
+            entries: Operation per failed member.
+            scores: Original queue time per member.
+        """
+        try:
+            pipeline = connection.pipeline(transaction=True)
+            for member, op in entries.items():
+                pipeline.hsetnx(self.OPS_KEY, member, op)
+            pipeline.zadd(self.QUEUE_KEY, {member: scores[member] for member in entries}, nx=True)
+            pipeline.execute()
+        except RedisError:
+            pass
+
+    def refresh_metrics(self, connection: Any = None) -> None:
+        """
+        Update the outbox depth and lag gauges.
+
+        Args:
+            connection: The Redis connection, if already open.
+        """
+        try:
+            connection = connection or get_redis_connection('default')
+            depth = connection.zcard(self.QUEUE_KEY)
+            oldest = connection.zrange(self.QUEUE_KEY, 0, 0, withscores=True)
+        except (RedisError, NotImplementedError):
+            return
+        OUTBOX_DEPTH.set(depth)
+        OUTBOX_LAG.set(max(0.0, time.time() - oldest[0][1]) if oldest else 0.0)
+
+    def _notify_drainer(self) -> None:
+        """Wake the background drainer, or schedule the Celery drain task at most once per interval."""
+        if self.drainer == 'thread':
+            self._ensure_thread()
+            self._wakeup.set()
+        elif self.drainer == 'celery':
+            try:
+                connection = get_redis_connection('default')
+                interval_ms = max(1, int(self.poll_interval * 1000))
+                if connection.set(self.SCHEDULED_KEY, 1, nx=True, px=interval_ms):
+                    from utils.celery_utils import drain_elasticsearch_outbox
+                    drain_elasticsearch_outbox.apply_async(countdown=self.poll_interval)
+            except (RedisError, NotImplementedError):
+                pass
+
+    def _ensure_thread(self) -> None:
+        """Start the background drainer of this process if it is not running."""
+        if os.getpid() != self._pid:
+            # Threads do not survive a fork; the worker starts its own drainer
+            self._thread, self._pid = None, os.getpid()
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='elasticsearch-outbox-drainer', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Drain the outbox whenever entries are queued, and at least once per poll interval."""
+        while True:
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            try:
+                self.drain()
+            except Exception:
+                # Elasticsearch or Redis is down; entries stay queued for the next round
+                time.sleep(self.poll_interval)
+
+
+_config = getattr(settings, 'ELASTICSEARCH_OUTBOX', {})
+outbox = ElasticsearchOutbox(
+    batch_size=_config.get('BATCH_SIZE', 500),
+    poll_interval=_config.get('POLL_INTERVAL', 1.0),
+    drainer=_config.get('DRAINER', 'thread'),
+)
+
+
+def register_indexers(indexers: Dict[Type[Document], Indexer]) -> None:
+    """
+    Register the indexed document classes of an app with the outbox.
+
+    Args:
+        indexers: Serializer, index name and document builder per document class.
+    """
+    outbox.register(indexers)
+
+
+@signals.post_save.connect
+def enqueue_document_on_save(sender, document, **kwargs):
+    outbox.enqueue(sender, [document.pk], 'index')
+
+
+@signals.post_delete.connect
+def enqueue_document_on_delete(sender, document, **kwargs):
+    outbox.enqueue(sender, [document.pk], 'delete')
+
+
+@signals.post_bulk_insert.connect
+@post_bulk_update.connect
+def enqueue_documents_on_bulk_write(sender, documents, **kwargs):
+    outbox.enqueue(sender, [document.pk for document in documents], 'index')
+
+
+@post_bulk_delete.connect
+def enqueue_documents_on_bulk_delete(sender, document_ids, **kwargs):
+    outbox.enqueue(sender, document_ids, 'delete')
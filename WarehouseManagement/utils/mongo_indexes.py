@@ -0,0 +1,43 @@
+from typing import Iterator, Type
+
+import pymongo
+from mongoengine import Document
+from mongoengine.base.common import _document_registry
+
+
+def iter_documents() -> Iterator[Type[Document]]:
+    """
+    Yield every concrete (non-abstract, non-embedded) document class that was imported.
+
+    Yields:
+        Type[Document]: The document classes.
+    """
+    for document in list(_document_registry.values()):
+        if getattr(document, '_is_document', False) and not document._meta.get('abstract'):
+            yield document
+
+
+def ensure_mongo_indexes(timeout: float = 5.0) -> None:
+    """
+    Create the indexes declared in `meta['indexes']` of every document.
+
+    Index creation is idempotent, so this runs at every startup. A failure on one collection
+    (e.g. an existing index with the same keys under another name) is reported and does not
+    stop the others. Every collection gets at most `timeout` seconds, and the first connection
+    failure ends the run, so an unreachable server delays startup once instead of once per
+    document. Called from the core app's `ready` after the documents are imported.
+
+    Args:
+        timeout: Seconds allowed for server selection and index creation per collection.
+    """
+    for document in iter_documents():
+        if not document._meta.get('index_specs'):
+            continue
+        try:
+            with pymongo.timeout(timeout):
+                document.ensure_indexes()
+        except pymongo.errors.ConnectionFailure as e:
+            print(f"Skipping index creation, MongoDB is unreachable: {str(e)}")
+            return
+        except Exception as e:
+            print(f"Failed to ensure indexes of <{document._get_collection_name()}>: {str(e)}")
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional, Set, Tuple, Type, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from mongoengine import Document, signals
+from mongoengine.base import get_document
+from mongoengine.base.common import _document_registry
+from prometheus_client import Counter
+
+from utils.signals import post_bulk_delete, post_bulk_update
+
+
+RESULT_CACHE_REQUESTS = Counter(
+    'api_result_cache_requests_total',
+    'Serialized result cache lookups in CustomAPIView, by model and result.',
+    ['model', 'result'],
+)
+
+
+class ResultCache:
+    """
+    Cache of serialized GET responses, versioned per model.
+
+    Every entry key embeds the model's current generation number. A write bumps the
+    generation with a single Redis INCR, so all cached pages of that model (and of the
+    models that reference it) become unreachable at once and simply expire.
+    """
+
+    GENERATION_KEY = 'result_cache:{model}:generation'
+    ENTRY_KEY = 'result_cache:{model}:{generation}:{digest}'
+
+    def __init__(self, timeout: int = 300, enabled: bool = True) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            timeout: Seconds a cached response is kept.
+            enabled: Whether responses are cached at all.
+        """
+        self.timeout = timeout
+        self.enabled = enabled
+        self._dependents: Optional[Dict[str, Set[str]]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _model_name(model: Union[str, Type[Document]]) -> str:
+        """Return the registry name of a document class."""
+        return model if isinstance(model, str) else model._class_name
+
+    def _generation(self, model_name: str) -> int:
+        """
+        Read the current generation of a model.
+
+        Args:
+            model_name: The document class name.
+
+        Returns:
+            int: The generation (0 if the model was never written).
+        """
+        return int(cache.get(self.GENERATION_KEY.format(model=model_name)) or 0)
+
+    def get(self, model: Union[str, Type[Document]], params: Dict[str, Any]) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a cached response.
+
+        Args:
+            model: The document class of the view.
+            params: Everything the response depends on (view, filters, ordering, page, ...).
+
+        Returns:
+            Tuple[Optional[Any], Optional[str]]: The cached response (None on a miss) and
+            the key to store a fresh response under (None if caching is unavailable).
+        """
+        model_name = self._model_name(model)
+        if not self.enabled:
+            return None, None
+
+        try:
+            digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+            key = self.ENTRY_KEY.format(model=model_name, generation=self._generation(model_name), digest=digest)
+            value = cache.get(key)
+        except Exception:
+            # The cache backend is unavailable; serve the request from MongoDB
+            RESULT_CACHE_REQUESTS.labels(model_name, 'error').inc()
+            return None, None
+
+        RESULT_CACHE_REQUESTS.labels(model_name, 'miss' if value is None else 'hit').inc()
+        return value, key
+
+    def set(self, key: Optional[str], value: Any) -> None:
+        """
+        Store a serialized response under a key returned by `get`.
+
+        Args:
+            key: The entry key, or None to skip.
+            value: The serialized response.
+        """
+        if not key:
+            return
+        try:
+            cache.set(key, value, timeout=self.timeout)
+        except Exception:
+            pass
+
+    def invalidate(self, model: Union[str, Type[Document]]) -> None:
+        """
+        Invalidate every cached response of a model and of the models referencing it.
+
+        Args:
+            model: The written document class.
+        """
+        model_name = self._model_name(model)
+        for name in {model_name, *self._get_dependents().get(model_name, set())}:
+            key = self.GENERATION_KEY.format(model=name)
+            try:
+                try:
+                    cache.incr(key)
+                except ValueError:
+                    # First write of this model; add() keeps a concurrent first increment
+                    if not cache.add(key, 1, timeout=None):
+                        cache.incr(key)
+            except Exception:
+                pass
+
+    def _get_dependents(self) -> Dict[str, Set[str]]:
+        """
+        Map every document class to the classes whose serialized form embeds it by reference.
+
+        Returns:
+            Dict[str, Set[str]]: Referencing class names per referenced class name.
+        """
+        if self._dependents is not None:
+            return self._dependents
+
+        with self._lock:
+            if self._dependents is None:
+                dependents: Dict[str, Set[str]] = {}
+                for name in list(_document_registry):
+                    document = get_document(name)
+                    if getattr(document, '_is_document', False):
+                        for referenced in self._referenced_models(document, set()):
+                            dependents.setdefault(referenced, set()).add(name)
+                self._dependents = dependents
+        return self._dependents
+
+    def _referenced_models(self, document: Any, seen: Set[str]) -> Set[str]:
+        """
+        Collect the document classes referenced by a class, through embedded documents and lists.
+
+        Args:
+            document: The document class to inspect.
+            seen: Embedded classes already visited.
+
+        Returns:
+            Set[str]: Referenced class names.
+        """
+        referenced = set()
+        for field in document._fields.values():
+            while field.__class__.__name__ == 'ListField' and getattr(field, 'field', None) is not None:
+                field = field.field
+            name = field.__class__.__name__
+            if name == 'ReferenceField':
+                referenced.add(field.document_type._class_name)
+            elif name == 'EmbeddedDocumentField':
+                embedded = field.document_type
+                if embedded._class_name not in seen:
+                    seen.add(embedded._class_name)
+                    referenced |= self._referenced_models(embedded, seen)
+        return referenced
+
+
+result_cache = ResultCache(
+    timeout=getattr(settings, 'RESULT_CACHE_TIMEOUT', 300),
+    enabled=getattr(settings, 'RESULT_CACHE_ENABLED', True),
+)
+
+
+@signals.post_save.connect
+@signals.post_delete.connect
+@signals.post_bulk_insert.connect
+@post_bulk_update.connect
+@post_bulk_delete.connect
+def invalidate_result_cache_on_write(sender, **kwargs) -> None:
+    """Invalidate the cached responses of a model whenever one of its documents is written."""
+    if isinstance(sender, type) and getattr(sender, '_is_document', False):
+        result_cache.invalidate(sender)
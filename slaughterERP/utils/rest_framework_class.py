@@ -1,8 +1,36 @@
+import time
+
 from rest_framework.views import APIView
 
+from utils.request_timing import finish_request_timer, record_stage, start_request_timer, timed_stage
+
 
 class BaseAPIView(APIView):
 
+    request_timer_token = None
+
     def dispatch(self, request, *args, **kwargs):
         # print('check request before ...')
-        return super().dispatch(request, *args, **kwargs)
\ No newline at end of file
+        return super().dispatch(request, *args, **kwargs)
+
+    def initial(self, request, *args, **kwargs):
+        # per-stage timing (REQUEST_TIMING), the view handler runs after initial()
+        self.request_timer_token = start_request_timer(self.__class__.__name__)
+        super().initial(request, *args, **kwargs)
+        self.handler_started_at = time.perf_counter()
+
+    def perform_authentication(self, request):
+        with timed_stage('auth'):
+            super().perform_authentication(request)
+
+    def check_permissions(self, request):
+        with timed_stage('permissions'):
+            super().check_permissions(request)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        handler_started_at = getattr(self, 'handler_started_at', None)
+        if handler_started_at is not None:
+            record_stage('handler', time.perf_counter() - handler_started_at)
+        response = super().finalize_response(request, response, *args, **kwargs)
+        finish_request_timer(self.request_timer_token, request, response)
+        return response